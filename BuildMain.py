@@ -1,11 +1,11 @@
 from TaskBin.CreateScripts.CreateDB import create_table
 from TaskBin.CreateScripts.CreateUserpool import setup_cognito
-from TaskBin.CreateScripts.CreateLambdas import create_all_lambdas
+from TaskBin.CreateScripts.CreateLambdas import create_all_lambdas, create_stream_trigger
 from TaskBin.CreateScripts.CreateWebsocket import setup_websocket_api
 from TaskBin.CreateScripts.CreateAPI import APIOrchestrator
 from TaskBin.CreateScripts.DeployAmplify import deploy_frontend
+from TaskBin.StageRunner import Stage, run_stages
 import boto3
-import time
 import os
 import uuid
 from datetime import datetime, UTC
@@ -59,6 +59,8 @@ def create_dummy_board():
         "user_id": dummy_user_id,
         "role": "owner",
         "joined_at": now,
+        "GSI1PK": f"BOARD#{board_id}",
+        "GSI1SK": f"USER#{dummy_user_id}",
     }
 
     table.put_item(Item=metadata)
@@ -66,89 +68,73 @@ def create_dummy_board():
 
     print("✔ Dummy board created!")
 
-def main():
-    print("=" * 30 + " Starting TaskBin AWS setup... " + "=" * 30)
-
-    # ------------------------------------------------------------
-    # 1. Initial Cognito Setup (temp localhost redirect)
-    # ------------------------------------------------------------
-    print("=" * 30 + " Setting up Cognito (Initial) " + "=" * 30)
-    temp_frontend = "http://localhost:5173"
-    user_pool_id, client_id, domain_prefix = setup_cognito()
-
-    # ------------------------------------------------------------
-    # 2. Create DynamoDB Table
-    # ------------------------------------------------------------
-    print("=" * 30 + " Creating DynamoDB table..." + "=" * 30)
-    create_table()
-
-
-    # ------------------------------------------------------------
-    # 3. Create Lambdas
-    # ------------------------------------------------------------
-    print("=" * 30 + " Creating Lambdas " + "=" * 30)
-    create_all_lambdas()
-
-    # ------------------------------------------------------------
-    # 4. Create API Gateway HTTP API (needed before Amplify)
-    # ------------------------------------------------------------
-    print("=" * 30 + " Creating HTTP API " + "=" * 30)
+def _create_http_api(results):
     api_orchestrator = APIOrchestrator()
-    api_id = api_orchestrator.get_or_create_api()
+    api_orchestrator.get_or_create_api()
     api_orchestrator.create_all_routes()
     api_orchestrator.deploy_api()
-    api_base_url = api_orchestrator.get_api_base_url()
+    return api_orchestrator.get_api_base_url()
 
-    # ------------------------------------------------------------
-    # 5. Create Websocket API
-    # ------------------------------------------------------------
-    print("=" * 30 + " Creating Websocket API " + "=" * 30)
-    setup_websocket_api()
-
-    # ------------------------------------------------------------
-    # 6. First Frontend Deploy (just to get URL)
-    # ------------------------------------------------------------
-    print("=" * 30 + " Deploying Frontend (initial) " + "=" * 30)
-    frontend_url = deploy_frontend()
-    print("Amplify frontend URL:", frontend_url)
 
-    # ------------------------------------------------------------
-    # 7. Construct final Hosted UI Login URL
-    # ------------------------------------------------------------
-    region = "us-west-1"
-    hosted_ui_url = (
+def _hosted_ui_url(results, region="us-west-1"):
+    _, client_id, domain_prefix = results["cognito"]
+    return (
         f"https://{domain_prefix}.auth.{region}.amazoncognito.com/login"
         f"?client_id={client_id}"
         f"&response_type=token"
         f"&scope=email+openid"
-        f"&redirect_uri={frontend_url}"
+        f"&redirect_uri={results['frontend_initial']}"
     )
 
-    # ------------------------------------------------------------
-    # 8. Update Cognito redirect URIs to real frontend
-    # ------------------------------------------------------------
-    update_cognito_redirects(user_pool_id, client_id, frontend_url)
 
-    print("⏳ Waiting for Amplify to finish initial deployment...")
-    time.sleep(10)
+def _update_redirects(results):
+    user_pool_id, client_id, _ = results["cognito"]
+    update_cognito_redirects(user_pool_id, client_id, results["frontend_initial"])
 
-    # ------------------------------------------------------------
-    # 9. Re-deploy Frontend with correct Hosted UI login URL in .env
-    # ------------------------------------------------------------
-    print("=" * 30 + " Re-deploying Frontend (with login URL) " + "=" * 30)
-    deploy_frontend(hosted_ui_url=hosted_ui_url)
+
+def main():
+    print("=" * 30 + " Starting TaskBin AWS setup... " + "=" * 30)
 
     # ------------------------------------------------------------
-    # 2B. Insert Dummy Board
-    # ------------------------------------------------------------
-    create_dummy_board()
+    # Stages run as soon as their deps finish; independent ones overlap:
+    #   cognito | table | lambdas  ->  stream_trigger, http_api -> websocket_api
+    #   -> frontend_initial -> cognito_redirects -> frontend_final
+    # websocket_api follows http_api because both rewrite api_id.json.
+    # ------------------------------------------------------------
+    stages = [
+        # 1. Initial Cognito Setup (temp localhost redirect)
+        Stage("cognito", lambda r: setup_cognito()),
+        # 2. DynamoDB table (create_table waits for ACTIVE before TTL)
+        Stage("table", lambda r: create_table()),
+        # 3. Lambdas
+        Stage("lambdas", lambda r: create_all_lambdas()),
+        # 3b. Table stream → TaskBin_StreamBroadcast (live task updates)
+        Stage("stream_trigger", lambda r: create_stream_trigger(), deps=["table", "lambdas"]),
+        # 4. HTTP API (needed before Amplify)
+        Stage("http_api", _create_http_api, deps=["lambdas"]),
+        # 5. Websocket API
+        Stage("websocket_api", lambda r: setup_websocket_api(), deps=["http_api"]),
+        # 6. First Frontend Deploy (just to get URL); waits for the Amplify job
+        Stage("frontend_initial", lambda r: deploy_frontend(wait=True), deps=["http_api", "websocket_api"]),
+        # 7. Update Cognito redirect URIs to real frontend
+        Stage("cognito_redirects", _update_redirects, deps=["cognito", "frontend_initial"]),
+        # 8. Re-deploy Frontend with correct Hosted UI login URL
+        Stage("frontend_final", lambda r: deploy_frontend(hosted_ui_url=_hosted_ui_url(r), wait=True),
+              deps=["cognito_redirects"]),
+        # 9. Insert Dummy Board
+        Stage("dummy_board", lambda r: create_dummy_board(), deps=["table"]),
+    ]
+
+    results, report = run_stages(stages, title="TASKBIN BUILD TIMINGS")
+    if report["TOTAL"]["status"] != "ok":
+        raise SystemExit("❌ TaskBin setup failed, see stage report above")
 
     # ------------------------------------------------------------
     # FINAL DEBUG SUMMARY
     # ------------------------------------------------------------
     print("\n\n================= TASKBIN DEPLOY SUMMARY =================")
-    print(f"API Endpoint: {api_base_url}")
-    print(f"Hosted UI Login URL:\n{hosted_ui_url}")
+    print(f"API Endpoint: {results['http_api']}")
+    print(f"Hosted UI Login URL:\n{_hosted_ui_url(results)}")
     print("===========================================================\n")
 
 if __name__ == "__main__":
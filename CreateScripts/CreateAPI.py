@@ -2,6 +2,7 @@ import boto3
 import json
 import os
 from pathlib import Path
+from TaskBin.CreateScripts.route_utils import RouteIntegration
 
 # Directory of this script: TaskBin/CreateScripts/
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -9,8 +10,16 @@ SCRIPT_DIR = Path(__file__).resolve().parent
 # Parent folder: TaskBin/
 TASKBIN_DIR = SCRIPT_DIR.parent
 
-# Routes directory inside TaskBin/CreateScripts/routes
-ROUTES_DIRECT = os.path.join(os.path.dirname(__file__), "routes")
+# Route table: [{"route_key": "GET /boards", "lambda_name": "TaskBin_GetBoard"}, ...]
+ROUTES_FILE = os.path.join(os.path.dirname(__file__), "routes.json")
+
+# ETag must be exposed or the browser hides it from fetch() (conditional GETs)
+CORS_CONFIGURATION = {
+    'AllowOrigins': ['*'],
+    'AllowMethods': ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
+    'AllowHeaders': ['*'],
+    'ExposeHeaders': ['ETag']
+}
 
 
 class APIOrchestrator:
@@ -35,6 +44,7 @@ class APIOrchestrator:
             # Verify the API still exists
             try:
                 self.client.get_api(ApiId=self.api_id)
+                self.client.update_api(ApiId=self.api_id, CorsConfiguration=CORS_CONFIGURATION)
                 print(f"Using existing API: {self.api_id}")
                 return self.api_id
             except self.client.exceptions.NotFoundException:
@@ -44,51 +54,46 @@ class APIOrchestrator:
         response = self.client.create_api(
             Name=self.api_name,
             ProtocolType='HTTP',
-            CorsConfiguration={
-                'AllowOrigins': ['*'],
-                'AllowMethods': ['GET', 'POST', 'PUT', 'DELETE', 'OPTIONS'],
-                'AllowHeaders': ['*']
-            }
+            CorsConfiguration=CORS_CONFIGURATION
         )
 
         self.api_id = response['ApiId']
 
-        # Save API ID to TaskBin/api_id.json
+        # Save API ID to TaskBin/api_id.json (keep websocket_api_id so it's reused)
+        existing = {}
+        if self.api_id_file.exists():
+            with open(self.api_id_file, 'r') as f:
+                existing = json.load(f)
+        existing['api_id'] = self.api_id
         with open(self.api_id_file, 'w') as f:
-            json.dump({'api_id': self.api_id}, f, indent=2)
+            json.dump(existing, f, indent=2)
 
         print(f"Created new API: {self.api_id}")
         return self.api_id
 
     def create_all_routes(self):
-        """Create all routes by running scripts in the routes folder"""
-        routes_dir = Path(ROUTES_DIRECT)
-
-        if not routes_dir.exists():
-            print(f"Routes directory not found: {routes_dir}")
+        """Reconcile the API's routes with routes.json"""
+        if not os.path.exists(ROUTES_FILE):
+            print(f"Route table not found: {ROUTES_FILE}")
             return
 
-        # Get all Python files in routes directory
-        route_files = sorted(routes_dir.glob("*.py"))
+        with open(ROUTES_FILE, 'r') as f:
+            routes = json.load(f)
 
-        if not route_files:
-            print("No route files found in routes directory")
+        if not routes:
+            print("No routes defined in routes.json")
             return
 
-        print(f"\nCreating {len(route_files)} routes...")
+        print(f"\nReconciling {len(routes)} routes...")
 
-        # Set environment variable for route scripts to use
-        os.environ['API_ID'] = self.api_id
-
-        for route_file in route_files:
-            print(f"\nProcessing: {route_file.name}")
-            try:
-                # Execute the route script
-                with open(route_file, 'r') as f:
-                    exec(f.read(), {'__name__': '__main__'})
-                print(f"✓ Successfully created route from {route_file.name}")
-            except Exception as e:
-                print(f"✗ Error processing {route_file.name}: {str(e)}")
+        # Failures propagate so the http_api stage fails instead of reporting
+        # success with half-applied routes
+        integration = RouteIntegration(api_id=self.api_id, region=self.region)
+        summary = integration.reconcile_routes(routes)
+        print(
+            f"✓ Routes in sync: {summary['created']} created, "
+            f"{summary['updated']} updated, {summary['unchanged']} unchanged"
+        )
 
     def deploy_api(self, stage_name="prod"):
         """Deploy the API to a stage"""
@@ -1,10 +1,22 @@
 import boto3
 import time
 
+# Board task rows and tombstones by change version (GET .../tasks?since=N)
+CHANGE_INDEX = {
+    "IndexName": "GSI2",
+    "KeySchema": [
+        {"AttributeName": "GSI2PK", "KeyType": "HASH"},
+        {"AttributeName": "GSI2SK", "KeyType": "RANGE"}
+    ],
+    "Projection": {"ProjectionType": "ALL"}
+}
+
 def create_table(table_name="TaskBin", region="us-west-1", max_retries=3, retry_delay=10):
     dynamodb = boto3.client('dynamodb', region_name=region)
+    existed = False
 
     def _create():
+        nonlocal existed
         try:
             response = dynamodb.create_table(
                 TableName=table_name,
@@ -12,13 +24,16 @@ def create_table(table_name="TaskBin", region="us-west-1", max_retries=3, retry_
                     {"AttributeName": "PK", "AttributeType": "S"},
                     {"AttributeName": "SK", "AttributeType": "S"},
                     {"AttributeName": "GSI1PK", "AttributeType": "S"},
-                    {"AttributeName": "GSI1SK", "AttributeType": "S"}
+                    {"AttributeName": "GSI1SK", "AttributeType": "S"},
+                    {"AttributeName": "GSI2PK", "AttributeType": "S"},
+                    {"AttributeName": "GSI2SK", "AttributeType": "N"}
                 ],
                 KeySchema=[
                     {"AttributeName": "PK", "KeyType": "HASH"},
                     {"AttributeName": "SK", "KeyType": "RANGE"}
                 ],
                 BillingMode='PAY_PER_REQUEST',
+                StreamSpecification={"StreamEnabled": True, "StreamViewType": "NEW_AND_OLD_IMAGES"},
                 GlobalSecondaryIndexes=[
                     {
                         "IndexName": "GSI1",
@@ -27,13 +42,15 @@ def create_table(table_name="TaskBin", region="us-west-1", max_retries=3, retry_
                             {"AttributeName": "GSI1SK", "KeyType": "RANGE"}
                         ],
                         "Projection": {"ProjectionType": "ALL"}
-                    }
+                    },
+                    CHANGE_INDEX
                 ]
             )
             print(f"Table '{table_name}' creation initiated.")
             return True
         except dynamodb.exceptions.ResourceInUseException:
             print(f"Table '{table_name}' already exists.")
+            existed = True
             return True
         except Exception as e:
             print(f"Error creating table: {e}")
@@ -50,3 +67,168 @@ def create_table(table_name="TaskBin", region="us-west-1", max_retries=3, retry_
         else:
             print(f"Failed to create table '{table_name}' after {max_retries} attempts.")
             raise Exception(f"Failed to create table '{table_name}'")
+
+    enable_ttl(table_name, region)
+    enable_stream(table_name, region)
+    enable_change_index(table_name, region)
+
+    # Rows written before GSI1 carried memberships and task status need the
+    # keys stamped on; both backfills skip rows that already have them
+    if existed:
+        backfill_membership_index(table_name, region)
+        backfill_task_status_index(table_name, region)
+
+
+def enable_ttl(table_name="TaskBin", region="us-west-1", attribute_name="ttl"):
+    """
+    Turn on DynamoDB TTL for the `ttl` epoch attribute so expired access codes
+    and orphaned WebSocket connection rows are removed automatically.
+    """
+    dynamodb = boto3.client('dynamodb', region_name=region)
+
+    # TTL can only be configured once the table is ACTIVE
+    dynamodb.get_waiter('table_exists').wait(TableName=table_name)
+
+    try:
+        dynamodb.update_time_to_live(
+            TableName=table_name,
+            TimeToLiveSpecification={"Enabled": True, "AttributeName": attribute_name}
+        )
+        print(f"TTL enabled on '{table_name}.{attribute_name}'.")
+    except dynamodb.exceptions.ClientError as e:
+        if "already enabled" in str(e):
+            print(f"TTL already enabled on '{table_name}'.")
+        else:
+            print(f"Error enabling TTL: {e}")
+
+
+
+def enable_stream(table_name="TaskBin", region="us-west-1"):
+    """
+    Make sure the table has a NEW_AND_OLD_IMAGES stream (feeds
+    TaskBin_StreamBroadcast) and return its ARN. Tables created before the
+    stream existed are updated in place.
+    """
+    dynamodb = boto3.client('dynamodb', region_name=region)
+    dynamodb.get_waiter('table_exists').wait(TableName=table_name)
+
+    table = dynamodb.describe_table(TableName=table_name)["Table"]
+    spec = table.get("StreamSpecification", {})
+
+    if spec.get("StreamEnabled") and spec.get("StreamViewType") == "NEW_AND_OLD_IMAGES":
+        print(f"Stream already enabled on '{table_name}'.")
+        return table["LatestStreamArn"]
+
+    if spec.get("StreamEnabled"):
+        # View type can't be changed in place; turn the old stream off first
+        dynamodb.update_table(TableName=table_name, StreamSpecification={"StreamEnabled": False})
+        dynamodb.get_waiter('table_exists').wait(TableName=table_name)
+
+    table = dynamodb.update_table(
+        TableName=table_name,
+        StreamSpecification={"StreamEnabled": True, "StreamViewType": "NEW_AND_OLD_IMAGES"}
+    )["TableDescription"]
+    print(f"Stream enabled on '{table_name}'.")
+    return table["LatestStreamArn"]
+
+
+def enable_change_index(table_name="TaskBin", region="us-west-1"):
+    """
+    Make sure the GSI2 change index exists, adding it to tables created
+    before delta sync. Rows need no backfill: only changes made after a
+    client's first full load are ever read through it.
+    """
+    dynamodb = boto3.client('dynamodb', region_name=region)
+    dynamodb.get_waiter('table_exists').wait(TableName=table_name)
+
+    table = dynamodb.describe_table(TableName=table_name)["Table"]
+    if any(i["IndexName"] == CHANGE_INDEX["IndexName"] for i in table.get("GlobalSecondaryIndexes", [])):
+        print(f"Change index already exists on '{table_name}'.")
+        return
+
+    dynamodb.update_table(
+        TableName=table_name,
+        AttributeDefinitions=[
+            {"AttributeName": "GSI2PK", "AttributeType": "S"},
+            {"AttributeName": "GSI2SK", "AttributeType": "N"}
+        ],
+        GlobalSecondaryIndexUpdates=[{"Create": CHANGE_INDEX}]
+    )
+    print(f"Change index creation initiated on '{table_name}'.")
+
+
+def _backfill_index(table, scan_kwargs, index_keys):
+    """
+    Scan rows matching scan_kwargs and SET the GSI1 keys index_keys(item)
+    returns. Rows that gained GSI1 keys since the scan (e.g. a concurrent
+    status change) are left alone, so reruns are safe.
+    """
+    updated = 0
+    while True:
+        resp = table.scan(**scan_kwargs)
+        for item in resp.get("Items", []):
+            gsi1pk, gsi1sk = index_keys(item)
+            try:
+                table.update_item(
+                    Key={"PK": item["PK"], "SK": item["SK"]},
+                    UpdateExpression="SET GSI1PK = :gpk, GSI1SK = :gsk",
+                    ConditionExpression="attribute_exists(PK) AND attribute_not_exists(GSI1PK)",
+                    ExpressionAttributeValues={":gpk": gsi1pk, ":gsk": gsi1sk}
+                )
+                updated += 1
+            except table.meta.client.exceptions.ConditionalCheckFailedException:
+                pass
+
+        if "LastEvaluatedKey" not in resp:
+            break
+        scan_kwargs["ExclusiveStartKey"] = resp["LastEvaluatedKey"]
+
+    return updated
+
+
+def backfill_membership_index(table_name="TaskBin", region="us-west-1"):
+    """
+    One-off migration: stamp GSI1PK/GSI1SK onto USER#/BOARD# membership rows
+    written before the board-membership index existed, so GSI1 lookups
+    ("all members of board X") see every member.
+    """
+    dynamodb = boto3.resource('dynamodb', region_name=region)
+    table = dynamodb.Table(table_name)
+
+    updated = _backfill_index(
+        table,
+        {
+            "FilterExpression": "begins_with(PK, :user) AND begins_with(SK, :board) AND attribute_not_exists(GSI1PK)",
+            "ExpressionAttributeValues": {":user": "USER#", ":board": "BOARD#"},
+            "ProjectionExpression": "PK, SK",
+        },
+        lambda item: (item["SK"], item["PK"])
+    )
+
+    print(f"Backfilled board-membership index on {updated} rows.")
+    return updated
+
+
+def backfill_task_status_index(table_name="TaskBin", region="us-west-1"):
+    """
+    One-off migration: stamp the status-partition keys
+    (GSI1PK = BOARD#<id>#STATUS#<status> or USER#<id>#STATUS#<status>,
+    GSI1SK = TASK#<id>) onto board and user task rows written before the
+    status index existed.
+    """
+    dynamodb = boto3.resource('dynamodb', region_name=region)
+    table = dynamodb.Table(table_name)
+
+    updated = _backfill_index(
+        table,
+        {
+            "FilterExpression": "(begins_with(PK, :board) OR begins_with(PK, :user)) "
+                                "AND begins_with(SK, :task) AND attribute_not_exists(GSI1PK)",
+            "ExpressionAttributeValues": {":board": "BOARD#", ":user": "USER#", ":task": "TASK#"},
+            "ProjectionExpression": "PK, SK, task_status",
+        },
+        lambda item: (f"{item['PK']}#STATUS#{item.get('task_status', 'todo')}", item["SK"])
+    )
+
+    print(f"Backfilled task-status index on {updated} rows.")
+    return updated
@@ -4,6 +4,10 @@ import zipfile
 import io
 import time
 import json
+import base64
+import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
 # --- Configuration ---
@@ -13,21 +17,106 @@ LAMBDA_HANDLER = "lambda_function.lambda_handler"
 REGION = "us-west-1"
 BASE_DIR = os.path.dirname(__file__)
 LAMBDA_DIR = os.path.join(BASE_DIR, "Lambdas")
+RUNTIME_PACKAGE = "taskbin_runtime"  # shared helpers, shipped as a Lambda layer
+RUNTIME_DIR = os.path.join(LAMBDA_DIR, RUNTIME_PACKAGE)
+RUNTIME_LAYER_NAME = "TaskBin_Runtime"
 TIMEOUT = 30
 MEMORY = 128
+ARCHITECTURE = "x86_64"
+ALIAS_NAME = "live"  # API integrations target this alias
 ARN_FILE = os.path.join(BASE_DIR, "lambda_arns.json")  # <-- save ARNs in JSON
+PROFILE_FILE = os.path.join(BASE_DIR, "lambda_profiles.json")  # per-function memory/arch/concurrency
+STREAM_FUNCTION = "TaskBin_StreamBroadcast"  # consumes the TaskBin table stream
+# Only board task rows reach the consumer (filtered by Lambda, not billed as invocations)
+STREAM_FILTER = {"dynamodb": {"Keys": {
+    "PK": {"S": [{"prefix": "BOARD#"}]},
+    "SK": {"S": [{"prefix": "TASK#"}]},
+}}}
+MAX_DEPLOY_WORKERS = 8  # functions packaged + deployed at once
+ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)  # fixed entry timestamp -> byte-identical zips
 
-lambda_client = boto3.client("lambda", region_name=REGION)
+# Shared across deploy threads; adaptive retries back off on Lambda API throttling
+lambda_client = boto3.client(
+    "lambda",
+    region_name=REGION,
+    config=Config(
+        max_pool_connections=MAX_DEPLOY_WORKERS * 2,
+        retries={"max_attempts": 10, "mode": "adaptive"},
+    ),
+)
+
+
+def _zip_write(zf: zipfile.ZipFile, file_path: str, arcname: str):
+    """Add a file with fixed metadata so the same source always zips to the same bytes."""
+    info = zipfile.ZipInfo(arcname, date_time=ZIP_DATE_TIME)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.external_attr = 0o644 << 16
+    with open(file_path, "rb") as f:
+        zf.writestr(info, f.read())
+
+
+def _code_sha256(zip_bytes: bytes) -> str:
+    """Same encoding Lambda reports as CodeSha256."""
+    return base64.b64encode(hashlib.sha256(zip_bytes).digest()).decode("ascii")
 
 
 def _zip_lambda_function(file_path: str) -> bytes:
     zip_buffer = io.BytesIO()
     with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.write(file_path, arcname="lambda_function.py")
+        _zip_write(zf, file_path, "lambda_function.py")
     zip_buffer.seek(0)
     return zip_buffer.read()
 
 
+def _zip_runtime_layer() -> bytes:
+    """Package taskbin_runtime under python/ so Lambda puts it on sys.path."""
+    zip_buffer = io.BytesIO()
+    with zipfile.ZipFile(zip_buffer, "w", zipfile.ZIP_DEFLATED) as zf:
+        for name in sorted(os.listdir(RUNTIME_DIR)):
+            if name.endswith(".py"):
+                _zip_write(zf, os.path.join(RUNTIME_DIR, name), f"python/{RUNTIME_PACKAGE}/{name}")
+    zip_buffer.seek(0)
+    return zip_buffer.read()
+
+
+def _latest_layer_version(code_sha256: str):
+    """Return the newest layer version ARN if its content matches, else None."""
+    versions = lambda_client.list_layer_versions(
+        LayerName=RUNTIME_LAYER_NAME, MaxItems=1
+    ).get("LayerVersions", [])
+    if not versions:
+        return None
+
+    latest_arn = versions[0]["LayerVersionArn"]
+    latest = lambda_client.get_layer_version_by_arn(Arn=latest_arn)
+    if latest["Content"]["CodeSha256"] == code_sha256:
+        return latest_arn
+    return None
+
+
+def _publish_runtime_layer(force: bool = False) -> str:
+    zip_bytes = _zip_runtime_layer()
+
+    # Reusing the current version keeps every function's Layers unchanged
+    if not force:
+        layer_arn = _latest_layer_version(_code_sha256(zip_bytes))
+        if layer_arn:
+            print(f"⏭️ Layer unchanged: {layer_arn}")
+            return layer_arn
+
+    print(f"📚 Publishing layer: {RUNTIME_LAYER_NAME}")
+    response = lambda_client.publish_layer_version(
+        LayerName=RUNTIME_LAYER_NAME,
+        Description="TaskBin shared runtime (DynamoDB client, pagination, batching, responses)",
+        Content={"ZipFile": zip_bytes},
+        CompatibleRuntimes=[LAMBDA_RUNTIME],
+        CompatibleArchitectures=["x86_64", "arm64"],
+    )
+    layer_arn = response["LayerVersionArn"]
+    print(f"✅ Published layer: {layer_arn}")
+    return layer_arn
+
+
 def _generate_lambda_name(file_name: str) -> str:
     base = file_name.replace(".py", "")
     parts = base.split("_")
@@ -35,27 +124,144 @@ def _generate_lambda_name(file_name: str) -> str:
     return f"TaskBin_{camel_case}"
 
 
-def _create_or_update_lambda(lambda_name: str, zip_bytes: bytes):
+def _load_profiles() -> dict:
+    if not os.path.exists(PROFILE_FILE):
+        return {"default": {}, "functions": {}}
+    with open(PROFILE_FILE, "r") as f:
+        return json.load(f)
+
+
+def _profile_for(lambda_name: str, profiles: dict = None) -> dict:
+    """Merge built-in defaults, the manifest's default block and the function override."""
+    profiles = profiles or _load_profiles()
+    profile = {
+        "memory": MEMORY,
+        "timeout": TIMEOUT,
+        "architecture": ARCHITECTURE,
+        "reserved_concurrency": None,
+        "provisioned_concurrency": 0,
+    }
+    profile.update(profiles.get("default", {}))
+    profile.update(profiles.get("functions", {}).get(lambda_name, {}))
+    return profile
+
+
+def _apply_concurrency(lambda_name: str, profile: dict):
+    reserved = profile["reserved_concurrency"]
+    if reserved is None:
+        lambda_client.delete_function_concurrency(FunctionName=lambda_name)
+    else:
+        lambda_client.put_function_concurrency(
+            FunctionName=lambda_name,
+            ReservedConcurrentExecutions=reserved,
+        )
+
+    provisioned = profile["provisioned_concurrency"]
+    if provisioned:
+        lambda_client.put_provisioned_concurrency_config(
+            FunctionName=lambda_name,
+            Qualifier=ALIAS_NAME,
+            ProvisionedConcurrentExecutions=provisioned,
+        )
+        print(f"🔥 Provisioned concurrency {provisioned} on {lambda_name}:{ALIAS_NAME}")
+    else:
+        try:
+            lambda_client.delete_provisioned_concurrency_config(
+                FunctionName=lambda_name,
+                Qualifier=ALIAS_NAME,
+            )
+        except lambda_client.exceptions.ResourceNotFoundException:
+            pass
+
+
+def _deployed_config(lambda_name: str):
+    """Configuration of the version behind the 'live' alias, or None if not deployed."""
+    try:
+        return lambda_client.get_function_configuration(
+            FunctionName=lambda_name,
+            Qualifier=ALIAS_NAME,
+        )
+    except lambda_client.exceptions.ResourceNotFoundException:
+        return None
+
+
+def _is_current(deployed: dict, code_sha256: str, layer_arn: str, profile: dict) -> bool:
+    return (
+        deployed["CodeSha256"] == code_sha256
+        and deployed["MemorySize"] == profile["memory"]
+        and deployed["Timeout"] == profile["timeout"]
+        and deployed.get("Architectures", ["x86_64"]) == [profile["architecture"]]
+        and [layer["Arn"] for layer in deployed.get("Layers", [])] == [layer_arn]
+    )
+
+
+def publish_alias(lambda_name: str, version: str = None, profile: dict = None) -> str:
+    """
+    Point the 'live' alias at `version` (publishing $LATEST if not given) and
+    re-apply the profile's concurrency settings. Call this after changing
+    $LATEST's configuration (e.g. environment variables) so the alias picks
+    it up. Returns the alias ARN.
+    """
+    profile = profile or _profile_for(lambda_name)
+
+    if version is None:
+        lambda_client.get_waiter("function_updated_v2").wait(FunctionName=lambda_name)
+        version = lambda_client.publish_version(FunctionName=lambda_name)["Version"]
+
+    try:
+        alias = lambda_client.update_alias(
+            FunctionName=lambda_name,
+            Name=ALIAS_NAME,
+            FunctionVersion=version,
+        )
+    except lambda_client.exceptions.ResourceNotFoundException:
+        alias = lambda_client.create_alias(
+            FunctionName=lambda_name,
+            Name=ALIAS_NAME,
+            FunctionVersion=version,
+        )
+
+    _apply_concurrency(lambda_name, profile)
+    print(f"🔗 {lambda_name}:{ALIAS_NAME} → version {version}")
+    return alias["AliasArn"]
+
+
+def _create_or_update_lambda(lambda_name: str, zip_bytes: bytes, layer_arn: str, profile: dict = None) -> str:
+    """Deploy code + profile, publish a version and return the 'live' alias ARN."""
+    profile = profile or _profile_for(lambda_name)
+
     try:
         print(f"🟢 Creating Lambda: {lambda_name}")
-        lambda_client.create_function(
+        response = lambda_client.create_function(
             FunctionName=lambda_name,
             Runtime=LAMBDA_RUNTIME,
             Role=LAMBDA_ROLE_ARN,
             Handler=LAMBDA_HANDLER,
             Code={"ZipFile": zip_bytes},
-            Timeout=TIMEOUT,
-            MemorySize=MEMORY,
+            Timeout=profile["timeout"],
+            MemorySize=profile["memory"],
+            Architectures=[profile["architecture"]],
+            Layers=[layer_arn],
             Publish=True,
         )
+        lambda_client.get_waiter("function_active_v2").wait(FunctionName=lambda_name)
         print(f"✅ Created Lambda: {lambda_name}")
 
     except ClientError as e:
         if e.response["Error"]["Code"] == "ResourceConflictException":
             print(f"🟡 Updating existing Lambda: {lambda_name}")
-            lambda_client.update_function_code(
+            # Apply layer + profile first so the published version has them
+            lambda_client.update_function_configuration(
+                FunctionName=lambda_name,
+                Timeout=profile["timeout"],
+                MemorySize=profile["memory"],
+                Layers=[layer_arn],
+            )
+            lambda_client.get_waiter("function_updated_v2").wait(FunctionName=lambda_name)
+            response = lambda_client.update_function_code(
                 FunctionName=lambda_name,
                 ZipFile=zip_bytes,
+                Architectures=[profile["architecture"]],
                 Publish=True,
             )
             print(f"✅ Updated Lambda: {lambda_name}")
@@ -63,38 +269,127 @@ def _create_or_update_lambda(lambda_name: str, zip_bytes: bytes):
             print(f"❌ Failed for {lambda_name}: {e}")
             raise e
 
+    return publish_alias(lambda_name, response["Version"], profile)
+
+
+def _deploy_lambda(file_name: str, layer_arn: str, profiles: dict, force: bool = False) -> tuple:
+    """
+    Package and deploy one handler file. Runs on a deploy worker thread.
+    Returns (lambda_name, alias_arn, uploaded).
+    """
+    file_path = os.path.join(LAMBDA_DIR, file_name)
+    lambda_name = _generate_lambda_name(file_name)
+    print(f"📦 Packaging {file_name} -> {lambda_name}")
+    zip_bytes = _zip_lambda_function(file_path)
+    profile = _profile_for(lambda_name, profiles)
+
+    # Skip the upload when the live version already has this code + config
+    deployed = None if force else _deployed_config(lambda_name)
+    if deployed and _is_current(deployed, _code_sha256(zip_bytes), layer_arn, profile):
+        print(f"⏭️ {lambda_name} unchanged")
+        _apply_concurrency(lambda_name, profile)
+        function_arn = ":".join(deployed["FunctionArn"].split(":")[:7])
+        return lambda_name, f"{function_arn}:{ALIAS_NAME}", False
 
-def create_all_lambdas():
+    print(f"⚙️ {lambda_name} profile: {profile['memory']} MB, {profile['architecture']}, {profile['timeout']}s")
+    return lambda_name, _create_or_update_lambda(lambda_name, zip_bytes, layer_arn, profile), True
+
+
+def create_all_lambdas(force: bool = False):
+    """
+    Deploy every handler in LAMBDA_DIR. Unchanged functions (same zip
+    CodeSha256, layer and profile as the 'live' alias) are skipped unless
+    force=True.
+    """
     print("🚀 Starting Lambda build process...")
+    started = time.perf_counter()
 
     if not os.path.exists(LAMBDA_DIR):
         print(f"❌ Lambdas directory not found: {LAMBDA_DIR}")
         return
 
-    py_files = [f for f in os.listdir(LAMBDA_DIR) if f.endswith(".py")]
+    py_files = sorted(f for f in os.listdir(LAMBDA_DIR) if f.endswith(".py"))
     if not py_files:
         print("⚠️ No Lambda files found.")
         return
 
+    layer_arn = _publish_runtime_layer(force)
+    profiles = _load_profiles()
     lambda_arns = {}
+    uploaded = []
+    failures = {}
 
-    for file_name in py_files:
-        file_path = os.path.join(LAMBDA_DIR, file_name)
-        lambda_name = _generate_lambda_name(file_name)
-        print(f"📦 Packaging {file_name} -> {lambda_name}")
-        zip_bytes = _zip_lambda_function(file_path)
-        _create_or_update_lambda(lambda_name, zip_bytes)
-
-        response = lambda_client.get_function(FunctionName=lambda_name)
-        lambda_arn = response["Configuration"]["FunctionArn"]
-        lambda_arns[lambda_name] = lambda_arn
-
-        time.sleep(1)
-        print("*" * 80)
+    # Functions are independent; wall-clock is bounded by the slowest deploy
+    with ThreadPoolExecutor(max_workers=MAX_DEPLOY_WORKERS) as pool:
+        futures = {
+            pool.submit(_deploy_lambda, file_name, layer_arn, profiles, force): file_name
+            for file_name in py_files
+        }
+        for future in as_completed(futures):
+            file_name = futures[future]
+            try:
+                lambda_name, lambda_arn, was_uploaded = future.result()
+                lambda_arns[lambda_name] = lambda_arn
+                if was_uploaded:
+                    uploaded.append(lambda_name)
+            except Exception as e:
+                failures[file_name] = str(e)
+                print(f"❌ Deploy failed for {file_name}: {e}")
 
-    print("✅ All Lambdas deployed successfully.")
+    elapsed = time.perf_counter() - started
+    print("*" * 80)
+    print(
+        f"✅ Deployed {len(lambda_arns)}/{len(py_files)} Lambdas in {elapsed:.1f}s "
+        f"({len(uploaded)} uploaded, {len(lambda_arns) - len(uploaded)} unchanged)"
+    )
 
-    # Save all Lambda ARNs to JSON file
+    # Save all Lambda ARNs to JSON file (sorted so diffs stay readable)
     with open(ARN_FILE, "w") as f:
-        json.dump(lambda_arns, f, indent=4)
+        json.dump(dict(sorted(lambda_arns.items())), f, indent=4)
     print(f"💾 Saved all Lambda ARNs to {ARN_FILE}")
+
+    if failures:
+        raise RuntimeError(f"Lambda deploy failed for: {', '.join(sorted(failures))}")
+
+
+def create_stream_trigger(table_name="TaskBin"):
+    """
+    Connect the table's stream to TaskBin_StreamBroadcast ('live' alias).
+    Creates the event source mapping once; later runs just update it.
+    """
+    dynamodb = boto3.client("dynamodb", region_name=REGION)
+    stream_arn = dynamodb.describe_table(TableName=table_name)["Table"].get("LatestStreamArn")
+    if not stream_arn:
+        raise RuntimeError(f"Table '{table_name}' has no stream (see CreateDB.enable_stream)")
+
+    with open(ARN_FILE, "r") as f:
+        function_arn = json.load(f)[STREAM_FUNCTION]
+
+    settings = {
+        "BatchSize": 100,
+        # Coalesce a burst of writes (drag-and-drop, bulk edits) into one
+        # tasksChanged per board, at the cost of up to 1 s of push latency
+        "MaximumBatchingWindowInSeconds": 1,
+        "FilterCriteria": {"Filters": [{"Pattern": json.dumps(STREAM_FILTER)}]},
+        "MaximumRetryAttempts": 3,
+        "BisectBatchOnFunctionError": True,
+    }
+
+    existing = lambda_client.list_event_source_mappings(
+        EventSourceArn=stream_arn, FunctionName=function_arn
+    ).get("EventSourceMappings", [])
+
+    if existing:
+        uuid = existing[0]["UUID"]
+        lambda_client.update_event_source_mapping(UUID=uuid, **settings)
+        print(f"🔁 Updated stream trigger {uuid} → {STREAM_FUNCTION}")
+    else:
+        uuid = lambda_client.create_event_source_mapping(
+            EventSourceArn=stream_arn,
+            FunctionName=function_arn,
+            StartingPosition="LATEST",
+            **settings,
+        )["UUID"]
+        print(f"🌊 Created stream trigger {uuid} → {STREAM_FUNCTION}")
+
+    return uuid
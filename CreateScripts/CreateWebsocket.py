@@ -2,6 +2,7 @@ import boto3
 from botocore.exceptions import ClientError
 import json
 import os
+from TaskBin.CreateScripts.CreateLambdas import publish_alias
 
 REGION = "us-west-1"
 
@@ -45,8 +46,8 @@ def save_websocket_api_id(api_id):
     print(f"💾 Saved websocket_api_id={api_id} into api_id.json")
 
 
-def allow_api_to_call_lambda(lambda_name, api_id, region="us-west-1"):
-    """Grants API Gateway permission to invoke the lambda."""
+def allow_api_to_call_lambda(lambda_name, lambda_arn, api_id, region="us-west-1"):
+    """Grants API Gateway permission to invoke the lambda (alias) the route targets."""
     sts = boto3.client("sts")
     account_id = sts.get_caller_identity()["Account"]
 
@@ -54,7 +55,7 @@ def allow_api_to_call_lambda(lambda_name, api_id, region="us-west-1"):
 
     try:
         lambda_client.add_permission(
-            FunctionName=lambda_name,
+            FunctionName=lambda_arn,
             StatementId=f"{lambda_name}_WS_PERM",
             Action="lambda:InvokeFunction",
             Principal="apigateway.amazonaws.com",
@@ -69,109 +70,186 @@ def allow_api_to_call_lambda(lambda_name, api_id, region="us-west-1"):
         print(f"❌ Error adding permission for {lambda_name}: {e}")
 
 
-def create_route_and_integration(api_id, route_key, lambda_arn):
-    """Create route + lambda integration for WebSockets."""
-    integration = apigateway.create_integration(
-        ApiId=api_id,
-        IntegrationType="AWS_PROXY",
-        IntegrationUri=lambda_arn,
-        IntegrationMethod="POST",
-        PayloadFormatVersion="1.0"
-    )
+def load_websocket_api_id():
+    """Read websocket_api_id from api_id.json (None if not saved yet)"""
+    if not os.path.exists(API_ID_FILE):
+        return None
 
-    integration_id = integration["IntegrationId"]
+    try:
+        with open(API_ID_FILE, "r") as f:
+            return json.load(f).get("websocket_api_id")
+    except json.JSONDecodeError:
+        return None
 
-    apigateway.create_route(
-        ApiId=api_id,
-        RouteKey=route_key,
-        Target=f"integrations/{integration_id}"
-    )
 
-    print(f"✅ Route '{route_key}' → Lambda: {lambda_arn}")
+def get_or_create_websocket_api():
+    """Reuse the saved WebSocket API if it still exists, otherwise create one."""
+    api_id = load_websocket_api_id()
 
+    if api_id:
+        try:
+            api = apigateway.get_api(ApiId=api_id)
+            print(f"♻️ Using existing WebSocket API: {api_id}")
+            return api_id, api["ApiEndpoint"]
+        except apigateway.exceptions.NotFoundException:
+            print(f"⚠️ WebSocket API {api_id} not found, creating new one...")
+
+    api_response = apigateway.create_api(
+        Name="TaskBinWebSocketAPI",
+        ProtocolType="WEBSOCKET",
+        RouteSelectionExpression="$request.body.action"
+    )
+    api_id = api_response["ApiId"]
 
-def create_websocket_api(connect_arn, disconnect_arn, sendmessage_arn):
-    """Creates the WebSocket API with all routes and deploys it."""
+    print(f"🚀 Created WebSocket API: {api_id}")
+    print(f"🔌 Endpoint: {api_response['ApiEndpoint']}")
 
-    # 1️⃣ Create WebSocket API
+    # Save API ID for future builds
+    save_websocket_api_id(api_id)
+    return api_id, api_response["ApiEndpoint"]
+
+
+def reconcile_routes(api_id, desired_routes):
+    """
+    Create missing integrations/routes and re-target routes whose Lambda
+    changed. Returns True if anything was written.
+    """
+    changed = False
+
+    integrations = {
+        i["IntegrationUri"]: i["IntegrationId"]
+        for i in apigateway.get_integrations(ApiId=api_id).get("Items", [])
+    }
+    routes = {
+        r["RouteKey"]: r
+        for r in apigateway.get_routes(ApiId=api_id).get("Items", [])
+    }
+
+    for route_key, lambda_arn in desired_routes.items():
+        if lambda_arn not in integrations:
+            integration = apigateway.create_integration(
+                ApiId=api_id,
+                IntegrationType="AWS_PROXY",
+                IntegrationUri=lambda_arn,
+                IntegrationMethod="POST",
+                PayloadFormatVersion="1.0"
+            )
+            integrations[lambda_arn] = integration["IntegrationId"]
+            changed = True
+
+        target = f"integrations/{integrations[lambda_arn]}"
+        existing = routes.get(route_key)
+
+        if existing is None:
+            apigateway.create_route(ApiId=api_id, RouteKey=route_key, Target=target)
+            print(f"✅ Route '{route_key}' → Lambda: {lambda_arn}")
+            changed = True
+        elif existing.get("Target") != target:
+            apigateway.update_route(ApiId=api_id, RouteId=existing["RouteId"], Target=target)
+            print(f"🔁 Route '{route_key}' re-targeted → Lambda: {lambda_arn}")
+            changed = True
+        else:
+            print(f"✔ Route '{route_key}' unchanged")
+
+    return changed
+
+
+def deploy_stage(api_id, changed, stage_name="prod"):
+    """Create the stage on first run; afterwards redeploy only when routes changed."""
     try:
-        api_response = apigateway.create_api(
-            Name="TaskBinWebSocketAPI",
-            ProtocolType="WEBSOCKET",
-            RouteSelectionExpression="$request.body.action"
-        )
-        api_id = api_response["ApiId"]
-        api_endpoint = api_response["ApiEndpoint"]
-
-        print(f"🚀 Created WebSocket API: {api_id}")
-        print(f"🔌 Endpoint: {api_endpoint}")
-
-    except ClientError as e:
-        print(f"❌ Failed to create WebSocket API: {e}")
-        return None
-
-    # 2️⃣ Permissions
-    allow_api_to_call_lambda("TaskBin_SocketConnect", api_id)
-    allow_api_to_call_lambda("TaskBin_SocketDisconnect", api_id)
-    allow_api_to_call_lambda("TaskBin_SocketSendmsg", api_id)
+        apigateway.get_stage(ApiId=api_id, StageName=stage_name)
+        stage_exists = True
+    except apigateway.exceptions.NotFoundException:
+        stage_exists = False
 
-    # 3️⃣ Routes
-    create_route_and_integration(api_id, "$connect", connect_arn)
-    create_route_and_integration(api_id, "$disconnect", disconnect_arn)
-    create_route_and_integration(api_id, "sendMessage", sendmessage_arn)
+    if stage_exists and not changed:
+        print(f"✔ Stage '{stage_name}' up to date, skipping deployment")
+        return
 
-    # ⭐ REQUIRED or else you get "Forbidden"
-    create_route_and_integration(api_id, "$default", sendmessage_arn)
+    deployment = apigateway.create_deployment(
+        ApiId=api_id,
+        Description="WebSocket deployment"
+    )
 
-    # 4️⃣ Deploy API → prod
-    try:
-        deployment = apigateway.create_deployment(
+    if stage_exists:
+        apigateway.update_stage(
             ApiId=api_id,
-            Description="Initial WebSocket deployment"
+            StageName=stage_name,
+            DeploymentId=deployment["DeploymentId"]
         )
-
+    else:
         apigateway.create_stage(
             ApiId=api_id,
-            StageName="prod",
+            StageName=stage_name,
             DeploymentId=deployment["DeploymentId"]
         )
 
-        print("📦 WebSocket API deployed to stage → prod")
+    print(f"📦 WebSocket API deployed to stage → {stage_name}")
 
-    except ClientError as e:
-        print(f"❌ Failed deployment: {e}")
-        return None
 
+def ensure_ws_endpoint(api_id, function_name="TaskBin_SocketSendmsg", region=REGION):
+    """Inject WS_ENDPOINT into the SendMsg Lambda only if the live alias doesn't have it."""
+    ws_endpoint = f"https://{api_id}.execute-api.{region}.amazonaws.com/prod"
 
-    # ---------------------------------------------
-    # 5️⃣ Inject WS_ENDPOINT env var into SendMsg Lambda
-    # ---------------------------------------------
-    ws_endpoint = f"https://{api_id}.execute-api.us-west-1.amazonaws.com/prod"
-    print(f"🌐 Injecting WS_ENDPOINT={ws_endpoint} into TaskBin_SocketSendmsg")
+    live = lambda_client.get_function_configuration(FunctionName=function_name, Qualifier="live")
+    if live.get("Environment", {}).get("Variables", {}).get("WS_ENDPOINT") == ws_endpoint:
+        print(f"✔ WS_ENDPOINT already set on {function_name}")
+        return
 
-    lambda_client.update_function_configuration(
-        FunctionName="TaskBin_SocketSendmsg",
-        Environment={
-            "Variables": {
-                "WS_ENDPOINT": ws_endpoint
-            }
-        }
-    )
+    print(f"🌐 Injecting WS_ENDPOINT={ws_endpoint} into {function_name}")
+
+    latest = lambda_client.get_function_configuration(FunctionName=function_name)
+    variables = latest.get("Environment", {}).get("Variables", {})
+    if variables.get("WS_ENDPOINT") != ws_endpoint:
+        lambda_client.update_function_configuration(
+            FunctionName=function_name,
+            Environment={"Variables": {**variables, "WS_ENDPOINT": ws_endpoint}}
+        )
+
+    # Routes target the 'live' alias, so publish the new configuration to it
+    publish_alias(function_name)
 
     print("🔧 WS_ENDPOINT successfully set on SendMsg Lambda")
 
 
-    # Save API ID for future builds
-    save_websocket_api_id(api_id)
+def ensure_websocket_api(connect_arn, disconnect_arn, sendmessage_arn):
+    """
+    Make the WebSocket API match the desired routes, reusing the API saved in
+    api_id.json so clients keep the same endpoint across builds.
+    """
+    try:
+        api_id, api_endpoint = get_or_create_websocket_api()
+    except ClientError as e:
+        print(f"❌ Failed to create WebSocket API: {e}")
+        return None
+
+    # Permissions (already-granted is a no-op)
+    allow_api_to_call_lambda("TaskBin_SocketConnect", connect_arn, api_id)
+    allow_api_to_call_lambda("TaskBin_SocketDisconnect", disconnect_arn, api_id)
+    allow_api_to_call_lambda("TaskBin_SocketSendmsg", sendmessage_arn, api_id)
+
+    try:
+        changed = reconcile_routes(api_id, {
+            "$connect": connect_arn,
+            "$disconnect": disconnect_arn,
+            "sendMessage": sendmessage_arn,
+            # ⭐ REQUIRED or else you get "Forbidden"
+            "$default": sendmessage_arn,
+        })
+        deploy_stage(api_id, changed)
+    except ClientError as e:
+        print(f"❌ Failed deployment: {e}")
+        return None
 
-    return {"api_id": api_id, "endpoint": api_endpoint}
+    ensure_ws_endpoint(api_id)
 
+    return {"api_id": api_id, "endpoint": api_endpoint, "changed": changed}
 
 
 def setup_websocket_api():
     lambda_arns = load_lambda_arns()
 
-    return create_websocket_api(
+    return ensure_websocket_api(
         lambda_arns["TaskBin_SocketConnect"],
         lambda_arns["TaskBin_SocketDisconnect"],
         lambda_arns["TaskBin_SocketSendmsg"]
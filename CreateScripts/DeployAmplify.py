@@ -7,6 +7,19 @@ import sys
 import shutil
 import json
 import time
+import random
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+
+UPLOAD_WORKERS = 8      # concurrent PUTs to the Amplify upload URLs
+UPLOAD_RETRIES = 4      # attempts per file before the deploy gives up
+UPLOAD_BACKOFF = 0.5    # seconds, doubled per attempt (plus jitter)
+
+# Build cache: dist/ is built once with a placeholder login URL and kept as a
+# template; the real hosted-UI URL is substituted in afterwards.
+LOGIN_URL_PLACEHOLDER = "__TASKBIN_COGNITO_LOGIN_URL__"
+BUILD_INPUTS = ["package.json", "package-lock.json", "index.html", ".env",
+                "vite.config.js", "postcss.config.js", "tailwind.config.js", "src", "public"]
 
 
 # -----------------------------
@@ -70,6 +83,179 @@ def build_md5_file_map(source_dir):
             file_map[rel_path] = md5_hash(full_path)
     return file_map
 
+def hash_inputs(base_dir, names, extra=""):
+    """SHA-256 over the given files/dirs (path + content), plus an extra string"""
+    hasher = hashlib.sha256(extra.encode("utf-8"))
+    for name in names:
+        path = os.path.join(base_dir, name)
+        if os.path.isfile(path):
+            paths = [path]
+        else:
+            paths = sorted(
+                os.path.join(root, fname)
+                for root, dirs, files in os.walk(path)
+                for fname in files
+            )
+        for file_path in paths:
+            rel_path = os.path.relpath(file_path, start=base_dir).replace("\\", "/")
+            hasher.update(rel_path.encode("utf-8") + b"\0")
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(65536), b""):
+                    hasher.update(chunk)
+    return hasher.hexdigest()
+
+def build_frontend(frontend_dir, npm_path, env_content, hosted_ui_url):
+    """
+    Produce dist/ and its MD5 fileMap, reusing the cached build when the
+    sources and env (other than the login URL) are unchanged.
+    """
+    dist_dir = os.path.join(frontend_dir, "dist")
+    node_modules = os.path.join(frontend_dir, "node_modules")
+    cache_dir = os.path.join(node_modules, ".cache", "taskbin-dist")
+    template_dir = os.path.join(cache_dir, "template")
+    manifest_file = os.path.join(cache_dir, "manifest.json")
+
+    manifest = {}
+    if os.path.isfile(manifest_file):
+        with open(manifest_file) as f:
+            manifest = json.load(f)
+
+    deps_key = hash_inputs(frontend_dir, ["package.json", "package-lock.json"])
+    build_key = hash_inputs(frontend_dir, BUILD_INPUTS, extra=env_content)
+
+    if manifest.get("build_key") == build_key and os.path.isdir(template_dir):
+        print("✔ Frontend sources unchanged, reusing cached build")
+    else:
+        if manifest.get("deps_key") != deps_key or not os.path.isdir(node_modules):
+            run_command(f'"{npm_path}" install', cwd=frontend_dir)
+        else:
+            print("✔ Dependencies unchanged, skipping npm install")
+
+        # Process env beats .env files in Vite, so the build sees the placeholder
+        build_env = {**os.environ, "VITE_COGNITO_LOGIN_URL": LOGIN_URL_PLACEHOLDER}
+        run_command(f'"{npm_path}" run build -- --mode production', cwd=frontend_dir, env=build_env)
+        check_path(dist_dir, "dist folder")
+
+        # Keep the placeholder build as the template for later URL substitutions
+        shutil.rmtree(template_dir, ignore_errors=True)
+        shutil.copytree(dist_dir, template_dir)
+
+        placeholder = LOGIN_URL_PLACEHOLDER.encode("utf-8")
+        template_map = build_md5_file_map(template_dir)
+        templated = []
+        for rel_path in template_map:
+            with open(os.path.join(template_dir, rel_path.replace("/", os.sep)), "rb") as f:
+                if placeholder in f.read():
+                    templated.append(rel_path)
+
+        manifest = {
+            "deps_key": deps_key,
+            "build_key": build_key,
+            "file_map": template_map,
+            "templated": templated,
+        }
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(manifest_file, "w") as f:
+            json.dump(manifest, f, indent=2)
+
+    # Render dist/ from the template; only files holding the placeholder change
+    shutil.rmtree(dist_dir, ignore_errors=True)
+    shutil.copytree(template_dir, dist_dir)
+
+    # Vite inlines env values as JS string literals, so escape accordingly
+    login_url = json.dumps(hosted_ui_url)[1:-1].encode("utf-8")
+    file_map = dict(manifest["file_map"])
+    for rel_path in manifest["templated"]:
+        full_path = os.path.join(dist_dir, rel_path.replace("/", os.sep))
+        with open(full_path, "rb") as f:
+            content = f.read()
+        with open(full_path, "wb") as f:
+            f.write(content.replace(LOGIN_URL_PLACEHOLDER.encode("utf-8"), login_url))
+        file_map[rel_path] = md5_hash(full_path)
+
+    return file_map
+
+def _upload_session(workers):
+    """One pooled session so uploads reuse TCP/TLS connections"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def _upload_file(session, url, full_path, retries=UPLOAD_RETRIES):
+    """PUT one file (streamed from disk), retrying transient failures with backoff"""
+    for attempt in range(retries):
+        try:
+            size = os.path.getsize(full_path)
+            with open(full_path, "rb") as f:
+                # Empty files go as b"" so requests doesn't fall back to chunked encoding
+                response = session.put(url, data=f if size else b"")
+            if response.status_code < 500 and response.status_code != 429:
+                response.raise_for_status()
+                return size
+            error = f"HTTP {response.status_code}"
+        except requests.ConnectionError as e:
+            error = str(e)
+        except requests.Timeout as e:
+            error = str(e)
+
+        if attempt < retries - 1:
+            delay = UPLOAD_BACKOFF * (2 ** attempt) + random.uniform(0, UPLOAD_BACKOFF)
+            print(f"  ↻ Retrying {os.path.basename(full_path)} in {delay:.1f}s ({error})")
+            time.sleep(delay)
+
+    raise RuntimeError(f"upload failed after {retries} attempts: {error}")
+
+def upload_files(upload_urls, dist_dir, workers=UPLOAD_WORKERS):
+    """
+    Upload dist/ files to their Amplify upload URLs concurrently.
+    Returns the relative paths that could not be uploaded.
+    """
+    total = len(upload_urls)
+    done, sent_bytes, failed = 0, 0, []
+    started = time.perf_counter()
+
+    with _upload_session(workers) as session, ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_upload_file, session, url, os.path.join(dist_dir, rel_path.replace("/", os.sep))): rel_path
+            for rel_path, url in upload_urls.items()
+        }
+        for future in as_completed(futures):
+            rel_path = futures[future]
+            try:
+                size = future.result()
+            except Exception as e:
+                print(f"  ✗ {rel_path}: {e}")
+                failed.append(rel_path)
+                continue
+
+            done += 1
+            sent_bytes += size
+            print(f"  [{done}/{total}] {rel_path} ({size / 1024:.1f} KB)")
+
+    elapsed = max(time.perf_counter() - started, 1e-6)
+    print(
+        f"Uploaded {done}/{total} files, {sent_bytes / 1048576:.2f} MB "
+        f"in {elapsed:.1f}s ({sent_bytes / 1048576 / elapsed:.2f} MB/s)"
+    )
+    return failed
+
+def wait_for_job(amplify, app_id, branch_name, job_id, timeout=900, interval=5):
+    """Poll an Amplify job until it finishes instead of sleeping a fixed time"""
+    deadline = time.monotonic() + timeout
+    status = None
+    while time.monotonic() < deadline:
+        status = amplify.get_job(appId=app_id, branchName=branch_name, jobId=job_id)["job"]["summary"]["status"]
+        if status == "SUCCEED":
+            print(f"✔ Amplify job {job_id} succeeded")
+            return status
+        if status in ("FAILED", "CANCELLED"):
+            raise RuntimeError(f"Amplify job {job_id} finished with status {status}")
+        time.sleep(interval)
+
+    raise TimeoutError(f"Amplify job {job_id} still {status} after {timeout}s")
+
 def get_frontend_url_temp(app_id, branch_name):
     """Return the temporary Amplify frontend URL immediately"""
     return f"https://{branch_name}.{app_id}.amplifyapp.com/"
@@ -82,7 +268,8 @@ def deploy_frontend(
         app_name="TaskBinFrontend",
         branch_name="main",
         region="us-west-1",
-        hosted_ui_url=None
+        hosted_ui_url=None,
+        wait=False
 ):
 
     # Detect Node + npm
@@ -132,15 +319,11 @@ def deploy_frontend(
     # Step 0b: Check frontend folder
     check_path(frontend_dir, "Frontend folder")
 
-    # Step 1: Build frontend in production mode
+    # Step 1: Build frontend in production mode (cached; the login URL is
+    # substituted after the build, so it is left out of the cache key)
     print("Building Vite frontend in production mode...")
-
-    # Use absolute paths for npm
-    run_command(f'"{npm_path}" install', cwd=frontend_dir)
-    run_command(f'"{npm_path}" run build -- --mode production', cwd=frontend_dir)
-
-    # Ensure dist exists after build
-    check_path(dist_dir, "dist folder")
+    cache_env = env_content.replace(f"VITE_COGNITO_LOGIN_URL={hosted_ui_url}", "")
+    file_map = build_frontend(frontend_dir, npm_path, cache_env, hosted_ui_url)
     print("Build complete.")
 
     # Step 2: Initialize Amplify client
@@ -198,9 +381,7 @@ def deploy_frontend(
     print("✔ Amplify rewrite rules configured")
 
 
-    # Step 5: Prepare fileMap
-    print("Building MD5 fileMap from dist/ folder...")
-    file_map = build_md5_file_map(dist_dir)
+    # Step 5: fileMap comes from the build cache (MD5s of unchanged files reused)
     print(f"Total files to deploy: {len(file_map)}")
 
     # Step 6: Create deployment
@@ -216,12 +397,9 @@ def deploy_frontend(
 
     # Step 7: Upload files
     print("Uploading files...")
-    for rel_path, url in upload_urls.items():
-        full_path = os.path.join(dist_dir, rel_path.replace("/", os.sep))
-        with open(full_path, "rb") as f:
-            data = f.read()
-        response = requests.put(url, data=data)
-        response.raise_for_status()
+    failed = upload_files(upload_urls, dist_dir)
+    if failed:
+        sys.exit(f"Upload failed for {len(failed)} file(s): {', '.join(sorted(failed))}")
     print("All files uploaded successfully.")
 
     # Step 8: Start deployment
@@ -231,6 +409,8 @@ def deploy_frontend(
         branchName=branch_name_actual,
         jobId=job_id
     )
+    if wait:
+        wait_for_job(amplify, app_id, branch_name_actual, job_id)
 
     # Step 9: Return frontend URL
     frontend_url = get_frontend_url_temp(app_id, branch_name_actual)
@@ -1,10 +1,9 @@
 import json
 import uuid
-import boto3
 from datetime import datetime
+from taskbin_runtime.dynamo import get_table
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table("TaskBin")
+table = get_table("TaskBin")
 
 def lambda_handler(event, context):
     body = json.loads(event["body"])
@@ -41,6 +40,8 @@ def lambda_handler(event, context):
         "user_id": user_id,
         "role": "owner",
         "joined_at": now,
+        "GSI1PK": f"BOARD#{board_id}",
+        "GSI1SK": f"USER#{user_id}",
     }
 
     table.put_item(Item=metadata)
@@ -1,13 +1,13 @@
 import json
-import boto3
 import uuid
 from datetime import datetime, timezone
 from botocore.exceptions import ClientError
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.versioning import run_versioned, version_attributes
 
 # --- DynamoDB table ---
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 def lambda_handler(event, context):
     """
@@ -47,39 +47,6 @@ def lambda_handler(event, context):
                 "body": json.dumps({"error": "Missing required fields: user_id, title"})
             }
 
-        # ---------------------------------
-        # ✔️ NEW: Verify the user is a board owner or a member
-        # ---------------------------------
-        membership_item = table.get_item(
-            Key={
-                "PK": f"USER#{user_id}",
-                "SK": f"BOARD#{board_id}"
-            }
-        ).get("Item")
-
-        if not membership_item:
-            return {
-                "statusCode": 403,
-                "body": json.dumps({"error": "User is not authorized (not a board member or owner)"})
-            }
-
-        # ---------------------------------
-        # ✔️ Verify board exists (optional safety check)
-        # ---------------------------------
-        board_owner_lookup = table.scan(
-            FilterExpression="SK = :sk AND begins_with(PK, :prefix)",
-            ExpressionAttributeValues={
-                ":sk": f"BOARD#{board_id}",
-                ":prefix": "USER#"
-            }
-        ).get("Items", [])
-
-        if not board_owner_lookup:
-            return {
-                "statusCode": 404,
-                "body": json.dumps({"error": "Board not found"})
-            }
-
         # ---------------------------------
         # Generate unique task ID
         # ---------------------------------
@@ -87,7 +54,7 @@ def lambda_handler(event, context):
         created_at = datetime.now(timezone.utc).isoformat()
 
         # ---------------------------------
-        # 1️⃣ Insert BOARD -> TASK entry
+        # 1️⃣ Build BOARD -> TASK entry
         # ---------------------------------
         board_task_item = {
             "PK": f"BOARD#{board_id}",
@@ -101,12 +68,13 @@ def lambda_handler(event, context):
             "created_by": user_id,
             "task_status": task_status,
             "assigned_to": assigned_to,
-            "type": "task"
+            "type": "task",
+            "GSI1PK": f"BOARD#{board_id}#STATUS#{task_status}",
+            "GSI1SK": f"TASK#{task_id}"
         }
-        table.put_item(Item=board_task_item)
 
         # ---------------------------------
-        # 2️⃣ Insert TASK -> METADATA entry
+        # 2️⃣ Build TASK -> METADATA entry
         # ---------------------------------
         task_metadata_item = {
             "PK": f"TASK#{task_id}",
@@ -122,11 +90,11 @@ def lambda_handler(event, context):
             "assigned_to": assigned_to,
             "type": "task_metadata"
         }
-        table.put_item(Item=task_metadata_item)
 
         # ---------------------------------
-        # 3️⃣ Insert USER -> TASK entry (if assigned)
+        # 3️⃣ Build USER -> TASK entry (if assigned)
         # ---------------------------------
+        user_task_item = None
         if assigned_to:
             user_task_item = {
                 "PK": f"USER#{assigned_to}",
@@ -139,16 +107,49 @@ def lambda_handler(event, context):
                 "finish_by": finish_by,
                 "created_by": user_id,
                 "task_status": task_status,
-                "type": "user_task"
+                "type": "user_task",
+                "GSI1PK": f"USER#{assigned_to}#STATUS#{task_status}",
+                "GSI1SK": f"TASK#{task_id}"
+            }
+
+        # ---------------------------------
+        # Write every row in one transaction, guarded by the
+        # membership check; run_versioned adds the board-version
+        # bump (which also checks the board exists)
+        # ---------------------------------
+        new_row = "attribute_not_exists(PK)"
+
+        def build_steps(version):
+            steps = [
+                ({"ConditionCheck": {
+                    "Key": {"PK": f"USER#{user_id}", "SK": f"BOARD#{board_id}"},
+                    "ConditionExpression": "attribute_exists(PK)"
+                }}, (403, "User is not authorized (not a board member or owner)")),
+                ({"Put": {
+                    "Item": {**board_task_item, **version_attributes(board_id, version)},
+                    "ConditionExpression": new_row
+                }}, None),
+                ({"Put": {"Item": task_metadata_item, "ConditionExpression": new_row}}, None),
+            ]
+            if user_task_item:
+                steps.append(({"Put": {"Item": user_task_item, "ConditionExpression": new_row}}, None))
+            return steps
+
+        version, failure = run_versioned(table, board_id, build_steps)
+        if failure:
+            status_code, error = failure
+            return {
+                "statusCode": status_code,
+                "body": json.dumps({"error": error})
             }
-            table.put_item(Item=user_task_item)
 
         return {
             "statusCode": 201,
             "body": json.dumps({
                 "message": "Task created successfully",
                 "task_id": task_id,
-                "board_id": board_id
+                "board_id": board_id,
+                "version": version
             })
         }
 
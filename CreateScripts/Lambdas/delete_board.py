@@ -1,16 +1,19 @@
 import json
 import boto3
+from datetime import datetime, timezone
 from botocore.exceptions import ClientError
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.transactions import run_transaction
 
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 lambda_client = boto3.client("lambda")
 
 def lambda_handler(event, context):
     """
     DELETE /boards/{boardId}
-    Deletes board safely with no race conditions.
+    Marks the board deleted (tombstone on METADATA) and returns right away;
+    TaskBin_ReapBoard removes the board's rows in the background.
     """
 
     try:
@@ -42,60 +45,42 @@ def lambda_handler(event, context):
             return {"statusCode": 403, "body": json.dumps({"error": "Only the owner can delete this board"})}
 
         # ----------------------------
-        # 3. Gather all items to delete
+        # 3. Logical delete: tombstone METADATA and drop the access code
+        #    in one transaction; readers treat deleted_at as "gone"
         # ----------------------------
-        delete_keys = []
-
-        # 3a. All tasks + metadata
-        task_resp = table.query(
-            KeyConditionExpression="PK = :pk AND begins_with(SK, :prefix)",
-            ExpressionAttributeValues={":pk": board_pk, ":prefix": "TASK#"}
-        )
-        tasks = task_resp.get("Items", [])
-        for task in tasks:
-            delete_keys.append({"PK": board_pk, "SK": task["SK"]})
-            delete_keys.append({"PK": task["SK"], "SK": "METADATA"})  # task metadata
-
-        # 3b. Access code entries
-        access_resp = table.get_item(Key={"PK": board_pk, "SK": "ACCESS"})
-        access_item = access_resp.get("Item")
-        if access_item and "code" in access_item:
-            access_code = str(access_item["code"]).strip()
-            access_pk = f"ACCESS#{access_code}"
-            access_items = table.query(KeyConditionExpression="PK = :pk", ExpressionAttributeValues={":pk": access_pk}).get("Items", [])
-            for item in access_items:
-                delete_keys.append({"PK": item["PK"], "SK": item["SK"]})
-            delete_keys.append({"PK": board_pk, "SK": "ACCESS"})
-
-        # 3c. Memberships (BOARD->USER)
-        member_resp = table.query(
-            KeyConditionExpression="PK = :pk AND begins_with(SK, :prefix)",
-            ExpressionAttributeValues={":pk": board_pk, ":prefix": "USER#"}
-        )
-        members = member_resp.get("Items", [])
-        for member in members:
-            delete_keys.append({"PK": member["PK"], "SK": member["SK"]})  # BOARD->USER
-
-        # 3d. Memberships (USER->BOARD)
-        for member in members:
-            user_sk = member["SK"]       # USER#uid
-            uid = user_sk.split("#")[1]
-            user_pk = f"USER#{uid}"
-            board_sk = f"BOARD#{board_id}"
-            delete_keys.append({"PK": user_pk, "SK": board_sk})
-        delete_keys.append({"PK": f"USER#{owner_id}", "SK": f"BOARD#{board_id}"})  # owner
-
-        # 3e. Board metadata last
-        delete_keys.append({"PK": board_pk, "SK": "METADATA"})
+        deleted_at = datetime.now(timezone.utc).isoformat()
+        steps = [
+            ({"Update": {
+                "Key": {"PK": board_pk, "SK": "METADATA"},
+                "UpdateExpression": "SET deleted_at = :now",
+                "ConditionExpression": "attribute_exists(PK) AND attribute_not_exists(deleted_at)",
+                "ExpressionAttributeValues": {":now": deleted_at}
+            }}, (404, "Board not found")),
+        ]
+
+        access_item = table.get_item(Key={"PK": board_pk, "SK": "ACCESS"}).get("Item")
+        if access_item:
+            access_pk = f"ACCESS_CODE#{access_item['access_code']}"
+            steps.append(({"Delete": {"Key": {"PK": board_pk, "SK": "ACCESS"}}}, None))
+            steps.append(({"Delete": {"Key": {"PK": access_pk, "SK": "ACCESS"}}}, None))
+            steps.append(({"Delete": {"Key": {"PK": access_pk, "SK": board_pk}}}, None))
+
+        # An already-tombstoned board just gets its reaper re-triggered
+        failure = None if board_item.get("deleted_at") else run_transaction(table, steps)
+        if failure:
+            status_code, error = failure
+            return {"statusCode": status_code, "body": json.dumps({"error": error})}
 
         # ----------------------------
-        # 4. Execute deletion in batch
+        # 4. Hand the physical cleanup to the reaper (async)
         # ----------------------------
-        with table.batch_writer() as batch:
-            for key in delete_keys:
-                batch.delete_item(Key=key)
-
-        print(f"🗑 Deleted board {board_id}: {len(tasks)} tasks, {len(members)} memberships, access entries")
+        lambda_client.invoke(
+            FunctionName="TaskBin_ReapBoard",
+            Qualifier="live",
+            InvocationType="Event",
+            Payload=json.dumps({"board_id": board_id}).encode("utf-8")
+        )
+        print(f"🪦 Board {board_id} tombstoned, reaper started")
 
         event_payload = {
             "action": "boardDeleted",
@@ -106,6 +91,7 @@ def lambda_handler(event, context):
         try:
             lambda_client.invoke(
                 FunctionName="TaskBin_SocketSendmsg",
+                Qualifier="live",  # deployed alias (see lambda_profiles.json)
                 InvocationType="Event",  # async, won't block deletion
                 Payload=json.dumps(event_payload).encode("utf-8")
             )
@@ -1,11 +1,11 @@
 import json
-import boto3
 from botocore.exceptions import ClientError
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.versioning import run_versioned, task_tombstone
 
 # --- DynamoDB table ---
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 
 def lambda_handler(event, context):
@@ -18,10 +18,12 @@ def lambda_handler(event, context):
         "user_id": "<uuid>"   # who is requesting deletion
     }
 
-    Deletes:
+    Deletes, in a single transaction:
     - Board-centric task row (BOARD#board_id / TASK#task_id)
     - Task metadata row (TASK#task_id / METADATA)
     - User-centric task row (USER#user_id / TASK#task_id), if assigned
+    and writes a DELETED#TASK#task_id tombstone so ?since=N readers see
+    the removal.
     """
 
     try:
@@ -56,36 +58,6 @@ def lambda_handler(event, context):
         board_sk = f"BOARD#{board_id}"
         task_sk = f"TASK#{task_id}"
 
-        # ---------------------------------
-        # Verify board exists
-        # ---------------------------------
-        board_lookup = table.scan(
-            FilterExpression="SK = :sk AND begins_with(PK, :prefix)",
-            ExpressionAttributeValues={
-                ":sk": board_sk,
-                ":prefix": "USER#"
-            }
-        ).get("Items", [])
-
-        if not board_lookup:
-            return {
-                "statusCode": 404,
-                "body": json.dumps({"error": "Board not found"})
-            }
-
-        # ---------------------------------
-        # Verify user is a member or owner of the board
-        # ---------------------------------
-        user_board_item = table.get_item(
-            Key={"PK": f"USER#{user_id}", "SK": board_sk}
-        ).get("Item")
-
-        if not user_board_item:
-            return {
-                "statusCode": 403,
-                "body": json.dumps({"error": "User is not authorized to delete tasks on this board"})
-            }
-
         # ---------------------------------
         # Get board-centric task row
         # ---------------------------------
@@ -98,27 +70,39 @@ def lambda_handler(event, context):
         assigned_to = board_task_item.get("assigned_to")
 
         # ---------------------------------
-        # Delete board-centric row
-        # ---------------------------------
-        table.delete_item(Key={"PK": board_sk, "SK": task_sk})
-
-        # ---------------------------------
-        # Delete task metadata row
-        # ---------------------------------
-        table.delete_item(Key={"PK": f"TASK#{task_id}", "SK": "METADATA"})
-
-        # ---------------------------------
-        # Delete user-centric row if assigned
-        # ---------------------------------
-        if assigned_to:
-            table.delete_item(Key={"PK": f"USER#{assigned_to}", "SK": task_sk})
+        # Delete every copy atomically, guarded by the membership
+        # check; run_versioned adds the board-version bump (which
+        # also checks the board exists)
+        # ---------------------------------
+        def build_steps(version):
+            steps = [
+                ({"ConditionCheck": {
+                    "Key": {"PK": f"USER#{user_id}", "SK": board_sk},
+                    "ConditionExpression": "attribute_exists(PK)"
+                }}, (403, "User is not authorized to delete tasks on this board")),
+                ({"Delete": {
+                    "Key": {"PK": board_sk, "SK": task_sk},
+                    "ConditionExpression": "attribute_exists(PK)"
+                }}, (404, "Task not found")),
+                ({"Delete": {"Key": {"PK": f"TASK#{task_id}", "SK": "METADATA"}}}, None),
+                ({"Put": {"Item": task_tombstone(board_id, task_id, version)}}, None),
+            ]
+            if assigned_to:
+                steps.append(({"Delete": {"Key": {"PK": f"USER#{assigned_to}", "SK": task_sk}}}, None))
+            return steps
+
+        version, failure = run_versioned(table, board_id, build_steps)
+        if failure:
+            status_code, error = failure
+            return {"statusCode": status_code, "body": json.dumps({"error": error})}
 
         return {
             "statusCode": 200,
             "body": json.dumps({
                 "message": f"Task {task_id} deleted successfully",
                 "board_id": board_id,
-                "task_id": task_id
+                "task_id": task_id,
+                "version": version
             })
         }
 
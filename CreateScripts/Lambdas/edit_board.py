@@ -1,11 +1,10 @@
 import json
-import boto3
 from botocore.exceptions import ClientError
+from taskbin_runtime.dynamo import get_table
 
 # --- DynamoDB table ---
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 def lambda_handler(event, context):
     """
@@ -38,19 +37,9 @@ def lambda_handler(event, context):
         board_pk = f"BOARD#{board_id}"
         metadata_sk = "METADATA"
 
-        # --- Get board metadata ---
-        metadata_resp = table.get_item(Key={"PK": board_pk, "SK": metadata_sk})
-        metadata_item = metadata_resp.get("Item")
-        if not metadata_item:
-            return {"statusCode": 404, "body": json.dumps({"error": "Board metadata not found"})}
-
-        # --- Check ownership ---
-        if metadata_item.get("owner_id") != user_id:
-            return {"statusCode": 403, "body": json.dumps({"error": "Only the owner can edit the board"})}
-
         # --- Prepare update expression ---
         update_expr = []
-        expr_values = {}
+        expr_values = {":owner": user_id}
 
         if new_name is not None:
             update_expr.append("board_name = :name")
@@ -62,45 +51,25 @@ def lambda_handler(event, context):
         if not update_expr:
             return {"statusCode": 400, "body": json.dumps({"error": "No fields to update"})}
 
-        update_expression_str = "SET " + ", ".join(update_expr)
-
-        # --- 1️⃣ Update metadata row ---
-        table.update_item(
-            Key={"PK": board_pk, "SK": metadata_sk},
-            UpdateExpression=update_expression_str,
-            ExpressionAttributeValues=expr_values
-        )
-
-        # --- 2️⃣ Update all board-centric task rows ---
-        board_tasks = table.query(
-            KeyConditionExpression=boto3.dynamodb.conditions.Key("PK").eq(board_pk) &
-                                   boto3.dynamodb.conditions.Key("SK").begins_with("TASK#")
-        ).get("Items", [])
-
-        for task in board_tasks:
+        # --- Single conditional write to the metadata row ---
+        # Board name/description live only on METADATA; list_boards and
+        # get_board resolve them at read time, so nothing else is rewritten.
+        try:
             table.update_item(
-                Key={"PK": task["PK"], "SK": task["SK"]},
-                UpdateExpression=update_expression_str,
-                ExpressionAttributeValues=expr_values
-            )
-
-        # --- 3️⃣ Update all user-centric task rows ---
-        # Scan for USER#<user_id> rows for this board
-        user_task_rows = table.scan(
-            FilterExpression="SK = :sk AND begins_with(PK, :prefix)",
-            ExpressionAttributeValues={
-                ":sk": f"BOARD#{board_id}",
-                ":prefix": "USER#"
-            }
-        ).get("Items", [])
-
-        for user_task in user_task_rows:
-            # Update only the user-centric tasks
-            table.update_item(
-                Key={"PK": user_task["PK"], "SK": user_task["SK"]},
-                UpdateExpression=update_expression_str,
+                Key={"PK": board_pk, "SK": metadata_sk},
+                UpdateExpression="SET " + ", ".join(update_expr),
+                ConditionExpression="attribute_exists(PK) AND attribute_not_exists(deleted_at) AND owner_id = :owner",
                 ExpressionAttributeValues=expr_values
             )
+        except ClientError as e:
+            if e.response["Error"]["Code"] != "ConditionalCheckFailedException":
+                raise
+
+            # Only on failure: read back to tell "missing" from "not owner"
+            metadata_item = table.get_item(Key={"PK": board_pk, "SK": metadata_sk}).get("Item")
+            if not metadata_item or metadata_item.get("deleted_at"):
+                return {"statusCode": 404, "body": json.dumps({"error": "Board metadata not found"})}
+            return {"statusCode": 403, "body": json.dumps({"error": "Only the owner can edit the board"})}
 
         return {
             "statusCode": 200,
@@ -1,12 +1,13 @@
 import json
-import boto3
 from datetime import datetime, timezone
 from botocore.exceptions import ClientError
+from taskbin_runtime.auth_cache import get_membership
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.versioning import run_versioned, version_update
 
 # --- DynamoDB ---
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 def lambda_handler(event, context):
     try:
@@ -43,19 +44,6 @@ def lambda_handler(event, context):
         board_id = metadata_item.get("board_id")
         board_pk = f"BOARD#{board_id}"
 
-        # ---------------------------------
-        # Verify the user is part of the board
-        # ---------------------------------
-        membership = table.get_item(
-            Key={"PK": f"USER#{user_id}", "SK": board_pk}
-        ).get("Item")
-
-        if not membership:
-            return {
-                "statusCode": 403,
-                "body": json.dumps({"error": "User is not a member of this board"})
-            }
-
         # ---------------------------------
         # Fetch board-centric task row
         # ---------------------------------
@@ -94,41 +82,84 @@ def lambda_handler(event, context):
                 update_expr.append(f"{key} = :{key}")
                 expr_values[f":{key}"] = val
 
-        # ---------------------------------
-        # Apply updates to board + metadata rows
-        # ---------------------------------
-        if update_expr:
-            update_str = "SET " + ", ".join(update_expr)
-
-            # Update board task row
-            table.update_item(
-                Key={"PK": board_pk, "SK": task_sk},
-                UpdateExpression=update_str,
-                ExpressionAttributeValues=expr_values
-            )
-
-            # Update metadata row
-            table.update_item(
-                Key={"PK": f"TASK#{task_id}", "SK": "METADATA"},
-                UpdateExpression=update_str,
-                ExpressionAttributeValues=expr_values
-            )
+        # Explicit null unassigns the task
+        remove_expr = ""
+        if "assigned_to" in body and body.get("assigned_to") is None:
+            remove_expr = " REMOVE assigned_to"
+
+        # (omitting assigned_to leaves the current assignee in place)
+        assigned_to = body.get("assigned_to", old_assigned_to)
+        exists = "attribute_exists(PK)"
 
         # ---------------------------------
-        # Handle reassignment
+        # Build the write set; every step commits together
         # ---------------------------------
-        assigned_to = body.get("assigned_to")
+        steps = [
+            ({"ConditionCheck": {
+                "Key": {"PK": f"USER#{user_id}", "SK": board_pk},
+                "ConditionExpression": exists
+            }}, (403, "User is not a member of this board")),
+        ]
+
+        # Board + metadata rows
+        if update_expr or remove_expr:
+            update_str = ("SET " + ", ".join(update_expr) if update_expr else "") + remove_expr
+
+            # Board task row also keeps its status index key in step and
+            # records the change version (values are filled per attempt)
+            version_set, version_names, _ = version_update(board_id, None)
+            board_set = update_expr + version_set
+            board_expr_values = dict(expr_values)
+            if editable_fields["task_status"] is not None:
+                board_set.append("GSI1PK = :gsi1pk")
+                board_expr_values[":gsi1pk"] = f"{board_pk}#STATUS#{editable_fields['task_status']}"
+
+            board_update = {
+                "Key": {"PK": board_pk, "SK": task_sk},
+                "UpdateExpression": "SET " + ", ".join(board_set) + remove_expr,
+                "ConditionExpression": exists,
+                "ExpressionAttributeNames": version_names,
+                "ExpressionAttributeValues": board_expr_values
+            }
+            metadata_update = {
+                "Key": {"PK": f"TASK#{task_id}", "SK": "METADATA"},
+                "UpdateExpression": update_str.strip(),
+                "ConditionExpression": exists
+            }
+            if expr_values:
+                metadata_update["ExpressionAttributeValues"] = expr_values
+
+            steps.append(({"Update": board_update}, (404, "Task not found on board")))
+            steps.append(({"Update": metadata_update}, (404, "Task metadata not found")))
 
         # Remove old user-task link
         if old_assigned_to and old_assigned_to != assigned_to:
-            table.delete_item(
-                Key={"PK": f"USER#{old_assigned_to}", "SK": task_sk}
-            )
+            steps.append(({"Delete": {
+                "Key": {"PK": f"USER#{old_assigned_to}", "SK": task_sk}
+            }}, None))
+
+        # Keep an unchanged user-task link in step with the edit
+        if assigned_to and assigned_to == old_assigned_to:
+            user_fields = {k: v for k, v in editable_fields.items() if k != "assigned_to" and v is not None}
+            if user_fields:
+                user_expr = [f"{key} = :{key}" for key in user_fields]
+                user_values = {f":{key}": val for key, val in user_fields.items()}
+                if "task_status" in user_fields:
+                    user_expr.append("GSI1PK = :gsi1pk")
+                    user_values[":gsi1pk"] = f"USER#{assigned_to}#STATUS#{user_fields['task_status']}"
+
+                steps.append(({"Update": {
+                    "Key": {"PK": f"USER#{assigned_to}", "SK": task_sk},
+                    "UpdateExpression": "SET " + ", ".join(user_expr),
+                    "ConditionExpression": exists,
+                    "ExpressionAttributeValues": user_values
+                }}, (409, "Task assignment changed concurrently, please retry")))
 
         # Add new user-task link
         if assigned_to and assigned_to != old_assigned_to:
-            table.put_item(
-                Item={
+            new_status = editable_fields.get("task_status") or board_task_item["task_status"]
+            steps.append(({"Put": {
+                "Item": {
                     "PK": f"USER#{assigned_to}",
                     "SK": task_sk,
                     "task_id": task_id,
@@ -138,17 +169,43 @@ def lambda_handler(event, context):
                     "created_at": board_task_item["created_at"],
                     "finish_by": editable_fields.get("finish_by") or board_task_item["finish_by"],
                     "created_by": board_task_item["created_by"],
-                    "task_status": editable_fields.get("task_status") or board_task_item["task_status"],
-                    "type": "user_task"
+                    "task_status": new_status,
+                    "type": "user_task",
+                    "GSI1PK": f"USER#{assigned_to}#STATUS#{new_status}",
+                    "GSI1SK": task_sk
                 }
-            )
+            }}, None))
+
+        # ---------------------------------
+        # Apply atomically with the board-version bump
+        # (a bare membership check is just a read)
+        # ---------------------------------
+        version = None
+        if len(steps) > 1:
+            def build_steps(next_version):
+                board_expr_values.update(version_update(board_id, next_version)[2])
+                return steps
+
+            version, failure = run_versioned(table, board_id, build_steps)
+        elif not get_membership(table, user_id, board_id):
+            failure = steps[0][1]
+        else:
+            failure = None
+
+        if failure:
+            status_code, error = failure
+            return {
+                "statusCode": status_code,
+                "body": json.dumps({"error": error})
+            }
 
         return {
             "statusCode": 200,
             "body": json.dumps({
                 "message": f"Task {task_id} updated successfully",
                 "task_id": task_id,
-                "board_id": board_id
+                "board_id": board_id,
+                "version": version
             })
         }
 
@@ -1,14 +1,16 @@
 import json
-import boto3
 import random
 import string
 from datetime import datetime, timedelta, timezone
 from botocore.exceptions import ClientError
+from taskbin_runtime.auth_cache import get_membership, membership_check
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.transactions import run_transaction
+from taskbin_runtime.versioning import live_board_check
 
 # --- DynamoDB table ---
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 
 # -------------------------------------------------------
@@ -31,7 +33,8 @@ def generate_unique_code():
         pk = f"ACCESS_CODE#{code}"
 
         resp = table.query(
-            KeyConditionExpression=boto3.dynamodb.conditions.Key("PK").eq(pk),
+            KeyConditionExpression="PK = :pk",
+            ExpressionAttributeValues={":pk": pk},
             Limit=1
         )
         if resp.get("Count", 0) == 0:
@@ -61,17 +64,15 @@ def lambda_handler(event, context):
                 "body": json.dumps({"error": "Missing board_id (in route) or user_id (in body)"})
             }
 
-        user_pk = f"USER#{user_id}"
-        board_sk = f"BOARD#{board_id}"
-
         # ----------------------------------------------
         # Check if user is a member/owner of the board
+        # (cached across warm invocations; re-checked when writing)
         # ----------------------------------------------
-        membership_resp = table.get_item(Key={"PK": user_pk, "SK": board_sk})
-        if "Item" not in membership_resp:
+        not_member = (403, "Not authorized: user is not a member/owner")
+        if not get_membership(table, user_id, board_id):
             return {
-                "statusCode": 403,
-                "body": json.dumps({"error": "Not authorized: user is not a member/owner"})
+                "statusCode": not_member[0],
+                "body": json.dumps({"error": not_member[1]})
             }
 
         # ----------------------------------------------
@@ -110,9 +111,15 @@ def lambda_handler(event, context):
 
         access_pk = f"ACCESS_CODE#{unique_code}"
 
-        # 1) (BOARD, ACCESS)
-        table.put_item(
-            Item={
+        # All three rows commit together, and only while the board is
+        # live (rows written after the reaper's pass would be orphaned)
+        # and the user still belongs to it
+        failure = run_transaction(table, [
+            live_board_check(board_id),
+            membership_check(user_id, board_id, not_member),
+
+            # 1) (BOARD, ACCESS)
+            ({"Put": {"Item": {
                 "PK": f"BOARD#{board_id}",
                 "SK": "ACCESS",
                 "type": "board_access",
@@ -121,12 +128,10 @@ def lambda_handler(event, context):
                 "created_at": now.isoformat(),
                 "expires_at": expires_at.isoformat(),
                 "ttl": ttl_epoch
-            }
-        )
+            }}}, None),
 
-        # 2) (ACCESS_CODE, ACCESS)
-        table.put_item(
-            Item={
+            # 2) (ACCESS_CODE, ACCESS)
+            ({"Put": {"Item": {
                 "PK": access_pk,
                 "SK": "ACCESS",
                 "type": "access_code_meta",
@@ -135,12 +140,10 @@ def lambda_handler(event, context):
                 "created_at": now.isoformat(),
                 "expires_at": expires_at.isoformat(),
                 "ttl": ttl_epoch
-            }
-        )
+            }}}, None),
 
-        # 3) (ACCESS_CODE, BOARD)
-        table.put_item(
-            Item={
+            # 3) (ACCESS_CODE, BOARD)
+            ({"Put": {"Item": {
                 "PK": access_pk,
                 "SK": f"BOARD#{board_id}",
                 "type": "access_code_link",
@@ -149,8 +152,11 @@ def lambda_handler(event, context):
                 "created_at": now.isoformat(),
                 "expires_at": expires_at.isoformat(),
                 "ttl": ttl_epoch
-            }
-        )
+            }}}, None),
+        ])
+        if failure:
+            status_code, error = failure
+            return {"statusCode": status_code, "body": json.dumps({"error": error})}
 
         return {
             "statusCode": 200,
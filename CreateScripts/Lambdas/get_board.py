@@ -1,9 +1,9 @@
 import json
-import boto3
-from boto3.dynamodb.conditions import Key
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.pagination import iter_query
+from taskbin_runtime.responses import etag_matches, make_etag, not_modified
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table("TaskBin")
+table = get_table("TaskBin")
 
 
 def lambda_handler(event, context):
@@ -22,45 +22,52 @@ def lambda_handler(event, context):
         }
 
     try:
-        result_boards = []
+        # --------------------------------------------
+        # Read every board's rows first; the ETag is a
+        # hash of what was read, so a 304 skips the build
+        # --------------------------------------------
+        raw_boards = []
 
         for board_id in board_ids:
 
             pk = f"BOARD#{board_id}"
 
             # --------------------------------------------
-            # Query ALL board rows (metadata + members)
+            # Fetch METADATA row
             # --------------------------------------------
-            resp = table.query(
-                KeyConditionExpression=Key("PK").eq(pk)
-            )
-            items = resp.get("Items", [])
-
-            if not items:
+            meta = table.get_item(Key={"PK": pk, "SK": "METADATA"}).get("Item")
+            if not meta or meta.get("deleted_at"):
                 continue
 
             # --------------------------------------------
-            # Extract METADATA row
+            # Read ALL members (SK starts with USER#), every page
             # --------------------------------------------
-            meta = next((i for i in items if i["SK"] == "METADATA"), None)
-            if not meta:
-                continue
+            member_items = list(iter_query(
+                table,
+                KeyConditionExpression="PK = :pk AND begins_with(SK, :prefix)",
+                ExpressionAttributeValues={":pk": pk, ":prefix": "USER#"}
+            ))
 
-            # --------------------------------------------
-            # Extract MEMBERS (SK starts with USER#)
-            # --------------------------------------------
-            members = []
-            for i in items:
-                if i["SK"].startswith("USER#"):
-                    members.append({
-                        "user_id": i.get("user_id"),
-                        "role": i.get("role", "member"),
-                        "joined_at": i.get("joined_at"),
-                    })
+            raw_boards.append((board_id, meta, member_items))
+
+        etag = make_etag("boards", raw_boards)
+        if etag_matches(event, etag):
+            return not_modified(etag)
+
+        # --------------------------------------------
+        # Build final board objects
+        # --------------------------------------------
+        result_boards = []
+        for board_id, meta, member_items in raw_boards:
+            members = [
+                {
+                    "user_id": i.get("user_id"),
+                    "role": i.get("role", "member"),
+                    "joined_at": i.get("joined_at"),
+                }
+                for i in member_items
+            ]
 
-            # --------------------------------------------
-            # Build final board object
-            # --------------------------------------------
             result_boards.append({
                 "id": meta.get("board_id", board_id),
                 "name": meta.get("board_name", ""),
@@ -72,6 +79,7 @@ def lambda_handler(event, context):
 
         return {
             "statusCode": 200,
+            "headers": {"ETag": etag},
             "body": json.dumps({"boards": result_boards})
         }
 
@@ -1,8 +1,9 @@
 import json
-import boto3
+from taskbin_runtime.batch import batch_get
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.responses import etag_matches, make_etag, not_modified
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table("TaskBin")
+table = get_table("TaskBin")
 
 def lambda_handler(event, context):
     path_task_id = event.get("pathParameters", {}).get("task_id")
@@ -20,15 +21,31 @@ def lambda_handler(event, context):
     try:
         keys = [{"PK": f"TASK#{tid}", "SK": "METADATA"} for tid in task_ids]
 
-        response = dynamodb.batch_get_item(
-            RequestItems={
-                "TaskBin": {
-                    "Keys": keys
-                }
-            }
+        items = list(batch_get(table, keys).values())
+
+        # Drop tasks whose board is gone or tombstoned (still being reaped)
+        boards = batch_get(
+            table,
+            [{"PK": f"BOARD#{i['board_id']}", "SK": "METADATA"} for i in items if i.get("board_id")],
+            projection="PK, SK, deleted_at"
         )
 
-        items = response["Responses"].get("TaskBin", [])
+        def board_live(item):
+            meta = boards.get((f"BOARD#{item.get('board_id')}", "METADATA"))
+            return meta is not None and not meta.get("deleted_at")
+
+        items = [i for i in items if board_live(i)]
+
+        if path_task_id and not items:
+            return {
+                "statusCode": 404,
+                "body": json.dumps({"error": "Task not found"})
+            }
+
+        # Hash of the rows read; a match skips building the body
+        etag = make_etag("tasks", sorted(items, key=lambda i: i["PK"]))
+        if etag_matches(event, etag):
+            return not_modified(etag)
 
         tasks = [
             {
@@ -37,7 +54,7 @@ def lambda_handler(event, context):
                 "description": item.get("description", ""),
                 "board_id": item.get("board_id", ""),
                 "assigned_to": item.get("assigned_to", ""),
-                "status": item.get("status", ""),
+                "status": item.get("task_status", ""),
                 "created_at": item.get("created_at", "")
             }
             for item in items
@@ -45,6 +62,7 @@ def lambda_handler(event, context):
 
         return {
             "statusCode": 200,
+            "headers": {"ETag": etag},
             "body": json.dumps({"tasks": tasks})
         }
 
@@ -1,11 +1,12 @@
 import json
-import boto3
 from datetime import datetime, timezone
 from botocore.exceptions import ClientError
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.transactions import run_transaction
+from taskbin_runtime.versioning import live_board_check
 
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 
 def lambda_handler(event, context):
@@ -52,55 +53,33 @@ def lambda_handler(event, context):
 
         board_sk = f"BOARD#{board_id}"
 
-        # ---------------------------------
-        # Verify the board exists
-        # ---------------------------------
-        owner_item = table.scan(
-            FilterExpression="SK = :sk AND begins_with(PK, :prefix)",
-            ExpressionAttributeValues={
-                ":sk": board_sk,
-                ":prefix": "USER#"
-            }
-        ).get("Items", [])
-
-        if not owner_item:
-            return {
-                "statusCode": 404,
-                "body": json.dumps({"error": "Board not found"})
-            }
-
-        # ---------------------------------
-        # Check if user already belongs to the board
-        # ---------------------------------
-        existing_resp = table.get_item(Key={"PK": user_pk, "SK": board_sk})
-        if "Item" in existing_resp:
-            return {
-                "statusCode": 409,
-                "body": json.dumps({"error": "User already joined this board"})
-            }
-
         # ---------------------------------
         # Create ISO timestamp
         # ---------------------------------
         now = datetime.now(timezone.utc).isoformat()
 
         # ---------------------------------
-        # Add membership rows
+        # Add membership rows in one transaction, guarded by the board
+        # being live (not deleted / being reaped) and the user not
+        # already belonging to it
         # ---------------------------------
-        table.put_item(
-            Item={
-                "PK": user_pk,
-                "SK": board_sk,
-                "board_id": board_id,
-                "user_id": user_id,
-                "role": "member",
-                "joined_at": now,
-                "type": "membership"
-            }
-        )
-
-        table.put_item(
-            Item={
+        failure = run_transaction(table, [
+            live_board_check(board_id),
+            ({"Put": {
+                "Item": {
+                    "PK": user_pk,
+                    "SK": board_sk,
+                    "board_id": board_id,
+                    "user_id": user_id,
+                    "role": "member",
+                    "joined_at": now,
+                    "type": "membership",
+                    "GSI1PK": board_sk,
+                    "GSI1SK": user_pk
+                },
+                "ConditionExpression": "attribute_not_exists(PK)"
+            }}, (409, "User already joined this board")),
+            ({"Put": {"Item": {
                 "PK": f"BOARD#{board_id}",
                 "SK": f"USER#{user_id}",
                 "board_id": board_id,
@@ -108,8 +87,14 @@ def lambda_handler(event, context):
                 "role": "member",
                 "joined_at": now,
                 "type": "board_user"
+            }}}, None),
+        ])
+        if failure:
+            status_code, error = failure
+            return {
+                "statusCode": status_code,
+                "body": json.dumps({"error": error})
             }
-        )
 
         return {
             "statusCode": 200,
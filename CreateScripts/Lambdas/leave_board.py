@@ -1,13 +1,14 @@
 import json
-import boto3
 from botocore.exceptions import ClientError
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.transactions import run_transaction
+from taskbin_runtime.versioning import live_board_check
 
 # --- DynamoDB single table name ---
 TABLE_NAME = "TaskBin"
 
 # --- Initialize DynamoDB resource ---
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 
 def lambda_handler(event, context):
@@ -61,9 +62,15 @@ def lambda_handler(event, context):
         # --- Delete both user-centric and board-centric rows ---
         board_member_key = {"PK": f"BOARD#{board_id}", "SK": f"USER#{user_id}"}
 
-        with table.batch_writer() as batch:
-            batch.delete_item(Key=user_board_key)
-            batch.delete_item(Key=board_member_key)
+        # (fails with 404 once the board is deleted, like the other membership writes)
+        failure = run_transaction(table, [
+            live_board_check(board_id),
+            ({"Delete": {"Key": user_board_key}}, None),
+            ({"Delete": {"Key": board_member_key}}, None)
+        ])
+        if failure:
+            status_code, error = failure
+            return {"statusCode": status_code, "body": json.dumps({"error": error})}
 
         return {
             "statusCode": 200,
@@ -1,11 +1,12 @@
 import json
-import boto3
 from botocore.exceptions import ClientError
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.pagination import iter_query
+from taskbin_runtime.versioning import board_version
 
 # --- DynamoDB table ---
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 def lambda_handler(event, context):
     """
@@ -38,17 +39,24 @@ def lambda_handler(event, context):
 
         board_sk = f"BOARD#{board_id}"
 
-        # --- 3. Query DynamoDB for members ---
-        response = table.scan(
-            FilterExpression="SK = :sk AND begins_with(PK, :prefix)",
+        # --- 3. Deleted boards (still being reaped) are gone to readers ---
+        if board_version(table, board_id) is None:
+            return {
+                "statusCode": 404,
+                "body": json.dumps({"error": "Board not found"})
+            }
+
+        # --- 4. Query the board-membership index for members ---
+        items = iter_query(
+            table,
+            IndexName="GSI1",
+            KeyConditionExpression="GSI1PK = :pk AND begins_with(GSI1SK, :prefix)",
             ExpressionAttributeValues={
-                ":sk": board_sk,
+                ":pk": board_sk,
                 ":prefix": "USER#"
             }
         )
 
-        items = response.get("Items", [])
-
         members = []
         for item in items:
             members.append({
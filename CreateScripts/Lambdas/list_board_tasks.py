@@ -1,17 +1,35 @@
 import json
-import boto3
 from botocore.exceptions import ClientError
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.pagination import InvalidPageRequest, page_params, query_page
+from taskbin_runtime.responses import etag_matches, make_etag, not_modified
+from taskbin_runtime.versioning import TOMBSTONE_PREFIX, board_version, sync_cursor
 
 # --- DynamoDB table ---
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 def lambda_handler(event, context):
     """
     Lambda to list tasks for a board.
     board_id is taken from the route path.
-    Optional "status" filter comes from body.
+    Optional "status" filter comes from ?status= or the body; it reads the
+    status-partitioned GSI1 (BOARD#<id>#STATUS#<status>) so only matching
+    tasks are read.
+    Paged with ?limit=<n>&next_token=<cursor>; the response carries the
+    next_token for the following page (null on the last one).
+
+    Delta sync: ?since=<version> reads the change index (GSI2) instead and
+    returns only tasks changed after that board version plus the ids of
+    tasks deleted since then ("deleted"); it cannot be combined with status.
+    Every response carries a "version" cursor for the next `since`: the
+    board version (read consistently, before a consistent partition query)
+    for a full listing, or the last settled change returned for a delta
+    (see versioning.sync_cursor). Clients only ever move their cursor forward.
+
+    Only responses that are consistent with the board version get an ETag
+    (the full listing and an up-to-date delta); a matching If-None-Match
+    gets a 304 without querying any tasks.
     """
     try:
         print("EVENT:", json.dumps(event))  # helpful for debugging
@@ -40,35 +58,97 @@ def lambda_handler(event, context):
         else:
             body = {}
 
-        status_filter = body.get("status")
+        params = event.get("queryStringParameters") or {}
+        status_filter = params.get("status") or body.get("status")
+        since = params.get("since", body.get("since"))
+        limit, next_token = page_params(event, body)
+
+        if since not in (None, ""):
+            try:
+                since = int(since)
+            except (TypeError, ValueError):
+                since = -1
+            if since < 0:
+                return {
+                    "statusCode": 400,
+                    "body": json.dumps({"error": "since must be a non-negative integer"})
+                }
+            if status_filter:
+                return {
+                    "statusCode": 400,
+                    "body": json.dumps({"error": "since cannot be combined with status"})
+                }
+        else:
+            since = None
+
+        # Read the version first so nothing newer is skipped by the next since=
+        version = board_version(table, board_id, consistent=True)
+        if version is None:
+            return {
+                "statusCode": 404,
+                "body": json.dumps({"error": "Board not found"})
+            }
+
+        # Every task write bumps the version, so it pins the full listing
+        # and a delta that is already caught up. GSI-backed pages may lag
+        # the version and are never cached.
+        etag = None
+        if not status_filter and (since is None or since >= version):
+            etag = make_etag("tasks", board_id, version, since, limit, next_token)
+            if etag_matches(event, etag):
+                return not_modified(etag)
+
+        if since is not None and since >= version:
+            return {
+                "statusCode": 200,
+                "headers": {"ETag": etag},
+                "body": json.dumps({"tasks": [], "deleted": [], "version": since, "next_token": None})
+            }
 
         # ----------------------------
-        # 3. Query DynamoDB
+        # 3. Query one page from DynamoDB
+        #    (since → change index on GSI2,
+        #     status filter → status partition on GSI1)
         # ----------------------------
         board_pk = f"BOARD#{board_id}"
         sk_prefix = "TASK#"
 
-        response = table.query(
-            KeyConditionExpression="PK = :pk AND begins_with(SK, :sk)",
-            ExpressionAttributeValues={
-                ":pk": board_pk,
-                ":sk": sk_prefix
+        if since is not None:
+            query_kwargs = {
+                "IndexName": "GSI2",
+                "KeyConditionExpression": "GSI2PK = :pk AND GSI2SK > :since",
+                "ExpressionAttributeValues": {":pk": board_pk, ":since": since}
+            }
+        elif status_filter:
+            query_kwargs = {
+                "IndexName": "GSI1",
+                "KeyConditionExpression": "GSI1PK = :pk AND begins_with(GSI1SK, :sk)",
+                "ExpressionAttributeValues": {
+                    ":pk": f"{board_pk}#STATUS#{status_filter}",
+                    ":sk": sk_prefix
+                }
+            }
+        else:
+            query_kwargs = {
+                "KeyConditionExpression": "PK = :pk AND begins_with(SK, :sk)",
+                "ExpressionAttributeValues": {
+                    ":pk": board_pk,
+                    ":sk": sk_prefix
+                },
+                "ConsistentRead": True
             }
-        )
-
-        items = response.get("Items", [])
 
-        # ----------------------------
-        # 4. Optional filter
-        # ----------------------------
-        if status_filter:
-            items = [item for item in items if item.get("status") == status_filter]
+        items, next_token = query_page(table, limit, next_token, **query_kwargs)
 
         # ----------------------------
-        # 5. Format response
+        # 4. Format response
         # ----------------------------
         tasks = []
+        deleted = []
         for item in items:
+            if item["SK"].startswith(TOMBSTONE_PREFIX):
+                deleted.append(item.get("task_id"))
+                continue
             tasks.append({
                 "task_id": item.get("task_id"),
                 "title": item.get("title"),
@@ -77,13 +157,25 @@ def lambda_handler(event, context):
                 "finish_by": item.get("finish_by"),
                 "created_by": item.get("created_by"),
                 "assigned_to": item.get("assigned_to"),
-                "task_status": item.get("task_status")
+                "task_status": item.get("task_status"),
+                "version": int(item.get("version", 0))
             })
 
-        return {
+        result = {"tasks": tasks, "version": version, "next_token": next_token}
+        if since is not None:
+            result["deleted"] = deleted
+            result["version"] = sync_cursor(since, items)
+
+        response = {
             "statusCode": 200,
-            "body": json.dumps({"tasks": tasks})
+            "body": json.dumps(result)
         }
+        if etag:
+            response["headers"] = {"ETag": etag}
+        return response
+
+    except InvalidPageRequest as e:
+        return {"statusCode": 400, "body": json.dumps({"error": str(e)})}
 
     except ClientError as e:
         print("DynamoDB error:", e)
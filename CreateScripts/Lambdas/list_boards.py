@@ -1,33 +1,43 @@
-import boto3
 import json
+from taskbin_runtime.batch import batch_get
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.pagination import InvalidPageRequest, page_params, query_page
 
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table("TaskBin")
+table = get_table("TaskBin")
 
 def lambda_handler(event, context):
     user_id = event["pathParameters"]["user_id"]
 
-    # Step 1: Fetch USER#email → BOARD#id membership items
+    try:
+        limit, next_token = page_params(event)
+    except InvalidPageRequest as e:
+        return {"statusCode": 400, "body": json.dumps({"error": str(e)})}
+
+    # Step 1: Fetch one page of USER#email → BOARD#id membership items
     pk = f"USER#{user_id}"
-    response = table.query(
-        KeyConditionExpression="PK = :pk",
-        ExpressionAttributeValues={":pk": pk}
+    items, next_token = query_page(
+        table,
+        limit,
+        next_token,
+        KeyConditionExpression="PK = :pk AND begins_with(SK, :sk)",
+        ExpressionAttributeValues={":pk": pk, ":sk": "BOARD#"}
+    )
+
+    # Step 2: Fetch BOARD#id metadata for the whole page in batches
+    metadata_by_key = batch_get(
+        table,
+        [{"PK": f"BOARD#{item['board_id']}", "SK": "METADATA"} for item in items]
     )
 
-    items = response.get("Items", [])
     boards = []
 
     for item in items:
-        if item.get("type") != "membership":
-            continue
-
         board_id = item["board_id"]
+        metadata = metadata_by_key.get((f"BOARD#{board_id}", "METADATA"))
 
-        # Step 2: Fetch BOARD#id metadata
-        meta_resp = table.get_item(
-            Key={"PK": f"BOARD#{board_id}", "SK": "METADATA"}
-        )
-        metadata = meta_resp.get("Item", {})
+        # Deleted (tombstoned or already reaped) boards are hidden
+        if not metadata or metadata.get("deleted_at"):
+            continue
 
         boards.append({
             "id": board_id,
@@ -40,5 +50,5 @@ def lambda_handler(event, context):
 
     return {
         "statusCode": 200,
-        "body": json.dumps({"boards": boards})
+        "body": json.dumps({"boards": boards, "next_token": next_token})
     }
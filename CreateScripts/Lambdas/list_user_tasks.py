@@ -1,18 +1,21 @@
 import json
-import boto3
 from botocore.exceptions import ClientError
+from taskbin_runtime.batch import batch_get
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.pagination import InvalidPageRequest, page_params, query_page
 
 # --- DynamoDB table ---
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 def lambda_handler(event, context):
     """
     Lambda to list tasks assigned to a user.
     user_id is grabbed from the route: /users/{user_id}/tasks
     Optional filters: board_id, task_status
-    Returns:
+    (task_status reads the USER#<id>#STATUS#<status> partition on GSI1)
+    Paged with ?limit=<n>&next_token=<cursor>
+    Returns (under "tasks", alongside "next_token"):
     [
         {
             "task_id": "<task-uuid>",
@@ -48,38 +51,52 @@ def lambda_handler(event, context):
 
         board_filter = body.get("board_id")
         task_status_filter = body.get("task_status")
+        limit, next_token = page_params(event, body)
 
         user_pk = f"USER#{user_id}"
         sk_prefix = "TASK#"
 
         # -----------------------------
-        # Query all tasks for the user
+        # Query one page of tasks for the user
         # -----------------------------
-        response = table.query(
-            KeyConditionExpression="PK = :pk AND begins_with(SK, :sk)",
-            ExpressionAttributeValues={
-                ":pk": user_pk,
-                ":sk": sk_prefix
+        if task_status_filter:
+            query_kwargs = {
+                "IndexName": "GSI1",
+                "KeyConditionExpression": "GSI1PK = :pk AND begins_with(GSI1SK, :sk)",
+                "ExpressionAttributeValues": {
+                    ":pk": f"{user_pk}#STATUS#{task_status_filter}",
+                    ":sk": sk_prefix
+                }
+            }
+        else:
+            query_kwargs = {
+                "KeyConditionExpression": "PK = :pk AND begins_with(SK, :sk)",
+                "ExpressionAttributeValues": {
+                    ":pk": user_pk,
+                    ":sk": sk_prefix
+                }
             }
-        )
-
-        items = response.get("Items", [])
 
-        # Apply optional filters
+        # Board filter is applied server-side so pages stay full
         if board_filter:
-            items = [item for item in items if item.get("board_id") == board_filter]
-        if task_status_filter:
-            items = [item for item in items if item.get("task_status") == task_status_filter]
+            query_kwargs["FilterExpression"] = "board_id = :board_id"
+            query_kwargs["ExpressionAttributeValues"][":board_id"] = board_filter
+
+        items, next_token = query_page(table, limit, next_token, **query_kwargs)
 
         # -----------------------------
         # Format output and include metadata
         # -----------------------------
+        # Fetch every task's metadata in chunked, concurrent BatchGetItem calls
+        metadata_by_key = batch_get(
+            table,
+            [{"PK": f"TASK#{item.get('task_id')}", "SK": "METADATA"} for item in items]
+        )
+
         tasks = []
         for item in items:
             task_id = item.get("task_id")
-            # Fetch task metadata
-            metadata_resp = table.get_item(Key={"PK": f"TASK#{task_id}", "SK": "METADATA"})
-            metadata_item = metadata_resp.get("Item", {})
+            metadata_item = metadata_by_key.get((f"TASK#{task_id}", "METADATA"), {})
 
             tasks.append({
                 "task_id": task_id,
@@ -96,9 +113,12 @@ def lambda_handler(event, context):
 
         return {
             "statusCode": 200,
-            "body": json.dumps({"tasks": tasks})
+            "body": json.dumps({"tasks": tasks, "next_token": next_token})
         }
 
+    except InvalidPageRequest as e:
+        return {"statusCode": 400, "body": json.dumps({"error": str(e)})}
+
     except ClientError as e:
         print("DynamoDB error:", e)
         return {"statusCode": 500, "body": json.dumps({"error": str(e)})}
@@ -0,0 +1,119 @@
+import json
+import boto3
+from taskbin_runtime.dynamo import get_table
+
+TABLE_NAME = "TaskBin"
+table = get_table(TABLE_NAME)
+lambda_client = boto3.client("lambda")
+
+PAGE_SIZE = 200
+# Hand off to a fresh invocation once less than this much time is left
+REINVOKE_MARGIN_MS = 15_000
+
+
+def _delete_partition_page(batch, board_id, items):
+    """Delete one page of BOARD#<id> rows plus the rows that mirror them."""
+    board_pk = f"BOARD#{board_id}"
+    counts = {"tasks": 0, "members": 0, "other": 0}
+
+    for item in items:
+        sk = item["SK"]
+        if sk == "METADATA":
+            continue  # tombstone stays until the very end
+
+        batch.delete_item(Key={"PK": board_pk, "SK": sk})
+
+        if sk.startswith("TASK#"):
+            batch.delete_item(Key={"PK": sk, "SK": "METADATA"})
+            if item.get("assigned_to"):
+                batch.delete_item(Key={"PK": f"USER#{item['assigned_to']}", "SK": sk})
+            counts["tasks"] += 1
+        elif sk.startswith("USER#"):
+            batch.delete_item(Key={"PK": sk, "SK": board_pk})  # USER->BOARD twin
+            counts["members"] += 1
+        else:
+            counts["other"] += 1  # ACCESS, CONNECTION#...
+
+    return counts
+
+
+def lambda_handler(event, context):
+    """
+    Background cleanup for a tombstoned board (see delete_board.py).
+
+    Pages through the board partition, then the GSI1 membership rows, deleting
+    in batches. If time runs short it re-invokes itself with the cursor in
+    the event, so boards of any size are fully removed. METADATA goes last.
+
+    Event: {"board_id": str, "phase"?: "partition"|"members", "cursor"?: dict}
+    """
+    board_id = event["board_id"]
+    board_pk = f"BOARD#{board_id}"
+    phase = event.get("phase", "partition")
+    cursor = event.get("cursor")
+
+    meta = table.get_item(Key={"PK": board_pk, "SK": "METADATA"}).get("Item")
+    if meta and not meta.get("deleted_at"):
+        print(f"⚠️ Board {board_id} is not tombstoned, refusing to reap")
+        return {"statusCode": 409, "body": json.dumps({"error": "Board is not marked deleted"})}
+
+    totals = {"tasks": 0, "members": 0, "other": 0}
+    done = False
+
+    with table.batch_writer(overwrite_by_pkeys=["PK", "SK"]) as batch:
+        while True:
+            if phase == "partition":
+                query_kwargs = {
+                    "KeyConditionExpression": "PK = :pk",
+                    "ExpressionAttributeValues": {":pk": board_pk},
+                    "ProjectionExpression": "PK, SK, assigned_to",
+                }
+            else:
+                # Memberships written only as USER#u/BOARD#b (owner, shares)
+                query_kwargs = {
+                    "IndexName": "GSI1",
+                    "KeyConditionExpression": "GSI1PK = :pk AND begins_with(GSI1SK, :prefix)",
+                    "ExpressionAttributeValues": {":pk": board_pk, ":prefix": "USER#"},
+                    "ProjectionExpression": "PK, SK",
+                }
+            if cursor:
+                query_kwargs["ExclusiveStartKey"] = cursor
+
+            resp = table.query(Limit=PAGE_SIZE, **query_kwargs)
+            items = resp.get("Items", [])
+
+            if phase == "partition":
+                for key, count in _delete_partition_page(batch, board_id, items).items():
+                    totals[key] += count
+            else:
+                for item in items:
+                    batch.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
+                totals["members"] += len(items)
+
+            cursor = resp.get("LastEvaluatedKey")
+            if not cursor:
+                if phase == "partition":
+                    phase = "members"
+                    continue
+                done = True
+                break
+
+            if context.get_remaining_time_in_millis() < REINVOKE_MARGIN_MS:
+                break
+
+        if done:
+            # Everything else is gone; drop the tombstone
+            batch.delete_item(Key={"PK": board_pk, "SK": "METADATA"})
+
+    if not done:
+        # Pending deletes are flushed above; continue from the cursor
+        lambda_client.invoke(
+            FunctionName=context.invoked_function_arn,
+            InvocationType="Event",
+            Payload=json.dumps({"board_id": board_id, "phase": phase, "cursor": cursor}).encode("utf-8")
+        )
+        print(f"⏭ Board {board_id}: {totals} so far, continuing in a new invocation ({phase})")
+        return {"statusCode": 202, "body": json.dumps({"board_id": board_id, "deleted": totals, "done": False})}
+
+    print(f"🗑 Reaped board {board_id}: {totals}")
+    return {"statusCode": 200, "body": json.dumps({"board_id": board_id, "deleted": totals, "done": True})}
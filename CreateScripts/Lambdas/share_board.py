@@ -1,11 +1,13 @@
 import json
-import boto3
 from datetime import datetime, timezone
 from botocore.exceptions import ClientError
+from taskbin_runtime.auth_cache import get_membership, membership_check
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.transactions import run_transaction
+from taskbin_runtime.versioning import live_board_check
 
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 def lambda_handler(event, context):
     """
@@ -26,6 +28,8 @@ def lambda_handler(event, context):
     role = "editor" or "viewer"
     joined_at = ISO timestamp
     type = "board_membership"
+    GSI1PK = f"BOARD#{board_id}"          # board-membership index
+    GSI1SK = f"USER#{share_with_user_id}"
     """
 
     try:
@@ -52,12 +56,13 @@ def lambda_handler(event, context):
 
         # ---------------------------------
         # Verify invoking user is a member of the board
+        # (cached across warm invocations; re-checked when writing)
         # ---------------------------------
-        resp = table.get_item(Key={"PK": f"USER#{user_id}", "SK": board_sk})
-        if "Item" not in resp:
+        not_member = (403, "Invoking user is not a member of this board")
+        if not get_membership(table, user_id, board_id):
             return {
-                "statusCode": 403,
-                "body": json.dumps({"error": "Invoking user is not a member of this board"})
+                "statusCode": not_member[0],
+                "body": json.dumps({"error": not_member[1]})
             }
 
         # ---------------------------------
@@ -70,10 +75,21 @@ def lambda_handler(event, context):
             "board_id": board_id,
             "role": role,
             "joined_at": datetime.now(timezone.utc).isoformat(),
-            "type": "board_membership"
+            "type": "board_membership",
+            "GSI1PK": board_sk,
+            "GSI1SK": f"USER#{target_user_id}"
         }
 
-        table.put_item(Item=membership_item)
+        # Only while the board is live (the reaper would miss a late row)
+        # and the invoking user is still a member
+        failure = run_transaction(table, [
+            live_board_check(board_id),
+            membership_check(user_id, board_id, not_member),
+            ({"Put": {"Item": membership_item}}, None),
+        ])
+        if failure:
+            status_code, error = failure
+            return {"statusCode": status_code, "body": json.dumps({"error": error})}
 
         return {
             "statusCode": 200,
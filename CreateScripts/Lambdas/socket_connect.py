@@ -1,16 +1,22 @@
 import json
-import boto3
 import datetime
+from taskbin_runtime.dynamo import get_table
 
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
+
+# API Gateway closes WebSocket connections after 2 hours at most, so any
+# connection row older than this was orphaned by a missed $disconnect.
+CONNECTION_TTL_SECONDS = 3 * 60 * 60
 
 def lambda_handler(event, context):
     """
     Stores a WebSocket connection when a client connects.
     Expects query params:
       ?user_id=<email>&board_id=<uuid>
+
+    The row is also keyed by connection id on GSI1
+    (GSI1PK = CONNECTION#<id>) so $disconnect can find it without a scan.
     """
 
     try:
@@ -26,7 +32,7 @@ def lambda_handler(event, context):
                 "body": json.dumps({"error": "Missing user_id or board_id"})
             }
 
-        now = datetime.datetime.now(datetime.timezone.utc).isoformat()
+        now = datetime.datetime.now(datetime.timezone.utc)
 
         table.put_item(
             Item={
@@ -35,7 +41,10 @@ def lambda_handler(event, context):
                 "type": "connection",
                 "board_id": board_id,
                 "user_id": user_id,
-                "connected_at": now
+                "connected_at": now.isoformat(),
+                "GSI1PK": f"CONNECTION#{connection_id}",
+                "GSI1SK": f"BOARD#{board_id}",
+                "ttl": int(now.timestamp()) + CONNECTION_TTL_SECONDS
             }
         )
 
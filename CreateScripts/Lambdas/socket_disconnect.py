@@ -1,9 +1,8 @@
 import json
-import boto3
+from taskbin_runtime.dynamo import get_table
 
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 def lambda_handler(event, context):
     """
@@ -13,17 +12,20 @@ def lambda_handler(event, context):
     try:
         connection_id = event["requestContext"]["connectionId"]
 
-        # Query to find board owning this connection
-        resp = table.scan(
-            FilterExpression="begins_with(SK, :sk)",
-            ExpressionAttributeValues={":sk": f"CONNECTION#{connection_id}"}
+        # Look up every row for this connection via its GSI1 key
+        resp = table.query(
+            IndexName="GSI1",
+            KeyConditionExpression="GSI1PK = :pk",
+            ExpressionAttributeValues={":pk": f"CONNECTION#{connection_id}"},
+            ProjectionExpression="PK, SK"
         )
 
         items = resp.get("Items", [])
 
-        # Remove each match
-        for item in items:
-            table.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
+        # Remove all matches in one batch
+        with table.batch_writer() as batch:
+            for item in items:
+                batch.delete_item(Key={"PK": item["PK"], "SK": item["SK"]})
 
         return {"statusCode": 200, "body": "Disconnected"}
 
@@ -1,11 +1,15 @@
 import os
 import json
+import time
 import boto3
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.pagination import iter_query
 
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 # ------------------------------------------------------------------
 # WS_ENDPOINT is now injected by BuildMain during deployment
@@ -16,13 +20,62 @@ WS_ENDPOINT = os.environ.get("WS_ENDPOINT")
 if not WS_ENDPOINT:
     raise ValueError("Missing WS_ENDPOINT environment variable.")
 
+# Upper bound on concurrent post_to_connection calls per broadcast
+MAX_WORKERS = int(os.environ.get("BROADCAST_MAX_WORKERS", "32"))
+
 # Build API Gateway Management API client dynamically
+# (clients are thread-safe; size the HTTP pool to match the worker pool)
 apigateway = boto3.client(
     "apigatewaymanagementapi",
-    endpoint_url=WS_ENDPOINT
+    endpoint_url=WS_ENDPOINT,
+    config=Config(max_pool_connections=MAX_WORKERS)
 )
 
 
+def _post(connection_id, data):
+    """Send one frame; returns "sent", "stale" or "failed"."""
+    try:
+        apigateway.post_to_connection(Data=data, ConnectionId=connection_id)
+        return "sent"
+    except apigateway.exceptions.GoneException:
+        return "stale"
+    except Exception as e:
+        print(f"❌ Error sending to {connection_id}:", e)
+        return "failed"
+
+
+def broadcast(connections, message):
+    """
+    Fan a message out to every connection row.
+
+    The message is serialized once, posted through a bounded thread pool,
+    and connections API Gateway reports as gone are removed in a single
+    batch_writer pass. Returns counts plus elapsed milliseconds.
+    """
+    started = time.perf_counter()
+    data = json.dumps(message).encode("utf-8")
+
+    conn_ids = [conn["SK"].split("#", 1)[1] for conn in connections]
+    workers = max(1, min(MAX_WORKERS, len(conn_ids)))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        results = list(pool.map(lambda cid: _post(cid, data), conn_ids))
+
+    stale = [conn for conn, result in zip(connections, results) if result == "stale"]
+    if stale:
+        with table.batch_writer() as batch:
+            for conn in stale:
+                batch.delete_item(Key={"PK": conn["PK"], "SK": conn["SK"]})
+
+    return {
+        "connections": len(connections),
+        "sent": results.count("sent"),
+        "stale": len(stale),
+        "failed": results.count("failed"),
+        "latency_ms": round((time.perf_counter() - started) * 1000, 1)
+    }
+
+
 def lambda_handler(event, context):
     """
     Broadcasts a message to all connections for a board.
@@ -62,14 +115,15 @@ def lambda_handler(event, context):
     # Query all WebSocket connections for this board
     # ---------------------------
     try:
-        resp = table.query(
+        connections = list(iter_query(
+            table,
             KeyConditionExpression="PK = :pk AND begins_with(SK, :sk)",
             ExpressionAttributeValues={
                 ":pk": f"BOARD#{board_id}",
                 ":sk": "CONNECTION#"
-            }
-        )
-        connections = resp.get("Items", [])
+            },
+            ProjectionExpression="PK, SK"
+        ))
 
     except Exception as e:
         print("❌ DynamoDB query error:", e)
@@ -86,29 +140,13 @@ def lambda_handler(event, context):
     }
 
     # ---------------------------
-    # Send message to each live connection
+    # Fan out to every live connection
     # ---------------------------
-    disconnected = 0
-    sent = 0
-
-    for conn in connections:
-        connection_id = conn["SK"].split("#")[1]
-
-        try:
-            apigateway.post_to_connection(
-                Data=json.dumps(message_to_send),
-                ConnectionId=connection_id
-            )
-            sent += 1
-
-        except apigateway.exceptions.GoneException:
-            # Stale connection — remove it
-            table.delete_item(Key={"PK": conn["PK"], "SK": conn["SK"]})
-            disconnected += 1
-
-        except Exception as e:
-            print(f"❌ Error sending to {connection_id}:", e)
+    stats = broadcast(connections, message_to_send)
 
-    print(f"📡 Broadcast complete → sent={sent}, removed stale={disconnected}")
+    print(
+        f"📡 Broadcast complete → sent={stats['sent']}, removed stale={stats['stale']}, "
+        f"failed={stats['failed']}, latency={stats['latency_ms']}ms"
+    )
 
-    return {"statusCode": 200, "body": "Message broadcasted"}
+    return {"statusCode": 200, "body": json.dumps({"message": "Message broadcasted", **stats})}
@@ -0,0 +1,72 @@
+import boto3
+from taskbin_runtime.dynamo import deserialize
+from taskbin_runtime.responses import dumps
+
+lambda_client = boto3.client("lambda")
+
+BROADCAST_FUNCTION = "TaskBin_SocketSendmsg"
+# WebSocket frames max out at 128 KB; above this, clients are told to refetch
+MAX_INLINE_BYTES = 96 * 1024
+
+
+def _task_change(record):
+    """Turn one stream record into (board_id, change) for BOARD#/TASK# rows."""
+    ddb = record["dynamodb"]
+    keys = deserialize(ddb["Keys"])
+    pk, sk = keys["PK"], keys["SK"]
+
+    if not (pk.startswith("BOARD#") and sk.startswith("TASK#")):
+        return None
+
+    change = {"task_id": sk.split("#", 1)[1], "event": record["eventName"]}
+    if record["eventName"] != "REMOVE" and "NewImage" in ddb:
+        task = deserialize(ddb["NewImage"])
+        # Index keys are storage details, not task fields
+        for attr in ("PK", "SK", "GSI1PK", "GSI1SK", "GSI2PK", "GSI2SK"):
+            task.pop(attr, None)
+        change["task"] = task
+
+    return pk.split("#", 1)[1], change
+
+
+def lambda_handler(event, context):
+    """
+    DynamoDB stream consumer: pushes task changes to a board's WebSocket
+    clients.
+
+    Changes in one batch are coalesced per board (last change per task
+    wins) and sent as a single "tasksChanged" broadcast per board through
+    TaskBin_SocketSendmsg.
+    """
+    by_board = {}
+
+    for record in event.get("Records", []):
+        parsed = _task_change(record)
+        if parsed:
+            board_id, change = parsed
+            by_board.setdefault(board_id, {})[change["task_id"]] = change
+
+    for board_id, changes in by_board.items():
+        payload = {"changes": list(changes.values())}
+
+        # Too big to inline: send ids only and let clients reload the list
+        if len(dumps(payload)) > MAX_INLINE_BYTES:
+            payload = {
+                "changes": [{"task_id": c["task_id"], "event": c["event"]} for c in changes.values()],
+                "refresh": True
+            }
+
+        lambda_client.invoke(
+            FunctionName=BROADCAST_FUNCTION,
+            Qualifier="live",
+            InvocationType="Event",
+            Payload=dumps({
+                "action": "tasksChanged",
+                "board_id": board_id,
+                "user_id": "stream",
+                "payload": payload
+            }).encode("utf-8")
+        )
+
+    print(f"📡 tasksChanged → {len(by_board)} board(s), {sum(len(c) for c in by_board.values())} task(s)")
+    return {"boards": len(by_board)}
@@ -0,0 +1,4 @@
+"""
+Shared runtime for every TaskBin Lambda handler, deployed as the
+TaskBin_Runtime Lambda layer (see CreateLambdas._publish_runtime_layer).
+"""
@@ -0,0 +1,77 @@
+import time
+from collections import OrderedDict
+
+# Module-level, so entries survive across warm invocations of one Lambda
+# container. Containers cannot invalidate each other, so a cached entry is
+# only ever a hint:
+#
+# - A write that depends on membership re-checks it with membership_check
+#   inside its own transaction, so a revoked member's write still fails.
+# - A read-only answer based on a cached membership can lag a revocation by
+#   up to MEMBERSHIP_TTL_SECONDS; that is the accepted staleness bound.
+# - A cached board version is verified by the bump's condition in
+#   versioning.run_versioned (which also catches deleted boards).
+#
+# Only positive lookups are cached: a user who just joined is never refused
+# because of a stale miss.
+
+MEMBERSHIP_TTL_SECONDS = 30
+VERSION_TTL_SECONDS = 30
+MAX_ENTRIES = 512
+
+
+class TTLCache:
+    """Small LRU map whose entries expire `ttl` seconds after being stored."""
+
+    def __init__(self, maxsize=MAX_ENTRIES, ttl=30):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key, value):
+        self._entries[key] = (value, time.monotonic() + self.ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        self._entries.pop(key, None)
+
+    def clear(self):
+        self._entries.clear()
+
+
+memberships = TTLCache(ttl=MEMBERSHIP_TTL_SECONDS)
+board_versions = TTLCache(ttl=VERSION_TTL_SECONDS)
+
+
+def get_membership(table, user_id, board_id):
+    """Return the USER#<user_id>/BOARD#<board_id> row, or None if not a member."""
+    key = (user_id, board_id)
+    item = memberships.get(key)
+    if item is None:
+        item = table.get_item(Key={"PK": f"USER#{user_id}", "SK": f"BOARD#{board_id}"}).get("Item")
+        if item:
+            memberships.set(key, item)
+    return item
+
+
+def membership_check(user_id, board_id, failure):
+    """run_transaction step that re-checks a (possibly cached) membership at write time."""
+    return ({"ConditionCheck": {
+        "Key": {"PK": f"USER#{user_id}", "SK": f"BOARD#{board_id}"},
+        "ConditionExpression": "attribute_exists(PK)"
+    }}, failure)
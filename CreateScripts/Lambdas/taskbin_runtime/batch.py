@@ -0,0 +1,57 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from taskbin_runtime.dynamo import deserialize, serialize
+
+BATCH_GET_LIMIT = 100   # DynamoDB maximum keys per BatchGetItem
+MAX_RETRIES = 6
+BASE_BACKOFF = 0.05     # seconds, doubled on every retry
+MAX_WORKERS = 8
+
+
+def _get_chunk(client, table_name, keys, projection=None):
+    """BatchGetItem one chunk, retrying UnprocessedKeys with exponential backoff."""
+    items = []
+    request = {"Keys": [serialize(k) for k in keys]}
+    if projection:
+        request["ProjectionExpression"] = projection
+
+    for attempt in range(MAX_RETRIES + 1):
+        resp = client.batch_get_item(RequestItems={table_name: request})
+        items.extend(deserialize(i) for i in resp.get("Responses", {}).get(table_name, []))
+
+        unprocessed = resp.get("UnprocessedKeys", {}).get(table_name)
+        if not unprocessed:
+            return items
+        if attempt == MAX_RETRIES:
+            break
+
+        request = unprocessed
+        time.sleep(BASE_BACKOFF * (2 ** attempt))
+
+    raise RuntimeError(f"BatchGetItem left {len(request['Keys'])} keys unprocessed after {MAX_RETRIES} retries")
+
+
+def batch_get(table, keys, projection=None):
+    """
+    Fetch many items by primary key with as few round trips as possible.
+
+    Keys are de-duplicated, split into chunks of 100 and fetched
+    concurrently. Returns a dict mapping (PK, SK) -> item; keys that do not
+    exist are simply absent. A projection must include PK and SK.
+    """
+    unique = list({(k["PK"], k["SK"]): k for k in keys}.values())
+    if not unique:
+        return {}
+
+    # the low-level client is thread-safe
+    client = table.client
+    chunks = [unique[i:i + BATCH_GET_LIMIT] for i in range(0, len(unique), BATCH_GET_LIMIT)]
+
+    if len(chunks) == 1:
+        results = [_get_chunk(client, table.name, chunks[0], projection)]
+    else:
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(chunks))) as pool:
+            results = list(pool.map(lambda c: _get_chunk(client, table.name, c, projection), chunks))
+
+    return {(item["PK"], item["SK"]): item for chunk in results for item in chunk}
@@ -0,0 +1,159 @@
+import os
+import time
+
+import boto3
+from botocore.config import Config
+from boto3.dynamodb.types import TypeDeserializer, TypeSerializer
+
+TABLE_NAME = os.environ.get("TABLE_NAME", "TaskBin")
+
+# Connection pool large enough for the thread-pooled helpers (batch gets,
+# broadcasts); keep-alive lets warm invocations reuse TCP/TLS sessions.
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    tcp_keepalive=True,
+    retries={"mode": "standard", "max_attempts": 5},
+)
+
+BATCH_WRITE_LIMIT = 25  # DynamoDB maximum requests per BatchWriteItem
+MAX_RETRIES = 6
+BASE_BACKOFF = 0.05     # seconds, doubled on every retry
+
+_client = None
+_tables = {}
+_serializer = TypeSerializer()
+_deserializer = TypeDeserializer()
+
+
+def get_client():
+    """Return the process-wide low-level DynamoDB client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = boto3.client("dynamodb", config=CLIENT_CONFIG)
+    return _client
+
+
+def get_table(name=TABLE_NAME):
+    """Return a (cached) Table wrapper; no AWS client is built until the first call."""
+    if name not in _tables:
+        _tables[name] = Table(name)
+    return _tables[name]
+
+
+def serialize(item):
+    return {k: _serializer.serialize(v) for k, v in item.items()}
+
+
+def deserialize(item):
+    return {k: _deserializer.deserialize(v) for k, v in item.items()}
+
+
+def serialize_params(params):
+    """Convert the native-Python parts of a request into AttributeValues."""
+    params = dict(params)
+    for field in ("Key", "Item", "ExclusiveStartKey", "ExpressionAttributeValues"):
+        if params.get(field) is not None:
+            params[field] = serialize(params[field])
+    return params
+
+
+def _deserialize_response(resp):
+    for field in ("Item", "Attributes", "LastEvaluatedKey"):
+        if field in resp:
+            resp[field] = deserialize(resp[field])
+    if "Items" in resp:
+        resp["Items"] = [deserialize(i) for i in resp["Items"]]
+    return resp
+
+
+class Table:
+    """
+    Drop-in subset of boto3's dynamodb.Table built on the low-level client.
+
+    Accepts and returns plain Python values (numbers come back as Decimal,
+    as with the resource API). Condition and key expressions must be strings.
+    """
+
+    def __init__(self, name):
+        self.name = name
+
+    @property
+    def client(self):
+        return get_client()
+
+    def _call(self, operation, **params):
+        params = serialize_params(params)
+        resp = getattr(self.client, operation)(TableName=self.name, **params)
+        return _deserialize_response(resp)
+
+    def get_item(self, **params):
+        return self._call("get_item", **params)
+
+    def put_item(self, **params):
+        return self._call("put_item", **params)
+
+    def update_item(self, **params):
+        return self._call("update_item", **params)
+
+    def delete_item(self, **params):
+        return self._call("delete_item", **params)
+
+    def query(self, **params):
+        return self._call("query", **params)
+
+    def scan(self, **params):
+        return self._call("scan", **params)
+
+    def batch_writer(self, overwrite_by_pkeys=None):
+        return BatchWriter(self, overwrite_by_pkeys)
+
+
+class BatchWriter:
+    """
+    Buffer put/delete requests and flush them 25 at a time with
+    BatchWriteItem, retrying UnprocessedItems with exponential backoff.
+    With overwrite_by_pkeys, a later request for the same key replaces an
+    earlier buffered one (BatchWriteItem rejects duplicate keys).
+    """
+
+    def __init__(self, table, overwrite_by_pkeys=None):
+        self.table = table
+        self.pkeys = overwrite_by_pkeys
+        self.buffer = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        while self.buffer:
+            self._flush()
+
+    def put_item(self, Item):
+        self._add({"PutRequest": {"Item": serialize(Item)}}, Item)
+
+    def delete_item(self, Key):
+        self._add({"DeleteRequest": {"Key": serialize(Key)}}, Key)
+
+    def _add(self, request, values):
+        if self.pkeys:
+            key = tuple(values.get(k) for k in self.pkeys)
+            self.buffer = [(k, r) for k, r in self.buffer if k != key]
+        else:
+            key = None
+        self.buffer.append((key, request))
+        if len(self.buffer) >= BATCH_WRITE_LIMIT:
+            self._flush()
+
+    def _flush(self):
+        batch = [r for _, r in self.buffer[:BATCH_WRITE_LIMIT]]
+        self.buffer = self.buffer[BATCH_WRITE_LIMIT:]
+
+        for attempt in range(MAX_RETRIES + 1):
+            resp = self.table.client.batch_write_item(RequestItems={self.table.name: batch})
+            batch = resp.get("UnprocessedItems", {}).get(self.table.name)
+            if not batch:
+                return
+            if attempt < MAX_RETRIES:
+                time.sleep(BASE_BACKOFF * (2 ** attempt))
+
+        raise RuntimeError(f"BatchWriteItem left {len(batch)} requests unprocessed after {MAX_RETRIES} retries")
@@ -0,0 +1,105 @@
+import base64
+import json
+from decimal import Decimal
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
+
+
+class InvalidPageRequest(ValueError):
+    """Raised when a client sends a bad limit or next_token."""
+
+
+def _encode_key_value(value):
+    if isinstance(value, Decimal):
+        return int(value) if value == value.to_integral_value() else str(value)
+    raise TypeError(f"Unsupported key type: {type(value)}")
+
+
+def encode_token(last_evaluated_key):
+    """Turn a LastEvaluatedKey into an opaque, URL-safe cursor."""
+    if not last_evaluated_key:
+        return None
+    raw = json.dumps(last_evaluated_key, separators=(",", ":"), default=_encode_key_value)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+
+def decode_token(token):
+    """Turn a cursor from encode_token back into an ExclusiveStartKey."""
+    if not token:
+        return None
+    try:
+        key = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+    except Exception:
+        raise InvalidPageRequest("Invalid next_token")
+    if not isinstance(key, dict):
+        raise InvalidPageRequest("Invalid next_token")
+    return key
+
+
+def page_params(event, body=None):
+    """
+    Read `limit` and `next_token` from the query string (or the JSON body).
+    Returns (limit, next_token) with limit clamped to MAX_PAGE_SIZE.
+    """
+    params = event.get("queryStringParameters") or {}
+    body = body or {}
+
+    raw_limit = params.get("limit", body.get("limit"))
+    next_token = params.get("next_token", body.get("next_token"))
+
+    if raw_limit in (None, ""):
+        limit = DEFAULT_PAGE_SIZE
+    else:
+        try:
+            limit = int(raw_limit)
+        except (TypeError, ValueError):
+            raise InvalidPageRequest("limit must be an integer")
+        if limit < 1:
+            raise InvalidPageRequest("limit must be positive")
+
+    return min(limit, MAX_PAGE_SIZE), next_token
+
+
+def iter_query(table, **query_kwargs):
+    """
+    Yield every item matched by table.query(**query_kwargs), following
+    LastEvaluatedKey so partitions larger than 1 MB are read completely.
+    """
+    query_kwargs = dict(query_kwargs)
+    while True:
+        resp = table.query(**query_kwargs)
+        yield from resp.get("Items", [])
+
+        last_key = resp.get("LastEvaluatedKey")
+        if not last_key:
+            return
+        query_kwargs["ExclusiveStartKey"] = last_key
+
+
+def query_page(table, limit=DEFAULT_PAGE_SIZE, next_token=None, **query_kwargs):
+    """
+    Read one page of up to `limit` items starting after `next_token`.
+
+    Keeps querying while a FilterExpression leaves the page short, so a page
+    is only smaller than `limit` when the result set is exhausted.
+    Returns (items, next_token); next_token is None on the last page.
+    """
+    query_kwargs = dict(query_kwargs)
+    start_key = decode_token(next_token)
+    if start_key:
+        query_kwargs["ExclusiveStartKey"] = start_key
+
+    items = []
+    last_key = None
+    while len(items) < limit:
+        query_kwargs["Limit"] = limit - len(items)
+        resp = table.query(**query_kwargs)
+        items.extend(resp.get("Items", []))
+
+        last_key = resp.get("LastEvaluatedKey")
+        if not last_key:
+            break
+        query_kwargs["ExclusiveStartKey"] = last_key
+
+    return items, encode_token(last_key)
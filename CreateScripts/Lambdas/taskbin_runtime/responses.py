@@ -0,0 +1,41 @@
+import hashlib
+import json
+from decimal import Decimal
+
+
+class DecimalEncoder(json.JSONEncoder):
+    """Serialize DynamoDB numbers (Decimal) as int or float."""
+
+    def default(self, o):
+        if isinstance(o, Decimal):
+            return int(o) if o == o.to_integral_value() else float(o)
+        return super().default(o)
+
+
+def dumps(payload):
+    return json.dumps(payload, cls=DecimalEncoder)
+
+
+def make_etag(*parts):
+    """
+    Strong ETag over the inputs a response is built from: a version tuple,
+    or the raw items read from DynamoDB. Cheap enough to compute before
+    deciding whether to build the body at all.
+    """
+    raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), cls=DecimalEncoder)
+    return '"' + hashlib.sha256(raw.encode("utf-8")).hexdigest()[:32] + '"'
+
+
+def etag_matches(event, etag):
+    """True when the request's If-None-Match already names etag."""
+    headers = event.get("headers") or {}
+    header = next((v for k, v in headers.items() if k.lower() == "if-none-match"), None)
+    if not header:
+        return False
+    tags = [t.strip() for t in header.split(",")]
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
+
+
+def not_modified(etag):
+    """304 with no body; the client reuses the copy it holds for etag."""
+    return {"statusCode": 304, "headers": {"ETag": etag}}
@@ -0,0 +1,42 @@
+from botocore.exceptions import ClientError
+
+from taskbin_runtime.dynamo import serialize_params
+
+MAX_TRANSACTION_ITEMS = 100   # DynamoDB TransactWriteItems limit
+
+CONFLICT = (409, "Conflicting concurrent update, please retry")
+
+
+def run_transaction(table, steps):
+    """
+    Apply a list of (action, failure) steps atomically with TransactWriteItems.
+
+    `action` is one TransactWriteItem without TableName, e.g.
+    {"Put": {"Item": {...}, "ConditionExpression": "attribute_not_exists(PK)"}}.
+    `failure` is the (status_code, error_message) to report when that step's
+    condition fails, or None for steps without a condition.
+
+    Returns None on success, or the (status_code, error_message) of the first
+    failed step. Errors other than a cancelled transaction are re-raised.
+    """
+    if len(steps) > MAX_TRANSACTION_ITEMS:
+        raise ValueError(f"Transaction has {len(steps)} items; the limit is {MAX_TRANSACTION_ITEMS}")
+
+    transact_items = []
+    for action, _ in steps:
+        (op, params), = action.items()
+        transact_items.append({op: {"TableName": table.name, **serialize_params(params)}})
+
+    try:
+        table.client.transact_write_items(TransactItems=transact_items)
+        return None
+
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") != "TransactionCanceledException":
+            raise
+
+        reasons = e.response.get("CancellationReasons", [])
+        for (_, failure), reason in zip(steps, reasons):
+            if reason.get("Code") == "ConditionalCheckFailed" and failure:
+                return failure
+        return CONFLICT
@@ -0,0 +1,146 @@
+import time
+
+from taskbin_runtime.auth_cache import board_versions
+from taskbin_runtime.transactions import CONFLICT, run_transaction
+
+# Per-board change counter behind GET /boards/{board_id}/tasks?since=N.
+#
+# BOARD#<id>/METADATA carries `version`; every task write bumps it in the
+# same transaction and stamps the new value on the board task row, which is
+# indexed on GSI2 (GSI2PK = BOARD#<id>, GSI2SK = version). Deleted tasks
+# leave a DELETED#TASK#<id> tombstone in the board partition so delta
+# readers see the removal.
+#
+# GSI2 is eventually consistent: a row committed at version 5 can show up
+# after one committed at 6. Rows also carry `changed_at` (epoch ms), and a
+# delta read only advances the client's cursor past rows older than
+# SETTLE_MS (see sync_cursor); younger rows are returned again next time.
+
+MAX_ATTEMPTS = 4
+# Clients idle for longer than this must do a full reload
+TOMBSTONE_TTL_SECONDS = 30 * 24 * 3600
+TOMBSTONE_PREFIX = "DELETED#"
+# Comfortably above normal GSI propagation lag
+SETTLE_MS = 5_000
+
+BOARD_NOT_FOUND = (404, "Board not found")
+VERSION_CONFLICT = (409, "Board changed concurrently, please retry")
+
+
+def board_version(table, board_id, consistent=False):
+    """Return the board's current version, or None if the board is missing or being deleted."""
+    meta = table.get_item(
+        Key={"PK": f"BOARD#{board_id}", "SK": "METADATA"},
+        ConsistentRead=consistent
+    ).get("Item")
+    if not meta or meta.get("deleted_at"):
+        return None
+    return int(meta.get("version", 0))
+
+
+def _now_ms():
+    return int(time.time() * 1000)
+
+
+def live_board_check(board_id):
+    """
+    run_transaction step that fails with 404 once the board is gone or
+    tombstoned, so nothing new lands in a board the reaper is clearing.
+    """
+    return ({"ConditionCheck": {
+        "Key": {"PK": f"BOARD#{board_id}", "SK": "METADATA"},
+        "ConditionExpression": "attribute_exists(PK) AND attribute_not_exists(deleted_at)"
+    }}, BOARD_NOT_FOUND)
+
+
+def version_attributes(board_id, version):
+    """Attributes that put a board task row (or tombstone) on the change index."""
+    return {"version": version, "GSI2PK": f"BOARD#{board_id}", "GSI2SK": version, "changed_at": _now_ms()}
+
+
+def version_update(board_id, version):
+    """
+    version_attributes as UpdateExpression parts for an existing row:
+    (SET clauses, ExpressionAttributeNames, ExpressionAttributeValues).
+    """
+    return (
+        ["#version = :version", "GSI2PK = :gsi2pk", "GSI2SK = :version", "changed_at = :changed_at"],
+        {"#version": "version"},
+        {":version": version, ":gsi2pk": f"BOARD#{board_id}", ":changed_at": _now_ms()}
+    )
+
+
+def sync_cursor(since, items):
+    """
+    Next `since` for a client that applied `items` (one GSI2 page, ascending).
+
+    Versions are handed out in commit order, so settled rows form a prefix;
+    the cursor moves to the last of them and never past a row that may
+    still have older siblings in flight to the index.
+    """
+    settled_before = _now_ms() - SETTLE_MS
+    cursor = since
+    for item in items:
+        if int(item.get("changed_at", 0)) > settled_before:
+            break
+        cursor = max(cursor, int(item["GSI2SK"]))
+    return cursor
+
+
+def task_tombstone(board_id, task_id, version):
+    """Row recording that task_id was deleted at `version`."""
+    return {
+        "PK": f"BOARD#{board_id}",
+        "SK": f"{TOMBSTONE_PREFIX}TASK#{task_id}",
+        "task_id": task_id,
+        "board_id": board_id,
+        "type": "task_tombstone",
+        "ttl": int(time.time()) + TOMBSTONE_TTL_SECONDS,
+        **version_attributes(board_id, version)
+    }
+
+
+def run_versioned(table, board_id, build_steps):
+    """
+    Run a task write as one transaction that also bumps the board version.
+
+    build_steps(version) returns the run_transaction steps for the write,
+    stamped with the version it will commit as. The METADATA bump is
+    appended (it also checks that the board exists and is not deleted), so
+    the steps must not touch BOARD#<id>/METADATA themselves.
+
+    The first attempt trusts the version this container last committed or
+    read (auth_cache.board_versions), so bursts of writes skip the METADATA
+    read; the bump's condition is what catches a stale value. Lost races
+    drop the cached version and retry against a fresh read.
+    Returns (version, failure) where failure is None on success or the
+    (status_code, error_message) to report.
+    """
+    current = board_versions.get(board_id)
+    for _ in range(MAX_ATTEMPTS):
+        if current is None:
+            current = board_version(table, board_id, consistent=True)
+            if current is None:
+                return None, BOARD_NOT_FOUND
+
+        version = current + 1
+        bump = ({"Update": {
+            "Key": {"PK": f"BOARD#{board_id}", "SK": "METADATA"},
+            "UpdateExpression": "SET #version = :next",
+            "ConditionExpression": "attribute_exists(PK) AND attribute_not_exists(deleted_at) "
+                                   "AND (attribute_not_exists(#version) OR #version = :current)",
+            "ExpressionAttributeNames": {"#version": "version"},
+            "ExpressionAttributeValues": {":next": version, ":current": current}
+        }}, VERSION_CONFLICT)
+
+        failure = run_transaction(table, build_steps(version) + [bump])
+        if failure in (VERSION_CONFLICT, CONFLICT):
+            board_versions.invalidate(board_id)
+            current = None
+            continue
+
+        if failure is None:
+            board_versions.set(board_id, version)
+        return version, failure
+
+    return None, VERSION_CONFLICT
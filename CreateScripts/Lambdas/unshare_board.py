@@ -1,11 +1,12 @@
 import json
-import boto3
 from datetime import datetime, timezone
 from botocore.exceptions import ClientError
+from taskbin_runtime.auth_cache import get_membership, membership_check
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.transactions import run_transaction
 
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 def lambda_handler(event, context):
     """
@@ -48,27 +49,27 @@ def lambda_handler(event, context):
 
         # ---------------------------------
         # Verify invoking user is a member of the board
+        # (cached across warm invocations; re-checked when writing)
         # ---------------------------------
-        invoker_check = table.get_item(
-            Key={"PK": f"USER#{user_id}", "SK": board_sk}
-        )
-        if "Item" not in invoker_check:
+        not_member = (403, "Invoking user is not a member of this board")
+        invoker = get_membership(table, user_id, board_id)
+        if not invoker:
             return {
-                "statusCode": 403,
-                "body": json.dumps({"error": "Invoking user is not a member of this board"})
+                "statusCode": not_member[0],
+                "body": json.dumps({"error": not_member[1]})
             }
 
         # You *could* enforce owner-only removal here:
-        # if invoker_check["Item"].get("role") != "owner":
+        # if invoker.get("role") != "owner":
         #     return {"statusCode": 403, "body": json.dumps({"error": "Only board owners can unshare"})}
 
         # ---------------------------------
         # Check membership for the user being removed
         # ---------------------------------
         membership_key = {"PK": f"USER#{remove_user_id}", "SK": board_sk}
-        membership_check = table.get_item(Key=membership_key)
+        target = table.get_item(Key=membership_key)
 
-        if "Item" not in membership_check:
+        if "Item" not in target:
             return {
                 "statusCode": 404,
                 "body": json.dumps({
@@ -77,9 +78,16 @@ def lambda_handler(event, context):
             }
 
         # ---------------------------------
-        # Remove membership row
+        # Remove membership row while the invoker is still a member
         # ---------------------------------
-        table.delete_item(Key=membership_key)
+        steps = [({"Delete": {"Key": membership_key}}, None)]
+        if remove_user_id != user_id:  # one transaction can't touch a row twice
+            steps.insert(0, membership_check(user_id, board_id, not_member))
+
+        failure = run_transaction(table, steps)
+        if failure:
+            status_code, error = failure
+            return {"statusCode": status_code, "body": json.dumps({"error": error})}
 
         return {
             "statusCode": 200,
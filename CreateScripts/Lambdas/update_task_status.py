@@ -1,10 +1,10 @@
 import json
-import boto3
 from botocore.exceptions import ClientError
+from taskbin_runtime.dynamo import get_table
+from taskbin_runtime.versioning import run_versioned, version_update
 
 TABLE_NAME = "TaskBin"
-dynamodb = boto3.resource("dynamodb")
-table = dynamodb.Table(TABLE_NAME)
+table = get_table(TABLE_NAME)
 
 def lambda_handler(event, context):
     """
@@ -69,54 +69,69 @@ def lambda_handler(event, context):
         board_sk = f"BOARD#{board_id}"
 
         # -----------------------------
-        # Verify the user is a member of the board
+        # Update every copy in one transaction, guarded by membership:
+        #   BOARD → TASK (+ status index key, change version),
+        #   TASK → METADATA, USER → TASK if assigned (+ status index key)
+        # run_versioned adds the board-version bump
         # -----------------------------
-        member_resp = table.get_item(Key={"PK": f"USER#{user_id}", "SK": board_sk})
-        if "Item" not in member_resp:
+        exists = "attribute_exists(PK)"
+        assigned_to = task_meta.get("assigned_to")
+
+        def build_steps(version):
+            version_set, version_names, version_values = version_update(board_id, version)
+            steps = [
+                ({"ConditionCheck": {
+                    "Key": {"PK": f"USER#{user_id}", "SK": board_sk},
+                    "ConditionExpression": exists
+                }}, (403, "User is not a member of this board")),
+                ({"Update": {
+                    "Key": {"PK": board_sk, "SK": task_sk},
+                    "UpdateExpression": "SET " + ", ".join(
+                        ["task_status = :new_status", "GSI1PK = :gsi1pk"] + version_set),
+                    "ConditionExpression": exists,
+                    "ExpressionAttributeNames": version_names,
+                    "ExpressionAttributeValues": {
+                        ":new_status": new_status,
+                        ":gsi1pk": f"{board_sk}#STATUS#{new_status}",
+                        **version_values
+                    }
+                }}, (404, "Task not found")),
+                ({"Update": {
+                    "Key": {"PK": task_sk, "SK": "METADATA"},
+                    "UpdateExpression": "SET task_status = :new_status",
+                    "ConditionExpression": exists,
+                    "ExpressionAttributeValues": {":new_status": new_status}
+                }}, (404, "Task not found")),
+            ]
+
+            if assigned_to:
+                steps.append(({"Update": {
+                    "Key": {"PK": f"USER#{assigned_to}", "SK": task_sk},
+                    "UpdateExpression": "SET task_status = :new_status, GSI1PK = :gsi1pk",
+                    "ConditionExpression": exists,
+                    "ExpressionAttributeValues": {
+                        ":new_status": new_status,
+                        ":gsi1pk": f"USER#{assigned_to}#STATUS#{new_status}"
+                    }
+                }}, (409, "Task assignment changed concurrently, please retry")))
+            return steps
+
+        version, failure = run_versioned(table, board_id, build_steps)
+        if failure:
+            status_code, error = failure
             return {
-                "statusCode": 403,
-                "body": json.dumps({"error": "User is not a member of this board"})
+                "statusCode": status_code,
+                "body": json.dumps({"error": error})
             }
 
-        # -----------------------------
-        # Update BOARD → TASK entry
-        # -----------------------------
-        table.update_item(
-            Key={"PK": board_sk, "SK": task_sk},
-            UpdateExpression="SET #s = :new_status",
-            ExpressionAttributeNames={"#s": "status"},
-            ExpressionAttributeValues={":new_status": new_status}
-        )
-
-        # -----------------------------
-        # Update TASK → METADATA entry
-        # -----------------------------
-        table.update_item(
-            Key={"PK": task_sk, "SK": "METADATA"},
-            UpdateExpression="SET #s = :new_status",
-            ExpressionAttributeNames={"#s": "status"},
-            ExpressionAttributeValues={":new_status": new_status}
-        )
-
-        # -----------------------------
-        # Update USER → TASK entry if assigned
-        # -----------------------------
-        assigned_to = task_meta.get("assigned_to")
-        if assigned_to:
-            table.update_item(
-                Key={"PK": f"USER#{assigned_to}", "SK": task_sk},
-                UpdateExpression="SET #s = :new_status",
-                ExpressionAttributeNames={"#s": "status"},
-                ExpressionAttributeValues={":new_status": new_status}
-            )
-
         return {
             "statusCode": 200,
             "body": json.dumps({
                 "message": "Task status updated",
                 "task_id": task_id,
                 "board_id": board_id,
-                "new_status": new_status
+                "new_status": new_status,
+                "version": version
             })
         }
 
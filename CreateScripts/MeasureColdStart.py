@@ -0,0 +1,95 @@
+import argparse
+import math
+import os
+import subprocess
+import sys
+
+# --- Configuration ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+LAMBDA_DIR = os.path.join(BASE_DIR, "Lambdas")
+DEFAULT_RUNS = 20
+
+# Runs inside a fresh interpreter: time handler import + DynamoDB client init,
+# which is what a Lambda cold start pays before the first request.
+CHILD_SCRIPT = r"""
+import importlib.util
+import sys
+import time
+
+handler_path, runtime_dir = sys.argv[1], sys.argv[2]
+sys.path.insert(0, runtime_dir)
+
+started = time.perf_counter()
+spec = importlib.util.spec_from_file_location("lambda_function", handler_path)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+try:
+    from taskbin_runtime.dynamo import get_client
+    get_client()
+except ImportError:
+    pass  # pre-layer handlers build their resource at import time
+print((time.perf_counter() - started) * 1000)
+"""
+
+# Dummy settings so clients can be constructed offline (no AWS calls are made)
+CHILD_ENV = {
+    "AWS_DEFAULT_REGION": "us-west-1",
+    "AWS_ACCESS_KEY_ID": "cold-start-harness",
+    "AWS_SECRET_ACCESS_KEY": "cold-start-harness",
+    "WS_ENDPOINT": "https://example.execute-api.us-west-1.amazonaws.com/prod",
+}
+
+
+def _percentile(samples, pct):
+    ordered = sorted(samples)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+
+def measure_handler(handler_path, lambda_dir, runs):
+    """Return `runs` cold-start samples (ms) for one handler file."""
+    env = {**os.environ, **CHILD_ENV}
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", CHILD_SCRIPT, handler_path, lambda_dir],
+            capture_output=True, text=True, env=env
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"{os.path.basename(handler_path)} failed to import:\n{result.stderr}")
+        samples.append(float(result.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def measure_all(lambda_dir=LAMBDA_DIR, runs=DEFAULT_RUNS, only=None):
+    """
+    Measure every handler in lambda_dir and print p50/p99 per handler and
+    overall. Point lambda_dir at an older checkout to get a "before" number.
+    """
+    py_files = sorted(f for f in os.listdir(lambda_dir) if f.endswith(".py"))
+    if only:
+        py_files = [f for f in py_files if f in only]
+
+    all_samples = []
+    print(f"⏱ Measuring cold starts in {lambda_dir} ({runs} runs each)")
+    print(f"{'handler':<28}{'p50 ms':>10}{'p99 ms':>10}")
+
+    for file_name in py_files:
+        samples = measure_handler(os.path.join(lambda_dir, file_name), lambda_dir, runs)
+        all_samples.extend(samples)
+        print(f"{file_name:<28}{_percentile(samples, 50):>10.1f}{_percentile(samples, 99):>10.1f}")
+
+    if all_samples:
+        print(f"{'ALL':<28}{_percentile(all_samples, 50):>10.1f}{_percentile(all_samples, 99):>10.1f}")
+
+    return all_samples
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local cold-start harness for TaskBin Lambdas")
+    parser.add_argument("--lambda-dir", default=LAMBDA_DIR, help="directory of handler files")
+    parser.add_argument("--runs", type=int, default=DEFAULT_RUNS, help="fresh interpreters per handler")
+    parser.add_argument("--only", nargs="*", help="handler file names to measure, e.g. list_boards.py")
+    args = parser.parse_args()
+
+    measure_all(args.lambda_dir, args.runs, args.only)
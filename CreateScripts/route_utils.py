@@ -1,17 +1,26 @@
 import boto3
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from botocore.config import Config
 
 current_dir = Path(__file__).parent
 arns_path = current_dir / "lambda_arns.json"
 
+MAX_WORKERS = 8
+# API Gateway control-plane limits are low; adaptive retries absorb throttling
+CLIENT_CONFIG = Config(
+    max_pool_connections=MAX_WORKERS,
+    retries={'max_attempts': 10, 'mode': 'adaptive'}
+)
+
 class RouteIntegration:
     def __init__(self, api_id=None, region="us-west-1"):
         self.api_id = api_id or os.environ.get('API_ID')
         self.region = region
-        self.client = boto3.client('apigatewayv2', region_name=region)
-        self.lambda_client = boto3.client('lambda', region_name=region)
+        self.client = boto3.client('apigatewayv2', region_name=region, config=CLIENT_CONFIG)
+        self.lambda_client = boto3.client('lambda', region_name=region, config=CLIENT_CONFIG)
         self.lambda_arns = self._load_lambda_arns()
 
         if not self.api_id:
@@ -26,66 +35,119 @@ class RouteIntegration:
             print("Warning: lambda_arns.json not found")
             return {}
 
-    def create_route(self, route_key, lambda_name, authorization_type="NONE"):
-        """
-        Create a complete route with Lambda integration
-
-        Args:
-            route_key: The route path and method (e.g., "POST /boards")
-            lambda_name: Name of the Lambda function (must exist in lambda_arns.json)
-            authorization_type: Authorization type (default: "NONE")
-        """
-        if lambda_name not in self.lambda_arns:
-            raise ValueError(f"Lambda {lambda_name} not found in lambda_arns.json")
-
-        lambda_arn = self.lambda_arns[lambda_name]
-
-        try:
-            # Step 1: Create Integration
-            integration_response = self.client.create_integration(
-                ApiId=self.api_id,
-                IntegrationType='AWS_PROXY',
-                IntegrationUri=lambda_arn,
-                PayloadFormatVersion='2.0'
-            )
-            integration_id = integration_response['IntegrationId']
-            print(f"  Created integration: {integration_id}")
-
-            # Step 2: Create Route
-            route_response = self.client.create_route(
+    def _paginate(self, method, key):
+        """Collect every item from a NextToken-paged apigatewayv2 list call"""
+        items, kwargs = [], {'ApiId': self.api_id}
+        while True:
+            response = method(**kwargs)
+            items.extend(response.get(key, []))
+            if not response.get('NextToken'):
+                return items
+            kwargs['NextToken'] = response['NextToken']
+
+    def _create_integration(self, lambda_arn):
+        response = self.client.create_integration(
+            ApiId=self.api_id,
+            IntegrationType='AWS_PROXY',
+            IntegrationUri=lambda_arn,
+            PayloadFormatVersion='2.0'
+        )
+        print(f"  Created integration: {response['IntegrationId']} → {lambda_arn}")
+        return response['IntegrationId']
+
+    def _put_route(self, route_key, target, existing_route, authorization_type):
+        if existing_route is None:
+            self.client.create_route(
                 ApiId=self.api_id,
                 RouteKey=route_key,
-                Target=f'integrations/{integration_id}',
+                Target=target,
                 AuthorizationType=authorization_type
             )
             print(f"  Created route: {route_key}")
+            return 'created'
 
-            # Step 3: Grant API Gateway permission to invoke Lambda
-            self._add_lambda_permission(lambda_arn, route_key)
-
-            return {
-                'route_id': route_response['RouteId'],
-                'integration_id': integration_id
-            }
+        self.client.update_route(
+            ApiId=self.api_id,
+            RouteId=existing_route['RouteId'],
+            Target=target
+        )
+        print(f"  Updated route target: {route_key}")
+        return 'updated'
 
-        except Exception as e:
-            print(f"  Error creating route {route_key}: {str(e)}")
-            raise
+    def reconcile_routes(self, routes, max_workers=MAX_WORKERS):
+        """
+        Make the API match a route table. Existing routes/integrations are
+        listed once; only missing integrations and missing or re-targeted
+        routes are written, so re-running is idempotent.
 
-    def _add_lambda_permission(self, lambda_arn, route_key):
+        Args:
+            routes: list of {"route_key", "lambda_name", "authorization_type"?}
+        Returns:
+            {"created": n, "updated": n, "unchanged": n}
+        """
+        missing = [r['lambda_name'] for r in routes if r['lambda_name'] not in self.lambda_arns]
+        if missing:
+            raise ValueError(f"Lambdas not found in lambda_arns.json: {', '.join(sorted(set(missing)))}")
+
+        existing_routes = {r['RouteKey']: r for r in self._paginate(self.client.get_routes, 'Items')}
+        integrations = {
+            i['IntegrationUri']: i['IntegrationId']
+            for i in self._paginate(self.client.get_integrations, 'Items')
+            if i.get('IntegrationType') == 'AWS_PROXY'
+        }
+
+        lambda_arns = sorted({self.lambda_arns[r['lambda_name']] for r in routes})
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            # 1) One integration per Lambda, shared by all of its routes
+            new_arns = [arn for arn in lambda_arns if arn not in integrations]
+            for arn, integration_id in zip(new_arns, pool.map(self._create_integration, new_arns)):
+                integrations[arn] = integration_id
+
+            # 2) Routes that are missing or point at another integration
+            pending = []
+            for route in routes:
+                target = f"integrations/{integrations[self.lambda_arns[route['lambda_name']]]}"
+                existing = existing_routes.get(route['route_key'])
+                if existing is None or existing.get('Target') != target:
+                    pending.append((
+                        route['route_key'],
+                        target,
+                        existing,
+                        route.get('authorization_type', 'NONE')
+                    ))
+            outcomes = list(pool.map(lambda args: self._put_route(*args), pending))
+
+            # 3) Invoke permission per Lambda (already-granted is a no-op)
+            list(pool.map(self._add_lambda_permission, lambda_arns))
+
+        summary = {
+            'created': outcomes.count('created'),
+            'updated': outcomes.count('updated'),
+            'unchanged': len(routes) - len(outcomes)
+        }
+
+        extra = sorted(set(existing_routes) - {r['route_key'] for r in routes})
+        if extra:
+            print(f"  Note: routes not in the route table were left alone: {', '.join(extra)}")
+
+        return summary
+
+    def _add_lambda_permission(self, lambda_arn, route_key=None):
         """Add permission for API Gateway to invoke Lambda"""
         try:
-            # Extract function name and account ID from ARN
-            function_name = lambda_arn.split(':')[-1]
+            # Extract account ID from ARN; the (alias-qualified) ARN itself is
+            # the FunctionName so the permission lands on what the route invokes
             account_id = lambda_arn.split(':')[4]
 
             # Create a valid statement ID (alphanumeric, hyphens, underscores only)
-            # Remove special characters like {}, /, spaces
-            statement_id = f"apigateway-{self.api_id}-{route_key}"
+            # Remove special characters like {}, /, spaces. The grant covers the
+            # whole API, so one statement per Lambda is enough when no route is given.
+            statement_id = f"apigateway-{self.api_id}" + (f"-{route_key}" if route_key else "")
             statement_id = statement_id.replace(' ', '-').replace('/', '-').replace('{', '').replace('}', '')
 
             self.lambda_client.add_permission(
-                FunctionName=function_name,
+                FunctionName=lambda_arn,
                 StatementId=statement_id,
                 Action='lambda:InvokeFunction',
                 Principal='apigateway.amazonaws.com',
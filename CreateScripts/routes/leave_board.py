@@ -1,8 +0,0 @@
-# routes/leave_board.py
-from TaskBin.CreateScripts.route_utils import RouteIntegration
-
-integration = RouteIntegration()
-integration.create_route(
-    route_key="POST /boards/{boardId}/leave",
-    lambda_name="TaskBin_LeaveBoard"
-)
\ No newline at end of file
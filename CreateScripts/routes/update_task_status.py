@@ -1,8 +0,0 @@
-# routes/update_task_status.py
-from TaskBin.CreateScripts.route_utils import RouteIntegration
-
-integration = RouteIntegration()
-integration.create_route(
-    route_key="PATCH /tasks/{task_id}",
-    lambda_name="TaskBin_UpdateTaskStatus"
-)
\ No newline at end of file
@@ -1,8 +1,10 @@
 from TaskBin.DeleteScript.DeleteUserpool import delete_user_pool
-from TaskBin.DeleteScript.DeleteDB import delete_table
+from TaskBin.DeleteScript.DeleteDB import delete_table, purge_items, DEFAULT_SEGMENTS
 from TaskBin.DeleteScript.DeleteAPI import delete_all_apis
 from TaskBin.DeleteScript.DeleteAmplify import delete_amplify_app
-from TaskBin.DeleteScript.DeleteLambdas import delete_lambdas
+from TaskBin.DeleteScript.DeleteLambdas import delete_lambdas, delete_layer_versions, delete_stream_triggers
+from TaskBin.StageRunner import Stage, run_stages
+import argparse
 import os
 import time
 
@@ -11,46 +13,77 @@ create_scripts_dir = os.path.join(BASE_DIR, "CreateScripts")
 lambda_arns_file = os.path.abspath(os.path.join(create_scripts_dir, "lambda_arns.json"))
 api_file = os.path.abspath(os.path.join(BASE_DIR, "..", "api_id.json"))
 
-def main():
-
-    # ------------------------------------------------------------
-    # 0. Delete Amplify frontend FIRST (correct ordering)
-    # ------------------------------------------------------------
-    APP_NAME = "TaskBinFrontend"
-    print(f"Deleting Amplify app '{APP_NAME}'...")
-    delete_amplify_app(APP_NAME)
-    print("✔ Amplify frontend deleted.\n")
-
-    # ------------------------------------------------------------
-    # 1. Delete Cognito User Pool
-    # ------------------------------------------------------------
-    delete_user_pool("TaskBinUserPool")
-
-    # ------------------------------------------------------------
-    # 2. Delete DynamoDB Table
-    # ------------------------------------------------------------
-    success = delete_table()
-    if success:
-        print("DynamoDB table deletion complete.")
-    else:
-        print("DynamoDB table deletion failed.")
+def _delete_table(results, table_name="TaskBin"):
+    started = time.perf_counter()
+    success = delete_table(table_name)  # waits for table_not_exists
+    print("DynamoDB table deletion complete." if success else "DynamoDB table deletion failed.")
+    return {table_name: {
+        "status": "deleted" if success else "error",
+        "seconds": round(time.perf_counter() - started, 2)
+    }}
 
-    # ------------------------------------------------------------
-    # 3. Delete ALL APIs (HTTP + WebSocket)
-    # ------------------------------------------------------------
-    results = delete_all_apis()
-    print("API deletion results:", results)
 
-    # ------------------------------------------------------------
-    # 4. Delete Lambda ARNs file
-    # ------------------------------------------------------------
+def _delete_lambdas(results):
     print("Deleting Lambdas")
-    delete_lambdas()
+    lambda_results = delete_lambdas()
+    # Functions are gone, so nothing references the runtime layer any more
+    lambda_results.update(delete_layer_versions())
     if os.path.exists(lambda_arns_file):
         os.remove(lambda_arns_file)
         print(f"✔ Deleted {lambda_arns_file}")
     else:
         print(f"⚠️ File not found, nothing to delete: {lambda_arns_file}")
+    return lambda_results
+
+
+def main():
+    APP_NAME = "TaskBinFrontend"
+
+    # Independent resources are torn down in parallel; Lambdas (and their
+    # runtime layer) go after the APIs that invoke them, and the stream
+    # trigger goes before both the table and the Lambdas (DeleteFunction
+    # does not remove it). Every stage returns delete_all_apis-style
+    # {resource: {"status", "seconds", "error"?}} results.
+    stages = [
+        Stage("amplify", lambda r: delete_amplify_app(APP_NAME)),
+        Stage("user_pool", lambda r: delete_user_pool("TaskBinUserPool")),
+        Stage("stream_triggers", lambda r: delete_stream_triggers()),
+        Stage("table", _delete_table, deps=["stream_triggers"]),
+        Stage("apis", lambda r: delete_all_apis()),
+        Stage("lambdas", _delete_lambdas, deps=["apis", "stream_triggers"]),
+    ]
+
+    results, report = run_stages(stages, title="TASKBIN TEARDOWN TIMINGS")
+
+    print("================= RESOURCE RESULTS =================")
+    resource_results = {}
+    for stage_name, stage_results in results.items():
+        for resource, result in (stage_results or {}).items():
+            if not isinstance(result, dict):
+                continue  # e.g. {"status": "no-api-id-file"}
+            resource_results[resource] = result
+            seconds = result.get("seconds")
+            seconds = f"{seconds:.1f}s" if seconds is not None else "-"
+            line = f"{stage_name:<12}{resource:<32}{result['status']:<16}{seconds:>8}"
+            if result.get("error"):
+                line += f"  {result['error']}"
+            print(line)
+    print("====================================================\n")
+
+    return resource_results
+
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Tear down TaskBin, or purge rows from its table")
+    parser.add_argument("--purge", metavar="PREFIX", nargs="?", const="",
+                        help="delete rows whose PK/SK starts with PREFIX (e.g. BOARD#<id>, which also "
+                             "removes that board's TASK#/METADATA and assignee rows); "
+                             "no PREFIX purges all rows. Keeps every resource.")
+    parser.add_argument("--dry-run", action="store_true", help="with --purge: only count matching rows")
+    parser.add_argument("--segments", type=int, default=DEFAULT_SEGMENTS, help="parallel scan segments")
+    args = parser.parse_args()
+
+    if args.purge is not None:
+        purge_items(prefix=args.purge or None, dry_run=args.dry_run, segments=args.segments)
+    else:
+        main()
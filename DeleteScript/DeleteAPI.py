@@ -1,6 +1,8 @@
 import os
 import json
+import time
 import boto3
+from concurrent.futures import ThreadPoolExecutor
 from botocore.exceptions import ClientError
 
 # Paths
@@ -12,6 +14,34 @@ API_ID_FILE = os.path.join(PROJECT_ROOT, "api_id.json")        # TaskBin/api_id.
 # Boto3 client for API Gateway
 apigatewayv2 = boto3.client("apigatewayv2", region_name="us-west-1")
 
+def _delete_api(name, api_id):
+    started = time.perf_counter()
+
+    if not api_id:
+        print(f"⚠️ No API ID for {name}, skipping...")
+        return name, {"status": "missing-api-id", "seconds": 0.0}
+
+    print(f"🚀 Deleting API '{name}' with ID: {api_id}")
+    try:
+        apigatewayv2.delete_api(ApiId=api_id)
+        result = {"status": "deleted"}
+        print(f"✅ API '{name}' deleted successfully")
+
+    except apigatewayv2.exceptions.NotFoundException:
+        print(f"ℹ️ API '{name}' already gone")
+        result = {"status": "not-found"}
+
+    except ClientError as e:
+        print(f"❌ Failed to delete API '{name}': {e}")
+        result = {"status": "error", "error": str(e)}
+
+    except Exception as e:
+        print(f"❌ Unexpected error deleting API '{name}': {e}")
+        result = {"status": "exception", "error": str(e)}
+
+    result["seconds"] = round(time.perf_counter() - started, 2)
+    return name, result
+
 def delete_all_apis():
     if not os.path.exists(API_ID_FILE):
         print("⚠️ No api_id.json found — nothing to delete.")
@@ -24,27 +54,9 @@ def delete_all_apis():
         print("⚠️ api_id.json is empty — nothing to delete.")
         return {"status": "empty-api-id-file"}
 
-    deletion_results = {}
-
-    for name, api_id in api_ids.items():
-        if not api_id:
-            print(f"⚠️ No API ID for {name}, skipping...")
-            deletion_results[name] = {"status": "missing-api-id"}
-            continue
-
-        print(f"🚀 Deleting API '{name}' with ID: {api_id}")
-        try:
-            apigatewayv2.delete_api(ApiId=api_id)
-            deletion_results[name] = {"status": "deleted"}
-            print(f"✅ API '{name}' deleted successfully")
-
-        except ClientError as e:
-            print(f"❌ Failed to delete API '{name}': {e}")
-            deletion_results[name] = {"status": "error", "error": str(e)}
-
-        except Exception as e:
-            print(f"❌ Unexpected error deleting API '{name}': {e}")
-            deletion_results[name] = {"status": "exception", "error": str(e)}
+    # HTTP + WebSocket APIs are independent, delete them together
+    with ThreadPoolExecutor(max_workers=max(1, len(api_ids))) as pool:
+        deletion_results = dict(pool.map(lambda item: _delete_api(*item), api_ids.items()))
 
     # Remove api_id.json after all deletions
     try:
@@ -1,9 +1,19 @@
 # delete_amplify_app.py
 import boto3
-import sys
+import time
 
-def delete_amplify_app(app_name, region="us-west-1"):
+def delete_amplify_app(app_name, region="us-west-1", timeout=300, interval=3):
+    """
+    Delete the Amplify app and wait until it's gone.
+
+    Returns:
+        dict: {app_name: {"status": ..., "seconds": ..., "error"?}}
+    """
     amplify = boto3.client("amplify", region_name=region)
+    started = time.perf_counter()
+
+    def _result(status, **extra):
+        return {app_name: {"status": status, "seconds": round(time.perf_counter() - started, 2), **extra}}
 
     # Find the app by name
     apps = amplify.list_apps()["apps"]
@@ -11,14 +21,26 @@ def delete_amplify_app(app_name, region="us-west-1"):
 
     if not app:
         print(f"No Amplify app found with name '{app_name}'")
-        return
+        return _result("not-found")
 
     app_id = app["appId"]
     print(f"Deleting Amplify app '{app_name}' (ID: {app_id})...")
 
     try:
         amplify.delete_app(appId=app_id)
-        print(f"Amplify app '{app_name}' successfully deleted.")
     except Exception as e:
         print(f"Error deleting app: {e}")
-        sys.exit(1)
+        return _result("error", error=str(e))
+
+    # Poll until the app is really gone
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            amplify.get_app(appId=app_id)
+        except amplify.exceptions.NotFoundException:
+            print(f"Amplify app '{app_name}' successfully deleted.")
+            return _result("deleted")
+        time.sleep(interval)
+
+    print(f"⚠️ Amplify app '{app_name}' still present after {timeout}s")
+    return _result("timeout")
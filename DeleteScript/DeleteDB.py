@@ -1,14 +1,20 @@
 import boto3
 import time
+from concurrent.futures import ThreadPoolExecutor
+from boto3.dynamodb.conditions import Attr, Key
+
+DEFAULT_SEGMENTS = 8  # parallel scan workers for purge_items
 
 def delete_table(
     table_name="TaskBin",
     region="us-west-1",
     max_retries=3,
-    retry_delay=10
+    retry_delay=10,
+    wait=True
 ):
     """
-    Deletes a DynamoDB table with retry logic.
+    Deletes a DynamoDB table with retry logic. With wait=True, returns only
+    once the table is actually gone.
     """
     dynamodb = boto3.client('dynamodb', region_name=region)
 
@@ -16,6 +22,9 @@ def delete_table(
         try:
             dynamodb.delete_table(TableName=table_name)
             print(f"Table '{table_name}' deletion initiated.")
+            if wait:
+                dynamodb.get_waiter('table_not_exists').wait(TableName=table_name)
+                print(f"Table '{table_name}' deleted.")
             return True
         except dynamodb.exceptions.ResourceNotFoundException:
             print(f"Table '{table_name}' does not exist.")
@@ -25,9 +34,116 @@ def delete_table(
             if attempt < max_retries:
                 print(f"Retrying in {retry_delay} seconds... (Attempt {attempt}/{max_retries})")
                 time.sleep(retry_delay)
-                return None
             else:
                 print(f"Failed to delete table '{table_name}' after {max_retries} attempts.")
                 return False
 
     return True
+
+
+def _purge_segment(table_name, region, segment, total_segments, prefix, dry_run):
+    """Scan one segment and delete (or just count) the matching rows."""
+    # Resources aren't thread-safe, so each segment gets its own session
+    table = boto3.session.Session().resource('dynamodb', region_name=region).Table(table_name)
+
+    scan_kwargs = {
+        'Segment': segment,
+        'TotalSegments': total_segments,
+        'ProjectionExpression': 'PK, SK',
+    }
+    if prefix:
+        # Catch both sides of a relation, e.g. BOARD#b/... and USER#u/BOARD#b
+        scan_kwargs['FilterExpression'] = Attr('PK').begins_with(prefix) | Attr('SK').begins_with(prefix)
+    if dry_run:
+        scan_kwargs['Select'] = 'COUNT'
+        scan_kwargs.pop('ProjectionExpression')
+
+    count = 0
+    with table.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as batch:
+        while True:
+            response = table.scan(**scan_kwargs)
+            count += response['Count']
+
+            if not dry_run:
+                for item in response['Items']:
+                    batch.delete_item(Key={'PK': item['PK'], 'SK': item['SK']})
+
+            if 'LastEvaluatedKey' not in response:
+                return count
+            scan_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def _board_task_keys(table_name, region, board_pk):
+    """
+    Keys of the rows that mirror a board's tasks outside its partition:
+    TASK#<id>/METADATA and the assignee's USER#<u>/TASK#<id>. A prefix scan
+    can't reach them, so they are resolved from the board's task rows.
+    """
+    table = boto3.session.Session().resource('dynamodb', region_name=region).Table(table_name)
+    query_kwargs = {
+        'KeyConditionExpression': Key('PK').eq(board_pk) & Key('SK').begins_with('TASK#'),
+        'ProjectionExpression': 'SK, assigned_to',
+    }
+
+    keys = []
+    while True:
+        response = table.query(**query_kwargs)
+        for item in response['Items']:
+            keys.append({'PK': item['SK'], 'SK': 'METADATA'})
+            if item.get('assigned_to'):
+                keys.append({'PK': f"USER#{item['assigned_to']}", 'SK': item['SK']})
+
+        if 'LastEvaluatedKey' not in response:
+            return keys
+        query_kwargs['ExclusiveStartKey'] = response['LastEvaluatedKey']
+
+
+def purge_items(
+    table_name="TaskBin",
+    prefix=None,
+    dry_run=False,
+    segments=DEFAULT_SEGMENTS,
+    region="us-west-1"
+):
+    """
+    Bulk-delete rows without dropping the table.
+
+    Args:
+        prefix (str): Only rows whose PK or SK starts with this, e.g.
+            "BOARD#<id>" or "USER#<id>". None purges every row.
+            A full "BOARD#<id>" also cascades to that board's tasks
+            (TASK#<id>/METADATA and the assignees' USER#.../TASK#<id> rows);
+            other prefixes delete only the rows they match.
+        dry_run (bool): Count matching rows without deleting them.
+        segments (int): Parallel scan segments, each with its own batch writer.
+
+    Returns:
+        int: Number of rows matched (and deleted unless dry_run).
+    """
+    action = "Counting" if dry_run else "Purging"
+    scope = f"rows matching '{prefix}'" if prefix else "ALL rows"
+    print(f"🧹 {action} {scope} in '{table_name}' ({segments} segments)...")
+
+    started = time.perf_counter()
+
+    # Resolve a board's task rows before the scan deletes the board partition
+    cascade = []
+    if prefix and prefix.startswith("BOARD#") and prefix.count("#") == 1:
+        cascade = _board_task_keys(table_name, region, prefix)
+        if not dry_run and cascade:
+            table = boto3.resource('dynamodb', region_name=region).Table(table_name)
+            with table.batch_writer(overwrite_by_pkeys=['PK', 'SK']) as batch:
+                for key in cascade:
+                    batch.delete_item(Key=key)
+        print(f"  {len(cascade)} task rows outside the board partition")
+
+    with ThreadPoolExecutor(max_workers=segments) as pool:
+        counts = list(pool.map(
+            lambda segment: _purge_segment(table_name, region, segment, segments, prefix, dry_run),
+            range(segments)
+        ))
+
+    total = sum(counts) + len(cascade)
+    verb = "match" if dry_run else "deleted"
+    print(f"✔ {total} rows {verb} in {time.perf_counter() - started:.1f}s")
+    return total
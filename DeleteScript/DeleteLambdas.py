@@ -1,35 +1,139 @@
 # TaskBin/DeleteScript/delete_lambdas.py
 
 import json
+import time
 import boto3
 import os
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+
+MAX_WORKERS = 8
+TABLE_NAME = "TaskBin"
+STREAM_FUNCTION = "TaskBin_StreamBroadcast"
+RUNTIME_LAYER_NAME = "TaskBin_Runtime"
+
+def _delete_one(lambda_client, name, arn):
+    started = time.perf_counter()
+    # arn:aws:lambda:region:account:function:name[:alias]
+    function_name = arn.split(':')[6]
+    try:
+        print(f"Deleting Lambda: {function_name}...")
+        lambda_client.delete_function(FunctionName=function_name)
+        print(f"✅ Deleted {function_name}")
+        result = {"status": "deleted"}
+    except lambda_client.exceptions.ResourceNotFoundException:
+        print(f"ℹ️ {function_name} already gone")
+        result = {"status": "not-found"}
+    except Exception as e:
+        print(f"❌ Failed to delete {name}: {e}")
+        result = {"status": "error", "error": str(e)}
+    result["seconds"] = round(time.perf_counter() - started, 2)
+    return name, result
 
 def delete_lambdas(json_path=None, region='us-west-1'):
     """
-    Delete all Lambda functions listed in a JSON file.
+    Delete all Lambda functions listed in a JSON file, concurrently.
 
     Args:
         json_path (str): Path to lambda_arns.json. Defaults to '../CreateScripts/lambda_arns.json'.
         region (str): AWS region where Lambdas are located.
+
+    Returns:
+        dict: {lambda_name: {"status": ..., "seconds": ..., "error"?}}
     """
     # Default path if not provided
     if not json_path:
         base_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
         json_path = os.path.join(base_dir, 'CreateScripts', 'lambda_arns.json')
 
+    if not os.path.exists(json_path):
+        print(f"⚠️ {json_path} not found — nothing to delete.")
+        return {}
+
     # Load Lambda ARNs from JSON
     with open(json_path, 'r') as f:
         lambda_dict = json.load(f)
 
-    # Create Lambda client
-    lambda_client = boto3.client('lambda', region_name=region)
+    # Create Lambda client (shared by the workers; adaptive retries absorb throttling)
+    lambda_client = boto3.client(
+        'lambda',
+        region_name=region,
+        config=Config(max_pool_connections=MAX_WORKERS, retries={'max_attempts': 10, 'mode': 'adaptive'})
+    )
 
     # Delete Lambdas
-    for name, arn in lambda_dict.items():
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+        results = pool.map(lambda item: _delete_one(lambda_client, *item), lambda_dict.items())
+        return dict(results)
+
+
+def delete_stream_triggers(table_name=TABLE_NAME, region='us-west-1'):
+    """
+    Delete the event source mappings between the table's stream(s) and
+    TaskBin_StreamBroadcast. DeleteFunction leaves mappings behind, so
+    without this every rebuild would add another one.
+
+    Returns:
+        dict: {mapping_uuid: {"status": ..., "seconds": ..., "error"?}}
+    """
+    lambda_client = boto3.client('lambda', region_name=region)
+    stream_marker = f":table/{table_name}/stream/"
+    function_marker = f":function:{STREAM_FUNCTION}"
+
+    results = {}
+    for page in lambda_client.get_paginator('list_event_source_mappings').paginate():
+        for mapping in page.get("EventSourceMappings", []):
+            if stream_marker not in mapping.get("EventSourceArn", "") \
+                    and function_marker not in mapping.get("FunctionArn", ""):
+                continue
+
+            uuid = mapping["UUID"]
+            started = time.perf_counter()
+            try:
+                lambda_client.delete_event_source_mapping(UUID=uuid)
+                print(f"✅ Deleted stream trigger {uuid}")
+                result = {"status": "deleted"}
+            except lambda_client.exceptions.ResourceNotFoundException:
+                result = {"status": "not-found"}
+            except Exception as e:
+                print(f"❌ Failed to delete stream trigger {uuid}: {e}")
+                result = {"status": "error", "error": str(e)}
+            result["seconds"] = round(time.perf_counter() - started, 2)
+            results[f"trigger:{uuid}"] = result
+
+    if not results:
+        print("ℹ️ No stream triggers to delete")
+    return results
+
+
+def delete_layer_versions(layer_name=RUNTIME_LAYER_NAME, region='us-west-1'):
+    """
+    Delete every published version of the shared runtime layer.
+    create_all_lambdas publishes a new one whenever the layer's content
+    changes, so without this they pile up across build/teardown cycles.
+
+    Returns:
+        dict: {"layer:<name>:<version>": {"status": ..., "seconds": ..., "error"?}}
+    """
+    lambda_client = boto3.client('lambda', region_name=region)
+
+    versions = []
+    for page in lambda_client.get_paginator('list_layer_versions').paginate(LayerName=layer_name):
+        versions.extend(v["Version"] for v in page.get("LayerVersions", []))
+
+    results = {}
+    for version in versions:
+        started = time.perf_counter()
         try:
-            function_name = arn.split(':')[-1]
-            print(f"Deleting Lambda: {function_name}...")
-            lambda_client.delete_function(FunctionName=function_name)
-            print(f"✅ Deleted {function_name}")
+            lambda_client.delete_layer_version(LayerName=layer_name, VersionNumber=version)
+            print(f"✅ Deleted layer {layer_name}:{version}")
+            result = {"status": "deleted"}
         except Exception as e:
-            print(f"❌ Failed to delete {name}: {e}")
+            print(f"❌ Failed to delete layer {layer_name}:{version}: {e}")
+            result = {"status": "error", "error": str(e)}
+        result["seconds"] = round(time.perf_counter() - started, 2)
+        results[f"layer:{layer_name}:{version}"] = result
+
+    if not versions:
+        print(f"ℹ️ No versions of layer {layer_name} to delete")
+    return results
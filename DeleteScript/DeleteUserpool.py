@@ -1,8 +1,29 @@
 import boto3
 import time
 
+def _wait_for_domain_removal(cognito, domain_prefix, timeout=120, interval=1):
+    """Poll until the Hosted UI domain no longer resolves to a pool"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        description = cognito.describe_user_pool_domain(Domain=domain_prefix).get("DomainDescription", {})
+        if not description.get("UserPoolId"):
+            return True
+        time.sleep(interval)
+    return False
+
+
 def delete_user_pool(pool_name="TaskBinUserPool", region="us-west-1"):
+    """
+    Delete the user pool (domain and app clients first).
+
+    Returns:
+        dict: {pool_name: {"status": ..., "seconds": ..., "error"?}}
+    """
     cognito = boto3.client("cognito-idp", region_name=region)
+    started = time.perf_counter()
+
+    def _result(status, **extra):
+        return {pool_name: {"status": status, "seconds": round(time.perf_counter() - started, 2), **extra}}
 
     # -----------------------------------------------------
     # 1. Lookup the user pool ID
@@ -14,7 +35,7 @@ def delete_user_pool(pool_name="TaskBinUserPool", region="us-west-1"):
 
     if not matches:
         print("✔ User pool not found — nothing to delete.")
-        return
+        return _result("not-found")
 
     user_pool_id = matches[0]["Id"]
     print(f"✔ Found User Pool ID: {user_pool_id}")
@@ -43,8 +64,11 @@ def delete_user_pool(pool_name="TaskBinUserPool", region="us-west-1"):
         except Exception as e:
             print(f"⚠️ Failed to delete domain (may already be deleted): {e}")
 
-        # AWS needs propagation time
-        time.sleep(3)
+        # Pool deletion is rejected until the domain is fully detached
+        if _wait_for_domain_removal(cognito, domain_prefix):
+            print("✔ Hosted UI domain detached")
+        else:
+            print("⚠️ Hosted UI domain still attached, trying pool deletion anyway")
 
     # -----------------------------------------------------
     # 4. Delete all app clients
@@ -66,21 +90,22 @@ def delete_user_pool(pool_name="TaskBinUserPool", region="us-west-1"):
         try:
             cognito.delete_user_pool(UserPoolId=user_pool_id)
             print("✔ User pool deleted successfully")
-            return
+            return _result("deleted")
         except cognito.exceptions.InvalidParameterException as e:
             msg = str(e)
             if "Custom domain" in msg or "domain" in msg:
-                print("⏳ Domain still pending removal. Retrying in 2s...")
-                time.sleep(2)
+                print("⏳ Domain still pending removal, polling...")
+                _wait_for_domain_removal(cognito, domain_prefix)
                 continue
             else:
                 print("❌ Unexpected InvalidParameterException:", e)
-                return
+                return _result("error", error=str(e))
         except Exception as e:
             print("⚠️ Unexpected error:", e)
-            return
+            return _result("exception", error=str(e))
 
     print("❌ Failed to delete user pool after retries.")
+    return _result("error", error="domain still attached after retries")
 
 
 if __name__ == "__main__":
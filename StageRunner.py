@@ -0,0 +1,90 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+
+
+class Stage:
+    """
+    One step of a build/teardown.
+
+    func receives the results dict (stage name -> return value) so it can use
+    the output of the stages listed in deps.
+    """
+    def __init__(self, name, func, deps=()):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+
+
+def _run_stage(stage, results):
+    started = time.perf_counter()
+    value = stage.func(results)
+    return value, time.perf_counter() - started
+
+
+def print_report(report, title="STAGE TIMINGS"):
+    print(f"\n================= {title} =================")
+    for name, entry in report.items():
+        seconds = f"{entry['seconds']:.1f}s" if entry["seconds"] is not None else "-"
+        line = f"{name:<28}{entry['status']:<10}{seconds:>10}"
+        if entry.get("error"):
+            line += f"  {entry['error']}"
+        print(line)
+    print("=" * (len(title) + 36) + "\n")
+
+
+def run_stages(stages, max_workers=4, title="STAGE TIMINGS"):
+    """
+    Run stages as soon as their deps have finished, independent ones in
+    parallel. A failed stage skips everything that depends on it.
+
+    Returns (results, report) where report is
+    {name: {"status": "ok"|"failed"|"skipped", "seconds": float|None, "error"?}}.
+    """
+    by_name = {s.name: s for s in stages}
+    for stage in stages:
+        unknown = [d for d in stage.deps if d not in by_name]
+        if unknown:
+            raise ValueError(f"Stage '{stage.name}' depends on unknown stage(s): {', '.join(unknown)}")
+
+    results, report = {}, {}
+    pending = list(stages)
+    running = {}
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while pending or running:
+            # Skip stages whose dependencies failed or were skipped
+            for stage in list(pending):
+                broken = [d for d in stage.deps if report.get(d, {}).get("status") in ("failed", "skipped")]
+                if broken:
+                    report[stage.name] = {"status": "skipped", "seconds": None, "error": f"needs {', '.join(broken)}"}
+                    pending.remove(stage)
+
+            # Start every stage whose dependencies are done
+            for stage in list(pending):
+                if all(report.get(d, {}).get("status") == "ok" for d in stage.deps):
+                    print(f"▶️ Starting stage: {stage.name}")
+                    running[pool.submit(_run_stage, stage, dict(results))] = stage
+                    pending.remove(stage)
+
+            if not running:
+                if pending:
+                    raise ValueError(f"Dependency cycle between: {', '.join(s.name for s in pending)}")
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                try:
+                    value, seconds = future.result()
+                    results[stage.name] = value
+                    report[stage.name] = {"status": "ok", "seconds": seconds}
+                    print(f"✅ Stage '{stage.name}' finished in {seconds:.1f}s")
+                except Exception as e:
+                    report[stage.name] = {"status": "failed", "seconds": None, "error": str(e)}
+                    print(f"❌ Stage '{stage.name}' failed: {e}")
+
+    report["TOTAL"] = {"status": "ok" if all(r["status"] == "ok" for r in report.values()) else "failed",
+                       "seconds": time.perf_counter() - started}
+    print_report(report, title)
+    return results, report
@@ -6,6 +6,21 @@ const mockDB = {
   tasks: {},
 };
 
+// ------------------------------------------------------
+// GET responses by URL, replayed when the API answers 304
+// ------------------------------------------------------
+const etagCache = new Map();
+const ETAG_CACHE_LIMIT = 200;
+
+function rememberEtag(url, etag, data) {
+  etagCache.delete(url);
+  etagCache.set(url, { etag, data });
+  if (etagCache.size > ETAG_CACHE_LIMIT) {
+    // Maps iterate in insertion order: drop the least recently stored
+    etagCache.delete(etagCache.keys().next().value);
+  }
+}
+
 function delay(ms) {
   return new Promise((res) => setTimeout(res, ms));
 }
@@ -24,17 +39,51 @@ export function useApi(currentUser) {
   };
 
   async function awsRequest(path, options = {}) {
-    const res = await fetch(BASE_URL + path, {
-      headers: { "Content-Type": "application/json" },
+    const url = BASE_URL + path;
+    const isGet = !options.method || options.method === "GET";
+    const cached = isGet ? etagCache.get(url) : null;
+
+    const res = await fetch(url, {
       ...options,
+      headers: {
+        "Content-Type": "application/json",
+        ...(cached ? { "If-None-Match": cached.etag } : {}),
+        ...options.headers,
+      },
     });
 
+    // Unchanged since our copy: no body was sent
+    if (res.status === 304 && cached) {
+      return cached.data;
+    }
+
     if (!res.ok) {
       console.error("AWS ERROR", res.status, path);
       throw new Error(`AWS Error: ${res.status}`);
     }
 
-    return res.json();
+    const data = await res.json();
+    const etag = isGet && res.headers.get("ETag");
+    if (etag) rememberEtag(url, etag, data);
+    return data;
+  }
+
+  // Follow next_token cursors until the list endpoint is exhausted;
+  // onPage sees every raw page (for fields besides the list itself)
+  async function awsPaged(path, key, onPage) {
+    const items = [];
+    let nextToken = null;
+    do {
+      const sep = path.includes("?") ? "&" : "?";
+      const url = nextToken
+        ? `${path}${sep}next_token=${encodeURIComponent(nextToken)}`
+        : path;
+      const r = await awsRequest(url);
+      items.push(...(r[key] || []));
+      if (onPage) onPage(r);
+      nextToken = r.next_token;
+    } while (nextToken);
+    return items;
   }
 
   return {
@@ -44,8 +93,7 @@ export function useApi(currentUser) {
         return [...mockDB.boards];
       }
       if (!currentUser) return [];
-      const r = await awsRequest(`/users/${currentUser}/boards`);
-      return r.boards || [];
+      return awsPaged(`/users/${currentUser}/boards`, "boards");
     },
 
     async createBoard({ name, description }) {
@@ -86,8 +134,37 @@ export function useApi(currentUser) {
         await delay(150);
         return mockDB.tasks[boardId] || [];
       }
-      const r = await awsRequest(`/boards/${boardId}/tasks`);
-      return r.tasks || [];
+      return awsPaged(`/boards/${boardId}/tasks`, "tasks");
+    },
+
+    // Full task list plus the board version it reflects
+    async listTaskSnapshot(boardId) {
+      if (USE_MOCK && !FORCE_AWS.listTasks) {
+        await delay(150);
+        return { tasks: mockDB.tasks[boardId] || [], version: 0 };
+      }
+      let version = null;
+      const tasks = await awsPaged(`/boards/${boardId}/tasks`, "tasks", (r) => {
+        // First page's version, so no change between pages is skipped later
+        if (version === null) version = r.version ?? 0;
+      });
+      return { tasks, version };
+    },
+
+    // Tasks changed, and ids of tasks deleted, since a board version.
+    // Each page carries the cursor it can safely advance to; keep the highest.
+    async listTaskChanges(boardId, since) {
+      if (USE_MOCK && !FORCE_AWS.listTasks) {
+        await delay(150);
+        return { tasks: mockDB.tasks[boardId] || [], deleted: [], version: since };
+      }
+      let version = since;
+      const deleted = [];
+      const tasks = await awsPaged(`/boards/${boardId}/tasks?since=${since}`, "tasks", (r) => {
+        version = Math.max(version, r.version ?? since);
+        deleted.push(...(r.deleted || []));
+      });
+      return { tasks, deleted, version };
     },
 
     async createTask(boardId, data) {
@@ -1,5 +1,5 @@
 import { Link, useParams, useNavigate } from "react-router-dom";   // 🔥 CHANGED
-import { useEffect, useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { useApi } from "../hooks/useApi";
 import { useAuth } from "../hooks/useAuth";
 import TaskCard from "../components/TaskCard";
@@ -32,6 +32,43 @@ export default function Board() {
   const [editingTask, setEditingTask] = useState(null);
   const [socket, setSocket] = useState(null);
 
+  // Board version the task list reflects (null → next sync is a full load)
+  const versionRef = useRef(null);
+
+  // Syncs can overlap (socket, tab focus, after a mutation): the cursor
+  // only ever moves forward so a slow older sync can't rewind it
+  function advanceVersion(version) {
+    versionRef.current = Math.max(versionRef.current ?? version, version);
+  }
+
+  // Full load the first time, afterwards only what changed since then
+  async function syncTasks() {
+    if (versionRef.current === null) {
+      const {tasks: ts, version} = await api.listTaskSnapshot(id);
+      advanceVersion(version);
+      setTasks(ts.map((t) => ({...t, id: t.task_id})));
+      return;
+    }
+
+    const {tasks: changed, deleted, version} = await api.listTaskChanges(id, versionRef.current);
+    advanceVersion(version);
+    if (!changed.length && !deleted.length) return;
+
+    setTasks((prev) => {
+      const gone = new Set(deleted);
+      const updates = new Map(changed.map((t) => [t.task_id, {...t, id: t.task_id}]));
+      const next = prev
+          .filter((t) => !gone.has(t.id || t.task_id))
+          .map((t) => {
+            const key = t.id || t.task_id;
+            const updated = updates.get(key);
+            updates.delete(key);
+            return updated || t;
+          });
+      return [...next, ...updates.values()];
+    });
+  }
+
   function broadcast(action, payload = {}) {
     if (!socket || socket.readyState !== WebSocket.OPEN) return;
     socket.send(JSON.stringify({action, ...payload}));
@@ -60,8 +97,8 @@ export default function Board() {
         setMembers(meta?.members || []);
         setOwner(meta?.owner_id || null);
 
-        const ts = await api.listTasks(id);
-        setTasks(ts.map((t) => ({...t, id: t.task_id})));
+        versionRef.current = null;
+        await syncTasks();
       } catch (err) {
         console.error("Failed loading board or tasks:", err);
       }
@@ -70,6 +107,22 @@ export default function Board() {
     init();
   }, [id, user?.email]);
 
+  // -----------------------------------
+  // Catch up when a backgrounded tab (e.g. mobile) comes back
+  // -----------------------------------
+  useEffect(() => {
+    if (!user?.email || !id) return;
+
+    function onVisible() {
+      if (document.visibilityState === "visible" && versionRef.current !== null) {
+        syncTasks().catch((err) => console.error("Task sync failed:", err));
+      }
+    }
+
+    document.addEventListener("visibilitychange", onVisible);
+    return () => document.removeEventListener("visibilitychange", onVisible);
+  }, [user?.email, id]);
+
   // -----------------------------------
   // WebSocket setup + send memberJoined
   // -----------------------------------
@@ -92,9 +145,30 @@ export default function Board() {
       if (!api) return;
 
       if (data.action === "taskUpdated") {
-        api.listTasks(id).then((ts) =>
-            setTasks(ts.map((t) => ({...t, id: t.task_id})))
-        );
+        syncTasks();
+      }
+
+      // Pushed by the table stream for every task create/edit/delete
+      if (data.action === "tasksChanged") {
+        const {changes = [], refresh} = data.payload || {};
+        if (refresh) {
+          syncTasks();
+          return;
+        }
+        setTasks((prev) => {
+          let next = [...prev];
+          for (const change of changes) {
+            const index = next.findIndex((t) => (t.id || t.task_id) === change.task_id);
+            if (change.event === "REMOVE" || !change.task) {
+              if (index !== -1) next.splice(index, 1);
+            } else if (index !== -1) {
+              next[index] = {...change.task, id: change.task_id};
+            } else {
+              next.push({...change.task, id: change.task_id});
+            }
+          }
+          return next;
+        });
       }
       if (data.action === "boardDeleted") {
         // Show popup instead of alert
@@ -152,14 +226,8 @@ export default function Board() {
     setNewTaskAssignee("");
     setNewTaskDue("");
 
-    const refreshed = await api.listTasks(id);
-    setTasks(refreshed.map((t) => ({...t, id: t.task_id})));
+    await syncTasks();
 
-    broadcast("taskUpdated", {
-      board_id: id,
-      user_id: user.email,
-      message: "created",
-    });
     toast.success("Task created!");
   }
 
@@ -167,27 +235,16 @@ export default function Board() {
     await api.deleteTask(id, taskId);
     setTasks((prev) => prev.filter((t) => (t.id || t.task_id) !== taskId));
 
-    broadcast("taskUpdated", {
-      board_id: id,
-      user_id: user.email,
-      message: "deleted",
-    });
     toast.success("Task deleted!");
   }
 
   async function handleEditTask(taskId, updates) {
     await api.editTask(taskId, updates);
 
-    const refreshed = await api.listTasks(id);
-    setTasks(refreshed.map((t) => ({...t, id: t.task_id})));
+    await syncTasks();
 
     setEditingTask(null);
 
-    broadcast("taskUpdated", {
-      board_id: id,
-      user_id: user.email,
-      message: "updated",
-    });
     toast.success("Task updated!");
   }
 